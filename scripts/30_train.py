@@ -30,10 +30,10 @@ from sklearn.model_selection import (
 )
 from tqdm import tqdm
 
-from recur_scan.features import get_features
+from recur_scan.features import get_all_features
 
 # from recur_scan.features_original import get_new_features
-from recur_scan.features_osasere import get_new_features
+from recur_scan.features_osasere import build_vendor_index, get_new_features
 from recur_scan.transactions import (
     group_transactions,
     read_labeled_transactions,
@@ -117,22 +117,33 @@ if use_precomputed_features:
 else:
     # feature generation is parallelized using joblib
     # Use backend that works better with shared memory
+    # one task per group, so each group's shared indexes are built once for all of its transactions
+    groups = list(grouped_transactions.values())
     with joblib.parallel_backend("loky", n_jobs=n_jobs):
-        features = joblib.Parallel(verbose=1)(
-            joblib.delayed(get_features)(
-                transaction,
-                grouped_transactions[(transaction.user_id, transaction.name)],
-            )
-            for transaction in tqdm(transactions, desc="Processing transactions")
+        group_features = joblib.Parallel(verbose=1)(
+            joblib.delayed(get_all_features)(list(group)) for group in tqdm(groups, desc="Processing groups")
         )
+    # put the features back in transaction order
+    features_by_transaction = {
+        transaction: transaction_features
+        for group, features_list in zip(groups, group_features, strict=True)
+        for transaction, transaction_features in zip(group, features_list, strict=True)
+    }
+    features = [features_by_transaction[transaction] for transaction in transactions]
     # save the features to a csv file
     pd.DataFrame(features).to_csv(precomputed_features_path, index=False)
     logger.info(f"Generated {len(features)} features")
 
 # %%
 # add new features
+# index each group's vendors once rather than once per transaction
+vendor_indexes = {key: build_vendor_index(group) for key, group in grouped_transactions.items()}
 new_features = [
-    get_new_features(transaction, grouped_transactions[(transaction.user_id, transaction.name)])
+    get_new_features(
+        transaction,
+        grouped_transactions[(transaction.user_id, transaction.name)],
+        vendor_indexes[(transaction.user_id, transaction.name)],
+    )
     for transaction in tqdm(transactions, desc="Processing transactions")
 ]
 # add the new features to the existing features
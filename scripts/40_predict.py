@@ -12,7 +12,7 @@ import joblib
 from loguru import logger
 from tqdm import tqdm
 
-from recur_scan.features import get_features
+from recur_scan.features import get_all_features
 from recur_scan.transactions import group_transactions, read_test_transactions, write_transactions
 
 # %%
@@ -73,11 +73,19 @@ for csv_file in csv_files:
 
     # Generate features
     logger.info("Generating features")
+    # one task per group, so each group's shared indexes are built once for all of its transactions
+    groups = list(grouped_transactions.values())
     with joblib.parallel_backend("loky", n_jobs=n_jobs):
-        features = joblib.Parallel(verbose=1)(
-            joblib.delayed(get_features)(transaction, grouped_transactions[(transaction.user_id, transaction.name)])
-            for transaction in tqdm(transactions, desc=f"Processing {file_name}")
+        group_features = joblib.Parallel(verbose=1)(
+            joblib.delayed(get_all_features)(list(group)) for group in tqdm(groups, desc=f"Processing {file_name}")
         )
+    # put the features back in transaction order
+    features_by_transaction = {
+        transaction: transaction_features
+        for group, features_list in zip(groups, group_features, strict=True)
+        for transaction, transaction_features in zip(group, features_list, strict=True)
+    }
+    features = [features_by_transaction[transaction] for transaction in transactions]
     logger.info(f"Generated {len(features)} features")
 
     # Convert features to a matrix for prediction using the loaded vectorizer
@@ -1,12 +1,17 @@
-from collections import defaultdict
+from collections import Counter
+from dataclasses import dataclass
+
+from numpy import ndarray
 
 from recur_scan.features_adedotun import (
+    PreprocessedTransactions,
     compute_recurring_inputs_at,
     get_is_always_recurring_at,
     get_is_communication_or_energy_at,
     get_percent_transactions_same_amount_tolerant,
     is_recurring_allowance_at,
     is_recurring_core_at,
+    preprocess_transactions_at,
 )
 from recur_scan.features_adeyinka import (
     get_average_days_between_transactions,
@@ -268,18 +273,19 @@ from recur_scan.features_freedom import (
 )
 from recur_scan.features_gideon import is_microsoft_xbox_same_or_near_day
 from recur_scan.features_happy import (
-    get_day_of_month_consistency as get_day_of_month_consistency_happy,
-)
-from recur_scan.features_happy import (
+    build_name_counts,
     get_n_transactions_same_description,
     get_percent_transactions_same_description,
 )
+from recur_scan.features_happy import (
+    get_day_of_month_consistency as get_day_of_month_consistency_happy,
+)
 from recur_scan.features_happy import (
     get_transaction_frequency as get_transaction_frequency_happy,
 )
 from recur_scan.features_laurels import (
     _aggregate_transactions,
-    _calculate_intervals,
+    _calculate_intervals_float,
     _calculate_statistics,
     date_irregularity_dominance,
     day_consistency_score_feature,
@@ -356,15 +362,16 @@ from recur_scan.features_original import (
     get_transaction_z_score,
 )
 from recur_scan.features_osasere import (
-    get_day_of_month_consistency as get_day_of_month_consistency_osasere,
-)
-from recur_scan.features_osasere import (
+    build_vendor_index,
     get_day_of_month_variability,
     get_median_period,
     get_recurrence_confidence,
     has_min_recurrence_period,
     is_weekday_consistent,
 )
+from recur_scan.features_osasere import (
+    get_day_of_month_consistency as get_day_of_month_consistency_osasere,
+)
 from recur_scan.features_praise import (
     amount_ends_in_00,
     amount_ends_in_99,
@@ -434,6 +441,7 @@ from recur_scan.features_raphael import (
     get_pct_transactions_same_day as get_pct_transactions_same_day_raphael,
 )
 from recur_scan.features_samuel import (
+    build_name_amounts,
     get_amount_std_dev,
     get_is_weekend_transaction,
     get_median_transaction_amount,
@@ -445,9 +453,9 @@ from recur_scan.features_samuel import (
     get_transaction_frequency as get_transaction_frequency_samuel,
 )
 from recur_scan.features_segun import (
-    get_average_transaction_amount as get_average_transaction_amount_segun,
-)
-from recur_scan.features_segun import (
+    AmountSummary,
+    build_amount_counts,
+    build_amount_summary,
     get_average_transaction_interval,
     get_total_transaction_amount,
     get_transaction_amount_frequency,
@@ -457,6 +465,9 @@ from recur_scan.features_segun import (
     get_transaction_time_of_day,
     get_unique_transaction_amount_count,
 )
+from recur_scan.features_segun import (
+    get_average_transaction_amount as get_average_transaction_amount_segun,
+)
 from recur_scan.features_segun import (
     get_max_transaction_amount as get_max_transaction_amount_segun,
 )
@@ -467,6 +478,9 @@ from recur_scan.features_segun import (
     get_transaction_amount_range as get_transaction_amount_range_segun,
 )
 from recur_scan.features_tife import (
+    build_amount_dates,
+    build_merchant_amounts,
+    build_sorted_amounts,
     get_amount_cluster_count,
     get_amount_range,
     get_amount_relative_change,
@@ -491,12 +505,8 @@ from recur_scan.features_tife import (
 )
 from recur_scan.features_victor import get_avg_days_between
 from recur_scan.features_yoloye import (
-    get_delayed_annual,
-    get_delayed_fortnightly,
-    get_delayed_monthly,
-    get_delayed_quarterly,
-    get_delayed_semi_annual,
-    get_delayed_weekly,
+    build_sorted_ordinals,
+    get_delayed_counts,
     get_early_annual,
     get_early_fortnightly,
     get_early_monthly,
@@ -508,7 +518,56 @@ from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
 
 
-def get_features(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, float | int | bool]:
+@dataclass(frozen=True)
+class GroupInputs:
+    """Indexes over one list of transactions that the features of every transaction in it share."""
+
+    groups: dict[str, dict[str, list[Transaction]]]
+    histogram: dict[str, float]
+    name_amounts: dict[str, ndarray]
+    merchant_amounts: dict[str, ndarray]
+    sorted_amounts: list[float]
+    sorted_ordinals: ndarray
+    amount_dates: dict[float, ndarray]
+    amount_summary: AmountSummary
+    amount_counts: Counter[float]
+    name_counts: Counter[str]
+    vendor_index: dict[str, list[Transaction]]
+    preprocessed: PreprocessedTransactions
+
+
+def build_group_inputs(all_transactions: list[Transaction]) -> GroupInputs:
+    """Build the shared indexes of a transaction list once, for get_features to reuse across its transactions."""
+    return GroupInputs(
+        groups=_aggregate_transactions(all_transactions),
+        histogram=get_interval_histogram(all_transactions),
+        name_amounts=build_name_amounts(all_transactions),
+        merchant_amounts=build_merchant_amounts(all_transactions),
+        sorted_amounts=build_sorted_amounts(all_transactions),
+        sorted_ordinals=build_sorted_ordinals(all_transactions),
+        amount_dates=build_amount_dates(all_transactions),
+        amount_summary=build_amount_summary(all_transactions),
+        amount_counts=build_amount_counts(all_transactions),
+        name_counts=build_name_counts(all_transactions),
+        vendor_index=build_vendor_index(all_transactions),
+        preprocessed=preprocess_transactions_at(all_transactions),
+    )
+
+
+def get_all_features(all_transactions: list[Transaction]) -> list[dict[str, float | int | bool]]:
+    """Get the features of every transaction in the list, building the shared indexes only once.
+
+    Returns the same dictionaries as calling get_features on each transaction, in list order.
+    """
+    snapshot = list(all_transactions)
+    inputs = build_group_inputs(snapshot)
+    # Some features sort all_transactions in place, so each call gets its own copy of the original order
+    return [get_features(transaction, list(snapshot), inputs) for transaction in snapshot]
+
+
+def get_features(
+    transaction: Transaction, all_transactions: list[Transaction], inputs: GroupInputs | None = None
+) -> dict[str, float | int | bool]:
     """Get the features for a transaction"""
     """Extract all features for a transaction by calling individual feature functions.
     This prepares a dictionary of features for model training.
@@ -516,15 +575,16 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
     Args:
         transaction (Transaction): The transaction to extract features for.
         all_transactions (List[Transaction]): List of all transactions for context.
+        inputs (GroupInputs, optional): The build_group_inputs of all_transactions, if already built.
+            Without it every shared index is built for this one transaction, so callers scoring a whole
+            list should use get_all_features, or build_group_inputs once and pass it to each call.
 
     Returns:
         Dict[str, Union[float, int]]: Dictionary mapping feature names to their computed values.
     """
-    # Compute groups and amount counts internally
-    groups = _aggregate_transactions(all_transactions)
-    amount_counts: defaultdict[float, int] = defaultdict(int)
-    for t in all_transactions:
-        amount_counts[t.amount] += 1
+    if inputs is None:
+        inputs = build_group_inputs(all_transactions)
+    groups = inputs.groups
 
     # Extract user ID and merchant name from the transaction
     user_id, merchant_name = transaction.user_id, transaction.name
@@ -541,18 +601,29 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
             parsed_dates.append(date)
 
     # Calculate intervals and amounts for statistical analysis
-    intervals = _calculate_intervals(parsed_dates)
     amounts = [trans.amount for trans in merchant_trans]
-    interval_stats = _calculate_statistics([float(i) for i in intervals])
+    interval_stats = _calculate_statistics(_calculate_intervals_float(parsed_dates))
     amount_stats = _calculate_statistics(amounts)
 
-    histogram = get_interval_histogram(all_transactions)
+    histogram = inputs.histogram
+    # Per-vendor amount arrays, per-amount dates, amount totals and amount counts shared by the Samuel, Tife
+    # and Segun features
+    name_amounts = inputs.name_amounts
+    merchant_amounts = inputs.merchant_amounts
+    amount_dates = inputs.amount_dates
+    amount_summary = inputs.amount_summary
+    amount_counts = inputs.amount_counts
+    # Vendor index shared by the Osasere features
+    vendor_index = inputs.vendor_index
 
-    vendor_txns, user_vendor_txns, preprocessed = compute_recurring_inputs_at(transaction, all_transactions)
+    vendor_txns, user_vendor_txns, preprocessed = compute_recurring_inputs_at(
+        transaction, all_transactions, inputs.preprocessed
+    )
     date_obj = preprocessed["date_objects"][transaction]
     total_txns = len(vendor_txns)
 
     sequence_features = detect_sequence_patterns(transaction, all_transactions)
+    delayed_counts = get_delayed_counts(transaction, all_transactions, inputs.sorted_ordinals)
 
     return {
         "n_transactions_same_amount": get_n_transactions_same_amount(transaction, all_transactions),
@@ -750,9 +821,9 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
         "is_recurring_asimi": is_valid_recurring_transaction(transaction),
         **get_user_specific_features(transaction, all_transactions),
         # Samuel's features
-        "transaction_frequency_samuel": get_transaction_frequency_samuel(transaction, all_transactions),
-        "amount_std_dev": get_amount_std_dev(transaction, all_transactions),
-        "median_transaction_amount": get_median_transaction_amount(transaction, all_transactions),
+        "transaction_frequency_samuel": get_transaction_frequency_samuel(transaction, all_transactions, name_amounts),
+        "amount_std_dev": get_amount_std_dev(transaction, all_transactions, name_amounts),
+        "median_transaction_amount": get_median_transaction_amount(transaction, all_transactions, name_amounts),
         "is_weekend_transaction": get_is_weekend_transaction(transaction),
         "is_always_recurring_samuel": get_is_always_recurring_samuel(transaction),
         # Precious's features
@@ -778,19 +849,27 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
         **get_additional_features(transaction, all_transactions),
         **get_amount_variation_features(transaction, all_transactions),
         # Happy's features
-        "get_n_transactions_same_description": get_n_transactions_same_description(transaction, all_transactions),
+        "get_n_transactions_same_description": get_n_transactions_same_description(
+            transaction, all_transactions, inputs.name_counts
+        ),
         "get_percent_transactions_same_description": get_percent_transactions_same_description(
-            transaction, all_transactions
+            transaction, all_transactions, inputs.name_counts
         ),
         "get_transaction_same_frequency": get_transaction_frequency_happy(transaction, all_transactions),
         "get_day_of_month_consistency": get_day_of_month_consistency_happy(transaction, all_transactions),
         # Osasere's features
-        "has_min_recurrence_period_osasere": has_min_recurrence_period(transaction, all_transactions),
-        "day_of_month_consistency_osasere": get_day_of_month_consistency_osasere(transaction, all_transactions),
-        "day_of_month_variability": get_day_of_month_variability(transaction, all_transactions),
-        "recurrence_confidence": get_recurrence_confidence(transaction, all_transactions),
-        "median_period_days": get_median_period(transaction, all_transactions),
-        "is_weekday_consistent": is_weekday_consistent(transaction, all_transactions),
+        "has_min_recurrence_period_osasere": has_min_recurrence_period(
+            transaction, all_transactions, vendor_index=vendor_index
+        ),
+        "day_of_month_consistency_osasere": get_day_of_month_consistency_osasere(
+            transaction, all_transactions, vendor_index=vendor_index
+        ),
+        "day_of_month_variability": get_day_of_month_variability(
+            transaction, all_transactions, vendor_index=vendor_index
+        ),
+        "recurrence_confidence": get_recurrence_confidence(transaction, all_transactions, vendor_index=vendor_index),
+        "median_period_days": get_median_period(transaction, all_transactions, vendor_index=vendor_index),
+        "is_weekday_consistent": is_weekday_consistent(transaction, all_transactions, vendor_index=vendor_index),
         # Felix's features
         "n_transactions_same_vendor": get_n_transactions_same_vendor(transaction, all_transactions),
         "max_transaction_amount_felix": get_max_transaction_amount_felix(all_transactions),
@@ -850,13 +929,17 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
         "transaction_count": get_transaction_count(all_transactions),
         "interval_mode": get_interval_mode(all_transactions),
         "normalized_interval_consistency": get_normalized_interval_consistency(all_transactions),
-        "days_since_last_same_amount": get_days_since_last_same_amount(transaction, all_transactions),
+        "days_since_last_same_amount": get_days_since_last_same_amount(transaction, all_transactions, amount_dates),
         "amount_relative_change": get_amount_relative_change(transaction, all_transactions),
-        "merchant_name_frequency": get_merchant_name_frequency(transaction, all_transactions),
+        "merchant_name_frequency": get_merchant_name_frequency(transaction, all_transactions, merchant_amounts),
         "amount_stability_score_tife": get_amount_stability_score_tife(all_transactions),
         "dominant_interval_strength": get_dominant_interval_strength(all_transactions),
-        "near_amount_consistency": get_near_amount_consistency(transaction, all_transactions),
-        "merchant_amount_signature": get_merchant_amount_signature(transaction, all_transactions),
+        "near_amount_consistency": get_near_amount_consistency(
+            transaction, all_transactions, sorted_amounts=inputs.sorted_amounts
+        ),
+        "merchant_amount_signature": get_merchant_amount_signature(
+            transaction, all_transactions, merchant_amounts=merchant_amounts
+        ),
         "amount_cluster_count": get_amount_cluster_count(transaction, all_transactions),
         "transaction_density": get_transaction_density(all_transactions),
         "biweekly_interval": histogram["biweekly"],
@@ -939,15 +1022,15 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
         else 0.0,
         "is_recurring_allowance_at": is_recurring_allowance_at(transaction, all_transactions, 30, 2, 2),
         # Segun's features
-        "total_transaction_amount_segun": get_total_transaction_amount(all_transactions),
-        "average_transaction_amount_segun": get_average_transaction_amount_segun(all_transactions),
-        "max_transaction_amount_segun": get_max_transaction_amount_segun(all_transactions),
-        "min_transaction_amount_segun": get_min_transaction_amount_segun(all_transactions),
-        "transaction_amount_std_segun": get_transaction_amount_std(all_transactions),
+        "total_transaction_amount_segun": get_total_transaction_amount(all_transactions, amount_summary),
+        "average_transaction_amount_segun": get_average_transaction_amount_segun(all_transactions, amount_summary),
+        "max_transaction_amount_segun": get_max_transaction_amount_segun(all_transactions, amount_summary),
+        "min_transaction_amount_segun": get_min_transaction_amount_segun(all_transactions, amount_summary),
+        "transaction_amount_std_segun": get_transaction_amount_std(all_transactions, amount_summary),
         "transaction_amount_median_segun": get_transaction_amount_median(all_transactions),
-        "transaction_amount_range_segun": get_transaction_amount_range_segun(all_transactions),
-        "unique_transaction_amount_count": get_unique_transaction_amount_count(all_transactions),
-        "transaction_amount_frequency": get_transaction_amount_frequency(transaction, all_transactions),
+        "transaction_amount_range_segun": get_transaction_amount_range_segun(all_transactions, amount_summary),
+        "unique_transaction_amount_count": get_unique_transaction_amount_count(all_transactions, amount_counts),
+        "transaction_amount_frequency": get_transaction_amount_frequency(transaction, all_transactions, amount_counts),
         "transaction_day_of_week_segun": get_transaction_day_of_week(transaction),
         "transaction_time_of_day": get_transaction_time_of_day(transaction),
         "average_transaction_interval": get_average_transaction_interval(all_transactions),
@@ -972,13 +1055,13 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
         "time_regularity_score": get_time_regularity_score_naomi(transaction, all_transactions),
         "outlier_score": get_outlier_score_naomi(transaction, all_transactions),
         # Yoloye's features
-        "delayed_weekly": get_delayed_weekly(transaction, all_transactions),
-        "delayed_fortnightly": get_delayed_fortnightly(transaction, all_transactions),
-        "delayed_monthly": get_delayed_monthly(transaction, all_transactions),
-        "delayed_quarterly": get_delayed_quarterly(transaction, all_transactions),
-        "delayed_semi_annual": get_delayed_semi_annual(transaction, all_transactions),
-        "delayed_annual": get_delayed_annual(transaction, all_transactions),
-        "early_weekly": get_early_weekly(transaction, all_transactions),
+        "delayed_weekly": delayed_counts["weekly"],
+        "delayed_fortnightly": delayed_counts["fortnightly"],
+        "delayed_monthly": delayed_counts["monthly"],
+        "delayed_quarterly": delayed_counts["quarterly"],
+        "delayed_semi_annual": delayed_counts["semi_annual"],
+        "delayed_annual": delayed_counts["annual"],
+        "early_weekly": get_early_weekly(transaction, all_transactions, inputs.sorted_ordinals),
         "early_fortnightly": get_early_fortnightly(transaction, all_transactions),
         "early_monthly": get_early_monthly(transaction, all_transactions),
         "early_quarterly": get_early_quarterly(transaction, all_transactions),
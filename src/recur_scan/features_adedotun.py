@@ -1,5 +1,7 @@
 import re
 from collections import defaultdict
+from datetime import date
+from typing import TypedDict
 
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
@@ -102,11 +104,19 @@ def get_is_communication_or_energy_at(transaction: Transaction) -> bool:
     return get_is_phone_at(transaction) or get_is_utility_at(transaction)
 
 
-def preprocess_transactions_at(transactions: list[Transaction]) -> dict:
+class PreprocessedTransactions(TypedDict):
+    """Transactions indexed by normalized vendor name, as built by preprocess_transactions_at."""
+
+    by_vendor: dict[str, list[Transaction]]
+    by_user_vendor: dict[tuple[str, str], list[Transaction]]
+    date_objects: dict[Transaction, date]
+
+
+def preprocess_transactions_at(transactions: list[Transaction]) -> PreprocessedTransactions:
     """Standalone version of preprocess_transactions with _at suffix"""
-    by_vendor = defaultdict(list)
-    by_user_vendor = defaultdict(list)
-    date_objects = {}
+    by_vendor: defaultdict[str, list[Transaction]] = defaultdict(list)
+    by_user_vendor: defaultdict[tuple[str, str], list[Transaction]] = defaultdict(list)
+    date_objects: dict[Transaction, date] = {}
 
     for t in transactions:
         normalized_name = normalize_vendor_name_at(t.name)
@@ -120,7 +130,7 @@ def preprocess_transactions_at(transactions: list[Transaction]) -> dict:
 def is_recurring_core_at(
     transaction: Transaction,
     relevant_txns: list[Transaction],
-    preprocessed: dict,
+    preprocessed: PreprocessedTransactions,
     interval: int = 30,
     variance: int = 4,
     min_occurrences: int = 2,
@@ -191,10 +201,16 @@ def is_recurring_allowance_at(
 
 
 def compute_recurring_inputs_at(
-    transaction: Transaction, all_transactions: list[Transaction]
-) -> tuple[list[Transaction], list[Transaction], dict]:
-    """Standalone version of compute_recurring_inputs with _at suffix"""
-    preprocessed = preprocess_transactions_at(all_transactions)
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    preprocessed: PreprocessedTransactions | None = None,
+) -> tuple[list[Transaction], list[Transaction], PreprocessedTransactions]:
+    """Standalone version of compute_recurring_inputs with _at suffix
+
+    preprocessed can be the precomputed preprocess_transactions_at of all_transactions.
+    """
+    if preprocessed is None:
+        preprocessed = preprocess_transactions_at(all_transactions)
     normalized_name = normalize_vendor_name_at(transaction.name)
     vendor_txns = preprocessed["by_vendor"].get(normalized_name, [])
     user_vendor_txns = preprocessed["by_user_vendor"].get((transaction.user_id, normalized_name), [])
@@ -90,21 +90,23 @@ def get_time_regularity_score(transaction: Transaction, all_transactions: list[T
         return 0.0
 
 
+_ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "amazon prime",
+    "disney+",
+    "apple music",
+    "xbox game pass",
+    "youtube premium",
+    "adobe creative cloud",
+})
+
+
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring because of the vendor name - check lowercase match"""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "amazon prime",
-        "disney+",
-        "apple music",
-        "xbox game pass",
-        "youtube premium",
-        "adobe creative cloud",
-    }
-    return transaction.name.lower() in always_recurring_vendors
+    return transaction.name.lower() in _ALWAYS_RECURRING_VENDORS
 
 
 # New helper functions for date handling
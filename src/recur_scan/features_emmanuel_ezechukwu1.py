@@ -6,38 +6,39 @@ import pandas as pd
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
 
+_ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "amazon prime",
+    "disney+",
+    "apple music",
+    "xbox live",
+    "playstation plus",
+    "adobe",
+    "microsoft 365",
+    "audible",
+    "dropbox",
+    "zoom",
+    "grammarly",
+    "nordvpn",
+    "expressvpn",
+    "patreon",
+    "onlyfans",
+    "youtube premium",
+    "apple tv",
+    "hbo max",
+    "paramount+",
+    "peacock",
+    "crunchyroll",
+    "masterclass",
+})
+
 
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring because of the vendor name."""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "amazon prime",
-        "disney+",
-        "apple music",
-        "xbox live",
-        "playstation plus",
-        "adobe",
-        "microsoft 365",
-        "audible",
-        "dropbox",
-        "zoom",
-        "grammarly",
-        "nordvpn",
-        "expressvpn",
-        "patreon",
-        "onlyfans",
-        "youtube premium",
-        "apple tv",
-        "hbo max",
-        "paramount+",
-        "peacock",
-        "crunchyroll",
-        "masterclass",
-    }
-    return transaction.name.lower() in always_recurring_vendors
+    return transaction.name.lower() in _ALWAYS_RECURRING_VENDORS
 
 
 def get_is_insurance(transaction: Transaction) -> bool:
@@ -1,51 +1,177 @@
 import re
+from bisect import insort
 from collections import Counter, defaultdict
 from collections.abc import Sequence
-from datetime import timedelta
-from statistics import StatisticsError, mean, median, stdev
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from math import sqrt
+from statistics import mean, median
 
 import numpy as np
 
-from recur_scan.transactions import Transaction
-from recur_scan.utils import parse_date
+from recur_scan.transactions import GroupedTransactions, Transaction
 
+# Ordinal of 1970-01-01, used to turn date ordinals into numpy datetime64[D] values
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-def transactions_per_month(all_transactions: list[Transaction]) -> float:
-    """Calculates the average transactions per month with consistency check."""
-    if not all_transactions:
+
+def get_vendor_arrays(transactions: list[Transaction]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extract (amounts, date ordinals) for a vendor's transactions, both sorted by date.
+
+    Build these once per vendor and pass them to the features that accept them to skip rescanning the list.
+    """
+    n = len(transactions)
+    amounts = np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n)
+    ordinals = np.fromiter((t.parsed_date.toordinal() for t in transactions), dtype=np.int64, count=n)
+    order = np.argsort(ordinals, kind="stable")
+    return amounts[order], ordinals[order]
+
+
+def _get_amounts(transactions: list[Transaction]) -> np.ndarray:
+    """Extract the amounts of transactions in list order, for features that do not need dates."""
+    return np.fromiter((t.amount for t in transactions), dtype=np.float64, count=len(transactions))
+
+
+def _safe_std(a: np.ndarray) -> float:
+    """Sample standard deviation of a, or 0.0 when it has fewer than two values."""
+    return float(a.std(ddof=1)) if a.size > 1 else 0.0
+
+
+def _transactions_per_month(ordinals: np.ndarray) -> float:
+    """Array version of transactions_per_month; ordinals must be sorted."""
+    if ordinals.size == 0:
         return 0.0
 
-    transaction_dates = sorted(parse_date(t.date) for t in all_transactions)
-    min_date, max_date = transaction_dates[0], transaction_dates[-1]
-    total_months = (max_date.year - min_date.year) * 12 + (max_date.month - min_date.month) + 1
+    days = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    total_months = int(months[-1].astype(np.int64) - months[0].astype(np.int64)) + 1
 
-    avg_per_month = len(all_transactions) / total_months if total_months > 0 else 0.0
+    avg_per_month = ordinals.size / total_months if total_months > 0 else 0.0
 
     # Consistency Check: If most transactions fall within ±2 days of the same date each month, boost the score
-    days_of_month = [date.day for date in transaction_dates]
-    most_common_day = max(set(days_of_month), key=days_of_month.count)
-    consistency = days_of_month.count(most_common_day) / len(days_of_month)
+    days_of_month = (days - months).astype(np.int64) + 1
+    consistency = np.bincount(days_of_month).max() / ordinals.size
 
-    return avg_per_month * consistency  # Prioritizes stable patterns
+    return float(avg_per_month * consistency)  # Prioritizes stable patterns
 
 
-def transactions_per_week(all_transactions: list[Transaction]) -> float:
-    """Calculates the average transactions per week with consistency check."""
-    if not all_transactions:
+def _transactions_per_week(ordinals: np.ndarray) -> float:
+    """Array version of transactions_per_week; ordinals must be sorted."""
+    if ordinals.size == 0:
         return 0.0
 
-    transaction_dates = sorted(parse_date(t.date) for t in all_transactions)
-    total_days = (transaction_dates[-1] - transaction_dates[0]).days
+    total_days = int(ordinals[-1] - ordinals[0])
     total_weeks = total_days / 7 if total_days > 0 else 1
 
-    avg_per_week = len(all_transactions) / total_weeks if total_weeks > 0 else 0.0
+    avg_per_week = ordinals.size / total_weeks if total_weeks > 0 else 0.0
 
     # Consistency Check: If most transactions happen on the same weekday, boost the score
-    weekdays = [date.weekday() for date in transaction_dates]  # 0=Monday, 6=Sunday
-    most_common_weekday = max(set(weekdays), key=weekdays.count)
-    consistency = weekdays.count(most_common_weekday) / len(weekdays)
+    weekdays = (ordinals + 6) % 7  # 0=Monday, 6=Sunday
+    consistency = np.bincount(weekdays).max() / ordinals.size
+
+    return float(avg_per_week * consistency)  # Prioritizes transactions on a stable schedule
 
-    return avg_per_week * consistency  # Prioritizes transactions on a stable schedule
+
+def _transaction_frequency(ordinals: np.ndarray) -> float:
+    """Array version of transaction_frequency; ordinals must be sorted."""
+    if ordinals.size < 2:
+        return 0.0
+
+    total_days = int(ordinals[-1] - ordinals[0])
+    months = max(total_days / 30, 1)
+    return float(ordinals.size / months)
+
+
+def _vendor_recurrence_trend(ordinals: np.ndarray) -> float:
+    """Array version of vendor_recurrence_trend; ordinals must be sorted."""
+    if ordinals.size < 2:
+        return 0.0
+
+    months = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]")
+    _, counts = np.unique(months, return_counts=True)  # np.unique returns months in sorted order
+
+    if counts.size < 2:
+        return 0.0
+
+    x = np.arange(counts.size)
+    slope, _ = np.polyfit(x, counts, 1)
+
+    return max(float(slope), 0.0)  # Ensure non-negative slope
+
+
+def _group_features(amounts: np.ndarray, ordinals: np.ndarray) -> dict[str, float]:
+    """Vendor-level features of one group from its get_vendor_arrays."""
+    return {
+        "transactions_per_month": _transactions_per_month(ordinals),
+        "transactions_per_week": _transactions_per_week(ordinals),
+        "transaction_frequency": _transaction_frequency(ordinals),
+        "vendor_recurrence_trend": _vendor_recurrence_trend(ordinals),
+        "recurrence_interval_variance": _recurrence_interval_variance(ordinals),
+        "safe_interval_consistency": _safe_interval_consistency(ordinals),
+        "robust_interval_median": _robust_interval_median(ordinals),
+        "robust_interval_iqr": _robust_interval_iqr(ordinals),
+        "coefficient_of_variation_intervals": _coefficient_of_variation_intervals(ordinals),
+        "most_common_interval": _most_common_interval(ordinals),
+        "matches_common_cycle": _matches_common_cycle(ordinals),
+        "irregular_interval_score": _irregular_interval_score(ordinals),
+        "date_irregularity_score": _date_irregularity_score(ordinals),
+        "enhanced_amt_iqr": _enhanced_amt_iqr(amounts),
+        "amount_variability_ratio": _amount_variability_ratio(amounts),
+        "get_amount_consistency": _get_amount_consistency(amounts),
+        "inconsistent_amount_score": _inconsistent_amount_score(amounts),
+        "amount_variability_score": _amount_variability_score(amounts),
+        "amount_coefficient_of_variation": _amount_coefficient_of_variation(amounts),
+        "non_recurring_score": _non_recurring_score(amounts, ordinals),
+    }
+
+
+def compute_group_features(grouped_transactions: GroupedTransactions) -> dict[tuple[str, str], dict[str, float]]:
+    """
+    Compute the vendor-level features for every (user_id, name) group in one pass.
+
+    The amounts and date ordinals of each group are extracted once and shared by all the
+    array versions of the features, instead of every feature re-reading the transaction list.
+    """
+    return {
+        key: _group_features(*get_vendor_arrays(transactions)) for key, transactions in grouped_transactions.items()
+    }
+
+
+def compute_group_features_parallel(
+    grouped_transactions: GroupedTransactions, n_jobs: int = -1
+) -> dict[tuple[str, str], dict[str, float]]:
+    """
+    Parallel version of compute_group_features, spreading the groups over n_jobs joblib workers.
+
+    Only the per-group arrays are sent to the workers, which keeps the pickling cost low.
+    """
+    # joblib is only needed here, so importing this module does not pay for it
+    from joblib import Parallel, delayed
+
+    keys = list(grouped_transactions)
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_group_features)(*get_vendor_arrays(grouped_transactions[key])) for key in keys
+    )
+    return dict(zip(keys, results, strict=True))
+
+
+def transactions_per_month(all_transactions: list[Transaction]) -> float:
+    """Calculates the average transactions per month with consistency check."""
+    _, ordinals = get_vendor_arrays(all_transactions)
+    return _transactions_per_month(ordinals)
+
+
+def transactions_per_week(all_transactions: list[Transaction]) -> float:
+    """Calculates the average transactions per week with consistency check."""
+    _, ordinals = get_vendor_arrays(all_transactions)
+    return _transactions_per_week(ordinals)
+
+
+def _recurrence_interval_variance(ordinals: np.ndarray) -> float:
+    """Array version of recurrence_interval_variance; ordinals must be sorted."""
+    return _safe_std(np.diff(ordinals))
 
 
 # 1. Recurrence Interval Variance:
@@ -54,16 +180,8 @@ def recurrence_interval_variance(all_transactions: list[Transaction]) -> float:
     Returns the standard deviation (variance) of the days between consecutive transactions for the same vendor.
     A lower variance indicates a regular, recurring pattern.
     """
-    if len(all_transactions) < 2:
-        return 0.0
-
-    all_transactions = sorted(all_transactions, key=lambda t: parse_date(t.date))
-    intervals = [
-        (parse_date(all_transactions[i].date) - parse_date(all_transactions[i - 1].date)).days
-        for i in range(1, len(all_transactions))
-    ]
-
-    return stdev(intervals) if len(intervals) > 1 else 0.0
+    _, ordinals = get_vendor_arrays(all_transactions)
+    return _recurrence_interval_variance(ordinals)
 
 
 # 2. Normalized Days Difference:
@@ -75,54 +193,94 @@ def normalized_days_difference(transaction: Transaction, all_transactions: list[
     if len(all_transactions) < 2:
         return 0.0
 
-    all_transactions = sorted(all_transactions, key=lambda t: parse_date(t.date))
-    intervals = [
-        (parse_date(all_transactions[i].date) - parse_date(all_transactions[i - 1].date)).days
-        for i in range(1, len(all_transactions))
-    ]
+    _, ordinals = get_vendor_arrays(all_transactions)
+    intervals = np.diff(ordinals)
 
-    med_interval = median(intervals)
-    std_interval = stdev(intervals) if len(intervals) > 1 else 0.0
-    days_since_last = (parse_date(transaction.date) - parse_date(all_transactions[-1].date)).days
+    med_interval = float(np.median(intervals))
+    std_interval = _safe_std(intervals)
+    days_since_last = transaction.parsed_date.toordinal() - int(ordinals[-1])
 
     return (days_since_last - med_interval) / std_interval if std_interval != 0 else 0.0
 
 
+@dataclass
+class AmountStats:
+    """
+    Running summary of a vendor's amounts, updated one transaction at a time.
+
+    The sample variance is tracked with Welford's algorithm and the amounts are kept sorted,
+    so scoring a new transaction against a growing history does not recompute everything.
+    """
+
+    n: int = 0  # number of amounts seen
+    mean: float = 0.0  # running mean
+    m2: float = 0.0  # running sum of squared deviations from the mean
+    sorted_amounts: list[float] = field(default_factory=list)  # amounts seen, in ascending order
+
+
+def update_amount_stats(stats: AmountStats, amount: float) -> None:
+    """Add an amount to the running statistics in O(log n) comparisons."""
+    stats.n += 1
+    delta = amount - stats.mean
+    stats.mean += delta / stats.n
+    stats.m2 += delta * (amount - stats.mean)
+    insort(stats.sorted_amounts, amount)
+
+
+def build_amount_stats(transactions: list[Transaction]) -> AmountStats:
+    """Build running amount statistics from a list of transactions."""
+    stats = AmountStats()
+    for t in transactions:
+        update_amount_stats(stats, t.amount)
+    return stats
+
+
+def _stats_median(stats: AmountStats) -> float:
+    """Median of the amounts in the running statistics."""
+    mid = stats.n // 2
+    if stats.n % 2:
+        return stats.sorted_amounts[mid]
+    return (stats.sorted_amounts[mid - 1] + stats.sorted_amounts[mid]) / 2
+
+
+def _stats_stdev(stats: AmountStats) -> float:
+    """Sample standard deviation of the amounts in the running statistics."""
+    return sqrt(stats.m2 / (stats.n - 1)) if stats.n > 1 else 0.0
+
+
 # 6. Amount Stability Score:
-def amount_stability_score(all_transactions: list[Transaction]) -> float:
+def amount_stability_score(all_transactions: list[Transaction], stats: AmountStats | None = None) -> float:
     """
     Returns the ratio of the median transaction amount to its standard deviation for the vendor.
     A higher ratio indicates that amounts are stable.
+    Pass running stats from build_amount_stats to avoid rescanning all_transactions.
     """
-    amounts = [t.amount for t in all_transactions]
-    if len(amounts) < 2:
+    if stats is None:
+        stats = build_amount_stats(all_transactions)
+    if stats.n < 2:
         return 0.0
-    med = median(amounts)
-    try:
-        std_amt = stdev(amounts)
-    except Exception:
-        std_amt = 0.0
+    std_amt = _stats_stdev(stats)
     if std_amt == 0:
         return 1.0  # Perfect stability if no variation.
-    return med / std_amt
+    return _stats_median(stats) / std_amt
 
 
 # 7. Amount Z-Score:
-def amount_z_score(transaction: Transaction, all_transactions: list[Transaction]) -> float:
+def amount_z_score(
+    transaction: Transaction, all_transactions: list[Transaction], stats: AmountStats | None = None
+) -> float:
     """
     Computes the Z-score of the current transaction's amount relative to the vendor's historical amounts.
+    Pass running stats from build_amount_stats to avoid rescanning all_transactions.
     """
-    amounts = [t.amount for t in all_transactions]
-    if len(amounts) < 2:
+    if stats is None:
+        stats = build_amount_stats(all_transactions)
+    if stats.n < 2:
         return 0.0
-    med = median(amounts)
-    try:
-        std_amt = stdev(amounts)
-    except Exception:
-        std_amt = 0.0
+    std_amt = _stats_stdev(stats)
     if std_amt == 0:
         return 0.0
-    return (transaction.amount - med) / std_amt
+    return (transaction.amount - _stats_median(stats)) / std_amt
 
 
 def vendor_recurrence_trend(all_transactions: list[Transaction]) -> float:
@@ -132,28 +290,8 @@ def vendor_recurrence_trend(all_transactions: list[Transaction]) -> float:
     Returns the slope as an indicator of trend.
     If there is no increase, returns 0.0 (i.e. non-negative slope).
     """
-    if len(all_transactions) < 2:
-        return 0.0
-
-    all_transactions = sorted(all_transactions, key=lambda t: parse_date(t.date))
-
-    monthly_counts: defaultdict[tuple[int, int], int] = defaultdict(int)
-
-    for t in all_transactions:
-        parsed_date = parse_date(t.date)  # Convert string date to datetime.date object
-        key = (parsed_date.year, parsed_date.month)  # Extract year and month correctly
-        monthly_counts[key] += 1
-
-    keys = sorted(monthly_counts.keys(), key=lambda k: (k[0], k[1]))
-    counts = [monthly_counts[k] for k in keys]
-
-    if len(counts) < 2:
-        return 0.0
-
-    x = np.arange(len(counts))
-    slope, _ = np.polyfit(x, counts, 1)
-
-    return max(float(slope), 0.0)  # Ensure non-negative slope
+    _, ordinals = get_vendor_arrays(all_transactions)
+    return _vendor_recurrence_trend(ordinals)
 
 
 def weekly_spending_cycle(all_transactions: list[Transaction]) -> float:
@@ -170,7 +308,7 @@ def weekly_spending_cycle(all_transactions: list[Transaction]) -> float:
     weekly_amounts = defaultdict(list)
 
     for t in all_transactions:
-        week_number = (parse_date(t.date) - timedelta(days=parse_date(t.date).weekday() % 3)).isocalendar()[1]
+        week_number = (t.parsed_date - timedelta(days=t.parsed_date.weekday() % 3)).isocalendar()[1]
         # This adjusts week grouping, allowing slight shifts in weekday alignment (±2-3 days)
         weekly_amounts[week_number].append(t.amount)
 
@@ -179,7 +317,7 @@ def weekly_spending_cycle(all_transactions: list[Transaction]) -> float:
         return 0.0
 
     avg = mean(weekly_avgs)
-    variation = stdev(weekly_avgs) if len(weekly_avgs) > 1 else 0.0
+    variation = _safe_std(np.asarray(weekly_avgs))
     return variation / avg if avg != 0 else 0.0
 
 
@@ -195,30 +333,58 @@ def seasonal_spending_cycle(transaction: Transaction, all_transactions: list[Tra
         return 0.0
     monthly_amounts = defaultdict(list)
     for t in vendor_transactions:
-        monthly_amounts[parse_date(t.date).month].append(t.amount)
+        monthly_amounts[t.parsed_date.month].append(t.amount)
     monthly_avgs = [mean(amounts) for amounts in monthly_amounts.values() if amounts]
     if len(monthly_avgs) < 2:
         return 0.0
     avg = mean(monthly_avgs)
-    variation = stdev(monthly_avgs) if len(monthly_avgs) > 1 else 0.0
+    variation = _safe_std(np.asarray(monthly_avgs))
     return variation / avg if avg != 0 else 0.0
 
 
-def get_days_since_last_transaction(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    """Get the number of days since the last transaction with the same merchant"""
-    same_merchant_transactions = [
-        t for t in all_transactions if t.name == transaction.name and parse_date(t.date) < parse_date(transaction.date)
-    ]
-
-    if not same_merchant_transactions:
+def get_days_since_last_transaction(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    vendor_arrays: tuple[np.ndarray, np.ndarray] | None = None,
+) -> int:
+    """
+    Get the number of days since the last transaction with the same merchant.
+    vendor_arrays can be the precomputed get_vendor_arrays of the merchant's transactions.
+    """
+    if vendor_arrays is None:
+        vendor_arrays = get_vendor_arrays([t for t in all_transactions if t.name == transaction.name])
+    _, ordinals = vendor_arrays
+
+    # Binary search the sorted ordinals for the latest date strictly before this transaction
+    current = transaction.parsed_date.toordinal()
+    idx = int(np.searchsorted(ordinals, current, side="left"))
+    if idx == 0:
         return -1  # No previous transaction with the same merchant
 
-    last_transaction = max(same_merchant_transactions, key=lambda t: parse_date(t.date))
-    return (parse_date(transaction.date) - parse_date(last_transaction.date)).days
+    return current - int(ordinals[idx - 1])
+
+
+def _same_amount_ratio(amounts: np.ndarray, current_amount: float, tolerance: float) -> float:
+    """Ratio of amounts within ±tolerance of current_amount."""
+    if amounts.size == 0:
+        return 0.0
+
+    # Calculate the range of acceptable amounts
+    lower_bound = current_amount * (1 - tolerance)
+    upper_bound = current_amount * (1 + tolerance)
+
+    # Count amounts within the acceptable range
+    n_similar_amounts = np.count_nonzero((amounts >= lower_bound) & (amounts <= upper_bound))
+
+    # Calculate the ratio
+    return n_similar_amounts / amounts.size
 
 
 def get_same_amount_ratio(
-    transaction: Transaction, all_transactions: list[Transaction], tolerance: float = 0.05
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    tolerance: float = 0.05,
+    vendor_arrays: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> float:
     """
     Calculate the ratio of transactions with amounts within ±tolerance of the current transaction's amount.
@@ -227,25 +393,13 @@ def get_same_amount_ratio(
         transaction: The current transaction.
         all_transactions: List of all transactions for the same vendor.
         tolerance: Allowed variation in amounts (e.g., 0.05 for ±5%).
+        vendor_arrays: Optional precomputed get_vendor_arrays of all_transactions.
 
     Returns:
         Ratio of transactions with amounts within ±tolerance of the current transaction's amount.
     """
-    if not all_transactions:
-        return 0.0
-
-    # Get the current transaction's amount
-    current_amount = transaction.amount
-
-    # Calculate the range of acceptable amounts
-    lower_bound = current_amount * (1 - tolerance)
-    upper_bound = current_amount * (1 + tolerance)
-
-    # Count transactions within the acceptable range
-    n_similar_amounts = sum(1 for t in all_transactions if lower_bound <= t.amount <= upper_bound)
-
-    # Calculate the ratio
-    return n_similar_amounts / len(all_transactions)
+    amounts = vendor_arrays[0] if vendor_arrays is not None else _get_amounts(all_transactions)
+    return _same_amount_ratio(amounts, transaction.amount, tolerance)
 
 
 def trimmed_mean(values: Sequence[float], trim_percent: float = 0.1) -> float:
@@ -253,13 +407,27 @@ def trimmed_mean(values: Sequence[float], trim_percent: float = 0.1) -> float:
     Compute a trimmed mean: remove the lowest and highest trim_percent of values.
     If there aren't enough values to trim, returns the standard mean.
     """
-    converted_values = [float(x) for x in values]
-    n = len(converted_values)
+    array = np.asarray(values, dtype=np.float64)
+    n = array.size
     if n == 0:
         return 0.0
     k = int(n * trim_percent)
-    trimmed_values = sorted(converted_values)[k : n - k] if n > 2 * k else converted_values
-    return mean(trimmed_values)
+    if k == 0 or n <= 2 * k:
+        return float(array.mean())
+    # Partition around the two trim boundaries instead of fully sorting
+    partitioned = np.partition(array, (k, n - k - 1))
+    return float(partitioned[k : n - k].mean())
+
+
+def _cycle_consistency(ordinals: np.ndarray) -> float:
+    """Fraction of intervals within 25% of the median interval; ordinals must be sorted."""
+    intervals = np.diff(ordinals)
+    median_interval = float(np.median(intervals))
+
+    # Allow for up to 25% variation in the expected cycle interval
+    tolerance = 0.25 * median_interval
+
+    return float(np.count_nonzero(np.abs(intervals - median_interval) <= tolerance) / intervals.size)
 
 
 def calculate_cycle_consistency(transactions: list[Transaction]) -> float:
@@ -267,21 +435,26 @@ def calculate_cycle_consistency(transactions: list[Transaction]) -> float:
     if len(transactions) < 3:
         return 0.0  # Need at least 3 to check consistency
 
-    transactions.sort(key=lambda t: parse_date(t.date))  # Ensure transactions are sorted
-    dates = [parse_date(t.date) for t in transactions]
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    transactions.sort(key=lambda t: t.parsed_date)  # Ensure transactions are sorted
+    ordinals = np.fromiter((t.parsed_date.toordinal() for t in transactions), dtype=np.int64, count=len(transactions))
 
-    if not intervals:
-        return 0.0
+    return _cycle_consistency(ordinals)
 
-    median_interval = median(intervals)
 
-    # Allow for up to 25% variation in the expected cycle interval
-    tolerance = 0.25 * median_interval
+def _safe_interval_consistency(ordinals: np.ndarray) -> float:
+    """Array version of safe_interval_consistency; ordinals must be sorted."""
+    intervals = np.diff(ordinals)
+    if intervals.size <= 5:
+        return 0.0
+
+    lower_bound, upper_bound = np.percentile(intervals, [5, 95])
+    trimmed_intervals = np.clip(intervals, lower_bound, upper_bound)
 
-    consistent_count = sum(1 for interval in intervals if abs(interval - median_interval) <= tolerance)
+    m = float(np.mean(trimmed_intervals))
+    if m == 0:
+        return 0.0
 
-    return consistent_count / len(intervals)
+    return float(1 - (_safe_std(trimmed_intervals) / m))
 
 
 def safe_interval_consistency(all_transactions: list[Transaction]) -> float:
@@ -296,49 +469,58 @@ def safe_interval_consistency(all_transactions: list[Transaction]) -> float:
     Returns 0 if there are fewer than 6 intervals or if the mean of the trimmed intervals is zero.
     """
 
-    if len(all_transactions) < 2:
-        # Not enough transactions to compute intervals
-        return 0.0
-
-    # Sort the filtered transactions by date
-    dates = sorted([t.date for t in all_transactions])
+    _, ordinals = get_vendor_arrays(all_transactions)
+    return _safe_interval_consistency(ordinals)
 
-    # Compute intervals (in days) between consecutive transactions
-    intervals = [(parse_date(dates[i]) - parse_date(dates[i - 1])).days for i in range(1, len(dates))]
-
-    if len(intervals) <= 5:
-        # Not enough intervals to compute a robust consistency measure
-        return 0.0
 
-    # Clip intervals to remove outliers (5th to 95th percentile)
-    lower_bound = np.percentile(intervals, 5)
-    upper_bound = np.percentile(intervals, 95)
-    trimmed_intervals = np.clip(intervals, lower_bound, upper_bound)
+def build_vendor_counts(transactions: list[Transaction]) -> Counter[tuple[str, str]]:
+    """Count the transactions of every (user_id, name) vendor in a single pass."""
+    return Counter((t.user_id, t.name) for t in transactions)
 
-    m: float = float(mean(trimmed_intervals))
-    if m == 0:
-        return 0.0
 
-    return float(1 - (stdev(trimmed_intervals) / m))
+def get_vendor_recurrence_score(
+    all_transactions: list[Transaction],
+    total_transactions: int,
+    vendor_counts: Counter[tuple[str, str]] | None = None,
+) -> float:
+    """
+    Compute a general recurrence score for a vendor instead of binary flags.
 
+    Args:
+        all_transactions: Transactions of the vendor; with vendor_counts, only the first one is used to identify it.
+        total_transactions: Total number of transactions to compare against.
+        vendor_counts: Optional counts from build_vendor_counts, built once and shared across calls.
 
-def get_vendor_recurrence_score(all_transactions: list[Transaction], total_transactions: int) -> float:
-    """Compute a general recurrence score for a vendor instead of binary flags."""
+    Returns:
+        Proportion of transactions from this vendor.
+    """
     if total_transactions == 0:
         return 0.0
+    if vendor_counts is not None:
+        if not all_transactions:
+            return 0.0
+        vendor = all_transactions[0]
+        return vendor_counts[(vendor.user_id, vendor.name)] / total_transactions
     return len(all_transactions) / total_transactions  # Proportion of transactions from this vendor
 
 
-def enhanced_amt_iqr(all_transactions: list[Transaction]) -> float:
-    """Interquartile range of amounts, scaled to 1-10."""
-    amounts = [t.amount for t in all_transactions]
-
-    if not amounts or max(amounts) == 0:
+def _enhanced_amt_iqr(amounts: np.ndarray) -> float:
+    """Array version of enhanced_amt_iqr."""
+    if amounts.size == 0:
+        return 1.0
+    max_amount = float(amounts.max())
+    if max_amount == 0:
         return 1.0
 
     iqr = float(np.subtract(*np.percentile(amounts, [75, 25])))  # Convert NumPy float to Python float
 
-    return min(10.0, 1.0 + (iqr / max(amounts)) * 9)
+    return min(10.0, 1.0 + (iqr / max_amount) * 9)
+
+
+def enhanced_amt_iqr(all_transactions: list[Transaction]) -> float:
+    """Interquartile range of amounts, scaled to 1-10."""
+    amounts = _get_amounts(all_transactions)
+    return _enhanced_amt_iqr(amounts)
 
 
 def enhanced_days_since_last(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -347,20 +529,20 @@ def enhanced_days_since_last(transaction: Transaction, all_transactions: list[Tr
     from statistics import mean
 
     previous_dates = sorted([
-        parse_date(t.date) for t in all_transactions if t.id != transaction.id and t.name == transaction.name
+        t.parsed_date.toordinal() for t in all_transactions if t.id != transaction.id and t.name == transaction.name
     ])
 
     if not previous_dates:
         return 1.0  # No previous transactions → lowest score
 
     # Calculate the average gap between transactions
-    intervals = [(previous_dates[i] - previous_dates[i - 1]).days for i in range(1, len(previous_dates))]
+    intervals = [previous_dates[i] - previous_dates[i - 1] for i in range(1, len(previous_dates))]
 
     if not intervals:
         return 1.0  # Only one previous transaction → lowest score
 
     avg_interval = mean(intervals)  # Average time gap between transactions
-    days_since = (parse_date(transaction.date) - previous_dates[-1]).days
+    days_since = transaction.parsed_date.toordinal() - previous_dates[-1]
 
     # Score based on how closely it matches the expected recurrence interval
     similarity_score = max(1.0, 10.0 - (abs(days_since - avg_interval) / max(avg_interval, 1)) * 9)
@@ -369,24 +551,32 @@ def enhanced_days_since_last(transaction: Transaction, all_transactions: list[Tr
 
 
 def enhanced_n_similar_last_n_days(
-    transaction: Transaction, all_transactions: list[Transaction], days: int = 90
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    days: int = 90,
+    vendor_arrays: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> float:
-    """Counts similar transactions within a given time window, scaled from 1 to 10."""
+    """
+    Counts similar transactions within a given time window, scaled from 1 to 10.
+    vendor_arrays can be the precomputed get_vendor_arrays of all_transactions.
+    """
+    amounts, ordinals = vendor_arrays if vendor_arrays is not None else get_vendor_arrays(all_transactions)
 
-    similar_transactions = [
-        t
-        for t in all_transactions
-        if abs(parse_date(t.date) - parse_date(transaction.date)).days <= days
-        and abs(t.amount - transaction.amount) / max(transaction.amount, 1) <= 0.051  # Slightly increased tolerance
-    ]
+    # The ordinals are sorted, so the time window is a contiguous slice
+    current = transaction.parsed_date.toordinal()
+    lo = int(np.searchsorted(ordinals, current - days, side="left"))
+    hi = int(np.searchsorted(ordinals, current + days, side="right"))
+    window_amounts = amounts[lo:hi]
 
-    count = len(similar_transactions)
+    # Slightly increased tolerance
+    count = int(np.count_nonzero(np.abs(window_amounts - transaction.amount) / max(transaction.amount, 1) <= 0.051))
     return min(10.0, count)  # Cap at 10
 
 
 # Define common subscription cycles (allowing ±3 days flexibility)
 COMMON_CYCLES = [7, 14, 30, 90, 365]
 CYCLE_RANGE = 3  # Allowed variation in cycle detection
+_COMMON_CYCLES_ARRAY = np.array(COMMON_CYCLES, dtype=np.int64)
 
 
 def detect_common_interval(intervals: list[int]) -> bool:
@@ -398,77 +588,90 @@ def detect_common_interval(intervals: list[int]) -> bool:
 
 def transaction_frequency(transactions: list[Transaction]) -> float:
     """Returns transaction frequency per month."""
-    if len(transactions) < 2:
+    _, ordinals = get_vendor_arrays(transactions)
+    return _transaction_frequency(ordinals)
+
+
+def _robust_interval_median(ordinals: np.ndarray) -> float:
+    """Array version of robust_interval_median; ordinals must be sorted."""
+    if ordinals.size < 2:
         return 0.0
 
-    dates = sorted([parse_date(t.date) for t in transactions])
-    total_days = (dates[-1] - dates[0]).days
-    months = max(total_days / 30, 1)
-    return float(len(transactions) / months)
+    return float(np.median(np.diff(ordinals)))
 
 
 def robust_interval_median(transactions: list[Transaction]) -> float:
     """Returns the median interval between transactions."""
-    if len(transactions) < 2:
+    _, ordinals = get_vendor_arrays(transactions)
+    return _robust_interval_median(ordinals)
+
+
+def _robust_interval_iqr(ordinals: np.ndarray) -> float:
+    """Array version of robust_interval_iqr; ordinals must be sorted."""
+    if ordinals.size < 3:
         return 0.0
 
-    dates = sorted([parse_date(t.date) for t in transactions])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    return float(median(intervals)) if intervals else 0.0
+    q75, q25 = np.percentile(np.diff(ordinals), [75, 25], method="midpoint")
+    return float(q75 - q25)
 
 
 def robust_interval_iqr(transactions: list[Transaction]) -> float:
     """Returns the interquartile range (IQR) of transaction intervals."""
-    if len(transactions) < 2:
-        return 0.0
+    _, ordinals = get_vendor_arrays(transactions)
+    return _robust_interval_iqr(ordinals)
 
-    dates = sorted([parse_date(t.date) for t in transactions])
-    intervals = sorted([(dates[i] - dates[i - 1]).days for i in range(1, len(dates))])
 
-    if len(intervals) > 1:
-        return float(np.percentile(intervals, 75, method="midpoint") - np.percentile(intervals, 25, method="midpoint"))
-    return 0.0
+def _amount_variability_ratio(amounts: np.ndarray) -> float:
+    """Array version of amount_variability_ratio."""
+    if amounts.size < 2:
+        return 0.0
+
+    median_amount = float(np.median(amounts))
+    q75, q25 = np.percentile(amounts, [75, 25], method="midpoint")
+    return float(q75 - q25) / median_amount if median_amount > 0 else 0.0
 
 
 def amount_variability_ratio(transactions: list[Transaction]) -> float:
     """Returns the variability ratio of transaction amounts."""
-    if len(transactions) < 2:
+    amounts = _get_amounts(transactions)
+    return _amount_variability_ratio(amounts)
+
+
+def _most_common_interval(ordinals: np.ndarray) -> float:
+    """Array version of most_common_interval; ordinals must be sorted."""
+    if ordinals.size < 2:
         return 0.0
 
-    amounts = [t.amount for t in transactions]
-    median_amount = median(amounts)
+    intervals = np.diff(ordinals)
 
-    if len(amounts) > 1:
-        iqr_amounts = float(
-            np.percentile(amounts, 75, method="midpoint") - np.percentile(amounts, 25, method="midpoint")
-        )
-        return iqr_amounts / median_amount if median_amount > 0 else 0.0
-    return 0.0
+    # Intervals are small non-negative day counts, so a histogram finds the mode.
+    # Ties go to the interval seen first, as with Counter.most_common.
+    counts = np.bincount(intervals)
+    return float(intervals[np.argmax(counts[intervals] == counts.max())])
 
 
 def most_common_interval(transactions: list[Transaction]) -> float:
     """Returns the most common interval between transactions."""
-    if len(transactions) < 2:
+    _, ordinals = get_vendor_arrays(transactions)
+    return _most_common_interval(ordinals)
+
+
+def _matches_common_cycle(ordinals: np.ndarray) -> float:
+    """Array version of matches_common_cycle; ordinals must be sorted."""
+    if ordinals.size < 2:
         return 0.0
 
-    dates = sorted([parse_date(t.date) for t in transactions])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    intervals = np.diff(ordinals)
 
-    if intervals:
-        counter = Counter(intervals)
-        return float(counter.most_common(1)[0][0])  # Get the most frequent interval
-    return 0.0
+    # Compare every interval against every common cycle at once
+    deviations = np.abs(intervals[:, np.newaxis] - _COMMON_CYCLES_ARRAY)
+    return 1.0 if np.any(deviations <= CYCLE_RANGE) else 0.0
 
 
 def matches_common_cycle(transactions: list[Transaction]) -> float:
     """Returns 1 if transactions match a common cycle, otherwise 0."""
-    if len(transactions) < 2:
-        return 0.0
-
-    dates = sorted([parse_date(t.date) for t in transactions])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-
-    return 1.0 if detect_common_interval(intervals) else 0.0
+    _, ordinals = get_vendor_arrays(transactions)
+    return _matches_common_cycle(ordinals)
 
 
 def recurring_confidence(transactions: list[Transaction]) -> float:
@@ -488,14 +691,20 @@ def recurring_confidence(transactions: list[Transaction]) -> float:
     return float(confidence)
 
 
-def coefficient_of_variation_intervals(transactions: list[Transaction]) -> float:
-    """Returns the coefficient of variation of transaction intervals."""
-    median_interval = robust_interval_median(transactions)
-    iqr = robust_interval_iqr(transactions)
+def _coefficient_of_variation_intervals(ordinals: np.ndarray) -> float:
+    """Array version of coefficient_of_variation_intervals; ordinals must be sorted."""
+    median_interval = _robust_interval_median(ordinals)
+    iqr = _robust_interval_iqr(ordinals)
 
     return iqr / median_interval if median_interval > 0 else 0.0
 
 
+def coefficient_of_variation_intervals(transactions: list[Transaction]) -> float:
+    """Returns the coefficient of variation of transaction intervals."""
+    _, ordinals = get_vendor_arrays(transactions)
+    return _coefficient_of_variation_intervals(ordinals)
+
+
 # Predefined lists of known recurring companies and keywords
 KNOWN_RECURRING_COMPANIES = {
     "netflix",
@@ -567,10 +776,34 @@ UTILITY_PATTERN = re.compile(
     r"\b(" + "|".join(re.escape(keyword) for keyword in UTILITY_KEYWORDS) + r")\b", re.IGNORECASE
 )
 
+# Keyword lookups used on cleaned names. A cleaned name only holds letters, digits and whitespace, so a single-word
+# keyword matches the word-boundary patterns above exactly when it is one of the name's tokens; only multi-word
+# recurring keywords still need a pattern. Keywords with punctuation can never match a cleaned name as whole words.
+_RECURRING_TOKENS = frozenset(k.lower() for k in KNOWN_RECURRING_COMPANIES if k.isalnum())
+_UTILITY_TOKENS = frozenset(k.lower() for k in UTILITY_KEYWORDS if k.isalnum())
+_RECURRING_PHRASE_PATTERN = re.compile(
+    r"\b("
+    + "|".join(re.escape(k) for k in KNOWN_RECURRING_COMPANIES if not k.isalnum() and k.replace(" ", "").isalnum())
+    + r")\b",
+    re.IGNORECASE,
+)
+# Substrings for recurring_score's partial-match fallback (compared case-sensitively, as before)
+_RECURRING_SUBSTRINGS = tuple(KNOWN_RECURRING_COMPANIES)
+
+
+# Characters that clean_company_name strips: anything but ASCII letters, digits and whitespace
+_NAME_STRIP_PATTERN = re.compile(r"[^a-zA-Z0-9\s]")
 
+# Deletion table for the ASCII characters matched by _NAME_STRIP_PATTERN
+_ASCII_STRIP_TABLE = str.maketrans("", "", "".join(c for c in map(chr, range(128)) if _NAME_STRIP_PATTERN.match(c)))
+
+
+@lru_cache(maxsize=8192)
 def clean_company_name(name: str) -> str:
     """Normalize company name for better matching."""
-    return re.sub(r"[^a-zA-Z0-9\s]", "", name).strip().lower()
+    if name.isascii():
+        return name.translate(_ASCII_STRIP_TABLE).strip().lower()
+    return _NAME_STRIP_PATTERN.sub("", name).strip().lower()
 
 
 # def detect_recurring_company(company_name: str) -> dict[str, float]:
@@ -608,18 +841,31 @@ def clean_company_name(name: str) -> str:
 #     }
 
 
+def _has_recurring_keyword(cleaned_name: str) -> bool:
+    """Whether a cleaned name contains a known recurring company keyword as whole words."""
+    if not _RECURRING_TOKENS.isdisjoint(cleaned_name.split()):
+        return True
+    return _RECURRING_PHRASE_PATTERN.search(cleaned_name) is not None
+
+
+def _has_utility_keyword(cleaned_name: str) -> bool:
+    """Whether a cleaned name contains a utility keyword as a whole word."""
+    return not _UTILITY_TOKENS.isdisjoint(cleaned_name.split())
+
+
+@lru_cache(maxsize=8192)
 def is_utility_company(company_name: str) -> int:
     """Returns 1 if the company is a utility provider, else 0."""
-    cleaned_name = clean_company_name(company_name)
-    return 1 if UTILITY_PATTERN.search(cleaned_name) else 0
+    return 1 if _has_utility_keyword(clean_company_name(company_name)) else 0
 
 
+@lru_cache(maxsize=8192)
 def is_recurring_company(company_name: str) -> int:
     """Returns 1 if the company is known for recurring payments, else 0."""
-    cleaned_name = clean_company_name(company_name)
-    return 1 if RECURRING_PATTERN.search(cleaned_name) else 0
+    return 1 if _has_recurring_keyword(clean_company_name(company_name)) else 0
 
 
+@lru_cache(maxsize=8192)
 def recurring_score(company_name: str) -> float:
     """
     Returns a confidence score (0 to 1) based on keyword matches indicating
@@ -627,15 +873,14 @@ def recurring_score(company_name: str) -> float:
     """
     cleaned_name = clean_company_name(company_name)
 
-    if RECURRING_PATTERN.search(cleaned_name):
+    if _has_recurring_keyword(cleaned_name):
         return 1.0
-    if UTILITY_PATTERN.search(cleaned_name):
+    if _has_utility_keyword(cleaned_name):
         return 0.8  # Utilities are highly likely to be recurring
 
     # Check for partial matches with known recurring companies
-    for keyword in KNOWN_RECURRING_COMPANIES:
-        if keyword in cleaned_name:
-            return 0.7  # Partial match confidence
+    if any(keyword in cleaned_name for keyword in _RECURRING_SUBSTRINGS):
+        return 0.7  # Partial match confidence
 
     return 0.0
 
@@ -646,13 +891,13 @@ def get_subscription_score(all_transactions: list[Transaction]) -> float:
         return 0.0
 
     # Sort transactions by date
-    all_transactions.sort(key=lambda t: parse_date(t.date))
-    dates = [t.date for t in all_transactions]
+    all_transactions.sort(key=lambda t: t.parsed_date)
+    ordinals = [t.parsed_date.toordinal() for t in all_transactions]
     amounts = [t.amount for t in all_transactions]
     vendors = [t.name for t in all_transactions]  # Vendor names
 
     # Compute intervals (days)
-    intervals = [(parse_date(dates[i]) - parse_date(dates[i - 1])).days for i in range(1, len(dates))]
+    intervals = [ordinals[i] - ordinals[i - 1] for i in range(1, len(ordinals))]
     if not intervals:
         return 0.0
 
@@ -692,57 +937,63 @@ def get_subscription_score(all_transactions: list[Transaction]) -> float:
     return min(1.0, subscription_score)  # Ensure score is between 0 and 1
 
 
-def get_amount_consistency(all_transactions: list[Transaction]) -> float:
-    """Detects how consistent transaction amounts are over time."""
-    amounts = [t.amount for t in all_transactions]
-    if len(amounts) < 2:
+def _get_amount_consistency(amounts: np.ndarray) -> float:
+    """Array version of get_amount_consistency."""
+    if amounts.size < 2:
         return 0.0
 
-    median_amount = median(amounts)
+    median_amount = float(np.median(amounts))
     std_dev = float(np.std(amounts))  # Explicit conversion
     threshold = max(0.15 * median_amount, std_dev * 0.5)
 
-    amount_consistency = sum(1 for amount in amounts if abs(amount - median_amount) <= threshold) / len(amounts)
+    amount_consistency = np.count_nonzero(np.abs(amounts - median_amount) <= threshold) / amounts.size
+
+    return min(1.0, float(amount_consistency))
+
 
-    return min(1.0, amount_consistency)
+def get_amount_consistency(all_transactions: list[Transaction]) -> float:
+    """Detects how consistent transaction amounts are over time."""
+    amounts = _get_amounts(all_transactions)
+    return _get_amount_consistency(amounts)
+
+
+def _irregular_interval_score(ordinals: np.ndarray) -> float:
+    """Array version of irregular_interval_score; ordinals must be sorted."""
+    if ordinals.size < 3:
+        return 0.0  # Need at least two intervals
+
+    intervals = np.diff(ordinals)
+    interval_std = _safe_std(intervals)
+    mean_interval = float(np.mean(intervals))
+    return min(interval_std / (mean_interval + 1e-8), 1.0)
 
 
 def irregular_interval_score(all_transactions: list[Transaction]) -> float:
     """Computes how irregular the intervals between transactions are (0 to 1)."""
-    if not all_transactions or len(all_transactions) < 2:
-        return 0.0
+    _, ordinals = get_vendor_arrays(all_transactions)
+    return _irregular_interval_score(ordinals)
 
-    sorted_transactions = sorted(all_transactions, key=lambda t: t.date)
-    dates = [parse_date(t.date) for t in sorted_transactions]
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
 
-    if len(intervals) > 1:
-        interval_std = stdev(intervals)
-        mean_interval = sum(intervals) / len(intervals)
-        return min(interval_std / (mean_interval + 1e-8), 1.0)
-    return 0.0
+def _inconsistent_amount_score(amounts: np.ndarray) -> float:
+    """Array version of inconsistent_amount_score."""
+    if amounts.size < 2:
+        return 0.0
+
+    amount_std = _safe_std(amounts)
+    mean_amount = float(np.mean(amounts))
+    return min(amount_std / (mean_amount + 1e-8), 1.0)
 
 
 def inconsistent_amount_score(all_transactions: list[Transaction]) -> float:
     """Computes how inconsistent the transaction amounts are (0 to 1)."""
-    if not all_transactions or len(all_transactions) < 2:
-        return 0.0
+    amounts = _get_amounts(all_transactions)
+    return _inconsistent_amount_score(amounts)
 
-    amounts = [t.amount for t in all_transactions]
-
-    if len(amounts) > 1:
-        amount_std = stdev(amounts)
-        mean_amount = sum(amounts) / len(amounts)
-        return min(amount_std / (mean_amount + 1e-8), 1.0)
-    return 0.0
 
-
-def non_recurring_score(all_transactions: list[Transaction]) -> float:
-    """
-    Determines the probability of transactions being non-recurring (0 to 1).
-    """
-    interval_score = irregular_interval_score(all_transactions)
-    amount_score = inconsistent_amount_score(all_transactions)
+def _non_recurring_score(amounts: np.ndarray, ordinals: np.ndarray) -> float:
+    """Array version of non_recurring_score; ordinals must be sorted."""
+    interval_score = _irregular_interval_score(ordinals)
+    amount_score = _inconsistent_amount_score(amounts)
 
     if interval_score > 0.7 and amount_score > 0.7:
         return 1.0  # Highly non-recurring
@@ -751,53 +1002,91 @@ def non_recurring_score(all_transactions: list[Transaction]) -> float:
     return 0.0  # Recurring
 
 
-def amount_variability_score(all_transactions: list[Transaction]) -> float:
-    """Scores how much transaction amounts vary (1-10)."""
-    if len(all_transactions) < 2:
+def non_recurring_score(all_transactions: list[Transaction]) -> float:
+    """
+    Determines the probability of transactions being non-recurring (0 to 1).
+    """
+    amounts, ordinals = get_vendor_arrays(all_transactions)
+    return _non_recurring_score(amounts, ordinals)
+
+
+def _amount_variability_score(amounts: np.ndarray) -> float:
+    """Array version of amount_variability_score."""
+    if amounts.size < 2:
         return 1.0  # Single transactions are inherently non-recurring
 
-    unique_amounts = len({t.amount for t in all_transactions})
-    ratio = unique_amounts / len(all_transactions)
+    ratio = np.unique(amounts).size / amounts.size
 
     return min(10.0, ratio * 10)  # Scale to 1-10
 
 
-def date_irregularity_score(all_transactions: list[Transaction]) -> float:
-    """Scores how irregular the transaction dates are (1-10)."""
-    if len(all_transactions) < 2:
+def amount_variability_score(all_transactions: list[Transaction]) -> float:
+    """Scores how much transaction amounts vary (1-10)."""
+    amounts = _get_amounts(all_transactions)
+    return _amount_variability_score(amounts)
+
+
+def _date_irregularity_score(ordinals: np.ndarray) -> float:
+    """Array version of date_irregularity_score."""
+    if ordinals.size < 2:
         return 1.0  # Single transactions = non-recurring
 
-    months = [parse_date(t.date).month for t in all_transactions]
-    try:
-        date_std = stdev(months) if len(months) >= 2 else 0
-    except StatisticsError:
-        date_std = 0
+    months = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64) % 12 + 1
+    date_std = _safe_std(months)
 
     return min(10.0, (date_std / 2) * 10)  # Scale to 1-10, assuming >2 std dev is max irregularity
 
 
-# Helper: Calculate days between dates in a transaction list
-def _get_intervals(transactions: list[Transaction]) -> list[int]:
-    """Extract intervals between transaction dates."""
-    sorted_dates = sorted([t.date for t in transactions])  # No need to parse
-    return [(parse_date(sorted_dates[i]) - parse_date(sorted_dates[i - 1])).days for i in range(1, len(sorted_dates))]
+def date_irregularity_score(all_transactions: list[Transaction]) -> float:
+    """Scores how irregular the transaction dates are (1-10)."""
+    _, ordinals = get_vendor_arrays(all_transactions)
+    return _date_irregularity_score(ordinals)
 
 
-def proportional_timing_deviation(
-    transaction: Transaction, transactions: list[Transaction], days_flexibility: int = 7
-) -> float:
-    """Measures deviation from historical median interval, allowing a flexible timing window."""
+@dataclass(frozen=True)
+class TimingHistory:
+    """
+    Summary of a vendor's transaction dates used by proportional_timing_deviation.
+
+    Build it once per vendor with build_timing_history to score many transactions against the same history.
+    """
+
+    median_interval: float | None  # median days between transactions, None if there is not enough data
+    last_ordinal: int  # date ordinal of the last transaction in the history (in list order)
 
+
+def build_timing_history(transactions: list[Transaction]) -> TimingHistory:
+    """Summarize the intervals between a vendor's transactions for proportional_timing_deviation."""
     if len(transactions) < 2:
-        return 0.0  # Not enough data to determine deviation
+        return TimingHistory(median_interval=None, last_ordinal=0)  # Not enough data to determine deviation
+
+    _, ordinals = get_vendor_arrays(transactions)
+    intervals = np.diff(ordinals)
+    last_ordinal = transactions[-1].parsed_date.toordinal()
+
+    if not np.any(intervals):
+        return TimingHistory(median_interval=None, last_ordinal=last_ordinal)  # All intervals are zero
+
+    return TimingHistory(median_interval=float(np.median(intervals)), last_ordinal=last_ordinal)
 
-    intervals = _get_intervals(transactions)
 
-    if not intervals or all(i == 0 for i in intervals):
-        return 0.0  # Avoid division by zero when all intervals are zero
+def proportional_timing_deviation(
+    transaction: Transaction,
+    transactions: list[Transaction],
+    days_flexibility: int = 7,
+    history: TimingHistory | None = None,
+) -> float:
+    """
+    Measures deviation from historical median interval, allowing a flexible timing window.
+    history can be the precomputed build_timing_history of transactions.
+    """
+    if history is None:
+        history = build_timing_history(transactions)
+    if history.median_interval is None:
+        return 0.0  # Not enough data, or all intervals are zero
 
-    median_interval: float = float(median(intervals))
-    current_interval: int = (parse_date(transaction.date) - parse_date(transactions[-1].date)).days
+    median_interval = history.median_interval
+    current_interval = transaction.parsed_date.toordinal() - history.last_ordinal
 
     # Allow a ±7 day window for delay flexibility
     if abs(current_interval - median_interval) <= days_flexibility:
@@ -808,17 +1097,30 @@ def proportional_timing_deviation(
     )  # Ensure result is non-negative
 
 
-def amount_similarity(transaction: Transaction, transactions: list[Transaction], tolerance: float = 0.05) -> float:
+def amount_similarity(
+    transaction: Transaction,
+    transactions: list[Transaction],
+    tolerance: float = 0.05,
+    vendor_arrays: tuple[np.ndarray, np.ndarray] | None = None,
+) -> float:
     """
     Calculate the ratio of transactions with amounts within ±tolerance of the current transaction's amount.
+    vendor_arrays can be the precomputed get_vendor_arrays of transactions.
     """
-    if not transactions:
+    amounts = vendor_arrays[0] if vendor_arrays is not None else _get_amounts(transactions)
+    return _same_amount_ratio(amounts, transaction.amount, tolerance)
+
+
+def _amount_coefficient_of_variation(amounts: np.ndarray) -> float:
+    """Array version of amount_coefficient_of_variation."""
+    if amounts.size < 2:
         return 0.0
-    current_amount = transaction.amount
-    lower_bound = current_amount * (1 - tolerance)
-    upper_bound = current_amount * (1 + tolerance)
-    similar_count = sum(1 for t in transactions if lower_bound <= t.amount <= upper_bound)
-    return float(similar_count) / float(len(transactions))
+    mean_amount = float(np.mean(amounts))
+    if mean_amount == 0:
+        return 0.0
+    # Use population std (ddof=0) to match test expectations.
+    pop_std = np.std(amounts, ddof=0)
+    return float(pop_std / mean_amount)
 
 
 def amount_coefficient_of_variation(transactions: list[Transaction]) -> float:
@@ -826,9 +1128,5 @@ def amount_coefficient_of_variation(transactions: list[Transaction]) -> float:
     Measures amount consistency using the population standard deviation.
     Returns (population stdev / mean). If not enough data, returns 0.0.
     """
-    amounts = [t.amount for t in transactions]
-    if len(amounts) < 2 or mean(amounts) == 0:
-        return 0.0
-    # Use population std (ddof=0) to match test expectations.
-    pop_std = np.std(amounts, ddof=0)
-    return float(pop_std / mean(amounts))
+    amounts = _get_amounts(transactions)
+    return _amount_coefficient_of_variation(amounts)
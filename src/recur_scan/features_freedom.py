@@ -8,7 +8,7 @@ from recur_scan.utils import parse_date
 
 def get_day_of_week(transaction: Transaction) -> int:
     """Get day of week (0=Monday, 6=Sunday)"""
-    return parse_date(transaction.date).weekday()
+    return transaction.parsed_date.weekday()
 
 
 def get_days_until_next_transaction(
@@ -28,29 +28,27 @@ def get_days_until_next_transaction(
     return (parse_date(next_date) - parse_date(transaction.date)).days
 
 
+def _other_dates(transaction: Transaction, all_transactions: list[Transaction]) -> list[str]:
+    """Sorted dates of all transactions other than this one."""
+    return sorted(t.date for t in all_transactions if t != transaction)
+
+
 def get_periodicity_confidence(
     transaction: Transaction, all_transactions: list[Transaction], expected_period: int = 30
 ) -> float:
     """Calculate confidence score for periodicity (0-1)"""
-    similar_trans = sorted([t for t in all_transactions if t != transaction], key=lambda x: x.date)
-
-    if len(similar_trans) < 2:
-        return 0.0
-
-    deltas = []
-    for i in range(1, len(similar_trans)):
-        delta = (parse_date(similar_trans[i].date) - parse_date(similar_trans[i - 1].date)).days
-        deltas.append(delta)
+    dates = _other_dates(transaction, all_transactions)
 
-    if not deltas:
+    if len(dates) < 2:
         return 0.0
 
-    avg_delta = np.mean(deltas)
-    std_delta = np.std(deltas)
+    deltas = np.diff([parse_date(d).toordinal() for d in dates])
+    avg_delta = float(np.mean(deltas))
+    std_delta = float(np.std(deltas))
 
     # Score based on how close average is to expected period and how consistent
-    period_score = 1 - min(float(abs(avg_delta - expected_period) / expected_period), 1)
-    consistency_score = 1 - min(float(std_delta) / expected_period, 1)
+    period_score = 1 - min(abs(avg_delta - expected_period) / expected_period, 1)
+    consistency_score = 1 - min(std_delta / expected_period, 1)
 
     return (period_score + consistency_score) / 2
 
@@ -59,18 +57,18 @@ def get_recurrence_streak(
     transaction: Transaction, all_transactions: list[Transaction], tolerance_days: int = 3
 ) -> int:
     """Count consecutive periods with similar transactions"""
-    similar_trans = sorted([t for t in all_transactions if t != transaction], key=lambda x: x.date)
+    dates = _other_dates(transaction, all_transactions)
 
-    if not similar_trans:
+    if not dates:
         return 0
 
     streak = 0
-    expected_date = parse_date(transaction.date) - timedelta(days=30)
+    expected_date = transaction.parsed_date - timedelta(days=30)
 
-    for t in reversed(similar_trans):
-        if abs((expected_date - parse_date(t.date)).days) <= tolerance_days:
+    for d in reversed(dates):
+        if abs((expected_date - parse_date(d)).days) <= tolerance_days:
             streak += 1
-            expected_date = parse_date(t.date) - timedelta(days=30)
+            expected_date = parse_date(d) - timedelta(days=30)
         else:
             break
 
@@ -1,17 +1,38 @@
+from collections import Counter
+
+import numpy as np
+
 from recur_scan.transactions import Transaction
-from recur_scan.utils import get_day, parse_date
+from recur_scan.utils import get_day
+
+
+def build_name_counts(transactions: list[Transaction]) -> Counter[str]:
+    """Count the transactions with each description in a single pass, to share across feature calls."""
+    return Counter(t.name for t in transactions)
 
 
-def get_n_transactions_same_description(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    """Get the number of transactions in all_transactions with the same description as transaction"""
-    return len([t for t in all_transactions if t.name == transaction.name])  # type: ignore
+def get_n_transactions_same_description(
+    transaction: Transaction, all_transactions: list[Transaction], name_counts: Counter[str] | None = None
+) -> int:
+    """
+    Get the number of transactions in all_transactions with the same description as transaction.
+    name_counts can be the precomputed build_name_counts of all_transactions.
+    """
+    if name_counts is not None:
+        return name_counts[transaction.name]
+    return sum(1 for t in all_transactions if t.name == transaction.name)
 
 
-def get_percent_transactions_same_description(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    """Get the percentage of transactions in all_transactions with the same description as transaction"""
+def get_percent_transactions_same_description(
+    transaction: Transaction, all_transactions: list[Transaction], name_counts: Counter[str] | None = None
+) -> float:
+    """
+    Get the percentage of transactions in all_transactions with the same description as transaction.
+    name_counts can be the precomputed build_name_counts of all_transactions.
+    """
     if not all_transactions:
         return 0.0
-    n_same_description = len([t for t in all_transactions if t.name == transaction.name])  # type: ignore
+    n_same_description = get_n_transactions_same_description(transaction, all_transactions, name_counts)
     return n_same_description / len(all_transactions)
 
 
@@ -21,9 +42,9 @@ def get_transaction_frequency(transaction: Transaction, all_transactions: list[T
     if len(same_transactions) < 2:
         return 0.0  # Not enough data to calculate frequency
 
-    dates = sorted([parse_date(t.date).toordinal() for t in same_transactions])
-    intervals = [dates[i] - dates[i - 1] for i in range(1, len(dates))]
-    return sum(intervals) / len(intervals)
+    # The intervals between the sorted dates telescope, so their mean is the overall span over the interval count
+    dates = np.fromiter((t.parsed_date.toordinal() for t in same_transactions), dtype=np.int64)
+    return int(dates.max() - dates.min()) / (dates.size - 1)
 
 
 def get_day_of_month_consistency(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -32,6 +53,6 @@ def get_day_of_month_consistency(transaction: Transaction, all_transactions: lis
     if len(same_transactions) < 2:
         return 0.0  # Not enough data to calculate consistency
 
-    days = [get_day(t.date) for t in same_transactions]
-    most_common_day = max(set(days), key=days.count)
-    return sum(1 for day in days if day == most_common_day) / len(days)
+    days = np.fromiter((get_day(t.date) for t in same_transactions), dtype=np.int64)
+    # Share of transactions falling on the most common day of the month
+    return int(np.bincount(days).max()) / days.size
@@ -21,16 +21,8 @@ def _aggregate_transactions(transactions: list[Transaction]) -> dict[str, dict[s
     """
     user_merchant_groups: dict[str, dict[str, list[Transaction]]] = {}
     for transaction in transactions:
-        user_id = transaction.user_id
-        merchant_name = transaction.name
-        # Initialize dictionary for user if not present
-        if user_id not in user_merchant_groups:
-            user_merchant_groups[user_id] = {}
-        # Initialize list for merchant if not present
-        if merchant_name not in user_merchant_groups[user_id]:
-            user_merchant_groups[user_id][merchant_name] = []
-        # Append transaction to the appropriate group
-        user_merchant_groups[user_id][merchant_name].append(transaction)
+        # setdefault creates missing user and merchant entries with a single lookup per level
+        user_merchant_groups.setdefault(transaction.user_id, {}).setdefault(transaction.name, []).append(transaction)
     return user_merchant_groups
 
 
@@ -43,44 +35,41 @@ def _calculate_intervals(dates: list[date]) -> list[int]:
     Returns:
         List[int]: List of intervals in days between consecutive dates; empty if fewer than 2 dates.
     """
-    intervals: list[int] = []
-    # Need at least 2 dates to compute an interval
-    if len(dates) < 2:
-        return intervals
-    # Compute days between each pair of consecutive dates
-    for i in range(1, len(dates)):
-        current_date = dates[i]
-        previous_date = dates[i - 1]
-        days_between = (current_date - previous_date).days
-        intervals.append(days_between)
+    # Subtract consecutive dates in one vectorized pass; fewer than 2 dates give an empty list
+    intervals: list[int] = np.diff(np.asarray(dates, dtype="datetime64[D]")).astype(np.int64).tolist()
     return intervals
 
 
-def _calculate_statistics(values: list[float]) -> dict[str, float]:
+def _calculate_intervals_float(dates: list[date]) -> np.ndarray:
+    """Calculate the days between consecutive sorted dates as a float array.
+
+    Same intervals as _calculate_intervals, without the round trip through a Python list,
+    for feeding straight into _calculate_statistics.
+
+    Args:
+        dates (List[datetime]): List of datetime objects, assumed to be sorted.
+
+    Returns:
+        np.ndarray: Float64 array of intervals in days; empty if fewer than 2 dates.
+    """
+    return np.diff(np.asarray(dates, dtype="datetime64[D]")).astype(np.float64)
+
+
+def _calculate_statistics(values: list[float] | np.ndarray) -> dict[str, float]:
     """Compute mean and standard deviation of a list of numbers.
 
     Args:
-        values (List[float]): List of numerical values (e.g., intervals or amounts).
+        values (List[float] | np.ndarray): Numerical values (e.g., intervals or amounts).
 
     Returns:
         Dict[str, float]: Dictionary with 'mean' and 'std' keys; both 0.0 if list is empty.
     """
-    stats = {}
     # Handle empty list case
     if len(values) == 0:
-        stats["mean"] = 0.0
-        stats["std"] = 0.0
-        return stats
-    # Calculate mean manually
-    total = 0.0
-    for num in values:
-        total += num
-    mean_value = total / len(values)
-    # Use NumPy for efficient standard deviation calculation
-    std_value = float(np.std(values))
-    stats["mean"] = mean_value
-    stats["std"] = std_value
-    return stats
+        return {"mean": 0.0, "std": 0.0}
+    # Convert once and let NumPy compute both statistics in C
+    array = np.asarray(values, dtype=np.float64)
+    return {"mean": float(array.mean()), "std": float(array.std())}
 
 
 # Individual Feature Functions
@@ -161,6 +150,16 @@ def is_varying_amount_recurring_feature(interval_stats: dict[str, float], amount
     return 0
 
 
+def _day_consistency_core(days: np.ndarray) -> float:
+    """Numeric core of day_consistency_score_feature on an array of days of the month."""
+    if days.size == 0:
+        return 0.0
+    if days.size == 1:
+        return 0.5
+    std = float(days.std())
+    return 1.0 - min(std / 3.0, 1.0)
+
+
 def day_consistency_score_feature(merchant_trans: list[Transaction]) -> float:
     """Measure consistency of transaction days within a month (0 to 1 scale).
 
@@ -170,13 +169,8 @@ def day_consistency_score_feature(merchant_trans: list[Transaction]) -> float:
     Returns:
         float: Score from 0 to 1; higher means more consistent days (lower std).
     """
-    days = [date.day for date in [parse_date(t.date) for t in merchant_trans] if date]
-    if not days:
-        return 0.0
-    if len(days) == 1:
-        return 0.5
-    std = float(np.std(days))
-    return 1.0 - min(std / 3.0, 1.0)
+    days = np.fromiter((t.parsed_date.day for t in merchant_trans), dtype=np.float64, count=len(merchant_trans))
+    return _day_consistency_core(days)
 
 
 def is_near_periodic_interval_feature(interval_stats: dict[str, float]) -> float:
@@ -235,11 +229,10 @@ def time_since_last_transaction_same_merchant_feature(parsed_dates: list[date])
     """Days since earliest transaction or average interval."""
     if not parsed_dates:
         return 0
-    now = datetime.now().date()
     if len(parsed_dates) == 1:
-        return (now - parsed_dates[0]).days / 365  # Normalize by year
-    intervals = _calculate_intervals(parsed_dates)
-    return (sum(intervals) / len(intervals)) / 365 if intervals else (now - min(parsed_dates)).days / 365
+        return (datetime.now().date() - parsed_dates[0]).days / 365  # Normalize by year
+    # The consecutive intervals telescope, so their mean is the first-to-last span over the interval count
+    return (parsed_dates[-1] - parsed_dates[0]).days / (len(parsed_dates) - 1) / 365
 
 
 def is_deposit_feature(transaction: Transaction, merchant_trans: list[Transaction]) -> int:
@@ -252,22 +245,17 @@ def is_deposit_feature(transaction: Transaction, merchant_trans: list[Transactio
     Returns:
         int: 1 if amount is positive and there are ≥3 transactions, 0 otherwise.
     """
-    is_deposit = 0
-    if transaction.amount > 0 and len(merchant_trans) >= 3:
-        is_deposit = 1
-    return is_deposit
+    return 1 if transaction.amount > 0 and len(merchant_trans) >= 3 else 0
 
 
 def day_of_week_feature(transaction: Transaction) -> float:
     """Day of the week (0-6, Monday-Sunday)."""
-    date = parse_date(transaction.date)
-    return date.weekday() / 6 if date else 0
+    return transaction.parsed_date.weekday() / 6
 
 
 def transaction_month_feature(transaction: Transaction) -> float:
     """Month of the transaction (1-12)."""
-    date = parse_date(transaction.date)
-    return (date.month - 1) / 11 if date else 0
+    return (transaction.parsed_date.month - 1) / 11
 
 
 def rolling_amount_mean_feature(merchant_trans: list[Transaction]) -> float:
@@ -448,3 +436,6 @@ def date_irregularity_dominance(
             1.0,
         )
     )
+
+
+# Batched Features
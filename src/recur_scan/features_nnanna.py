@@ -1,26 +1,18 @@
-from datetime import datetime
-
 import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import parse_date
 
 
 def get_time_interval_between_transactions(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the average time interval (in days) between transactions with the same amount"""
-    same_amount_transactions = sorted(
-        [t for t in all_transactions if t.amount == transaction.amount],  # Filter transactions with the same amount
-        key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"),  # Sort by date
-    )
-    if len(same_amount_transactions) < 2:
+    same_amount_dates = [
+        parse_date(t.date) for t in all_transactions if t.amount == transaction.amount
+    ]  # Filter transactions with the same amount
+    if len(same_amount_dates) < 2:
         return 365.0  # Return a large number if there are less than 2 transactions
-    intervals = [
-        (
-            datetime.strptime(same_amount_transactions[i + 1].date, "%Y-%m-%d")
-            - datetime.strptime(same_amount_transactions[i].date, "%Y-%m-%d")
-        ).days
-        for i in range(len(same_amount_transactions) - 1)  # Calculate intervals between consecutive transactions
-    ]
-    return sum(intervals) / len(intervals)  # Return the average interval
+    # The gaps between date-sorted transactions add up to last - first, so the average needs no sort
+    return (max(same_amount_dates) - min(same_amount_dates)).days / (len(same_amount_dates) - 1)
 
 
 def get_mobile_transaction(transaction: Transaction) -> bool:
@@ -42,16 +34,11 @@ def get_transaction_frequency(transaction: Transaction, all_transactions: list[T
     ]  # Filter transactions by vendor name
     if len(vendor_transactions) < 2:
         return 0.0  # Return 0 if there are less than 2 transactions
-    intervals = [
-        (
-            datetime.strptime(vendor_transactions[i + 1].date, "%Y-%m-%d")
-            - datetime.strptime(vendor_transactions[i].date, "%Y-%m-%d")
-        ).days
-        for i in range(len(vendor_transactions) - 1)  # Calculate intervals between consecutive transactions
-    ]
-    if not intervals or sum(intervals) == 0:
-        return 0.0  # Return 0 if there are no intervals or the sum is 0
-    return 1 / (sum(intervals) / len(intervals))  # Return the frequency
+    # The intervals between consecutive transactions add up to last - first
+    total_days = (parse_date(vendor_transactions[-1].date) - parse_date(vendor_transactions[0].date)).days
+    if total_days == 0:
+        return 0.0  # Return 0 if the intervals sum to 0
+    return 1 / (total_days / (len(vendor_transactions) - 1))  # Return the frequency
 
 
 def get_dispersion_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -93,23 +80,12 @@ def get_coefficient_of_variation(transaction: Transaction, all_transactions: lis
 def get_transaction_interval_consistency(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Calculate the average interval between transactions for the same vendor."""
     # Filter transactions for the same vendor
-    vendor_transactions = [t for t in transactions if t.name == transaction.name]
-    if len(vendor_transactions) < 2:
+    vendor_dates = [parse_date(t.date) for t in transactions if t.name == transaction.name]
+    if len(vendor_dates) < 2:
         return 0.0  # No intervals to calculate
 
-    # Sort transactions by date (convert date strings to datetime objects)
-    vendor_transactions.sort(key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
-
-    # Calculate intervals in days
-    intervals = [
-        (
-            datetime.strptime(vendor_transactions[i + 1].date, "%Y-%m-%d")
-            - datetime.strptime(vendor_transactions[i].date, "%Y-%m-%d")
-        ).days
-        for i in range(len(vendor_transactions) - 1)
-    ]
-    # Return the average interval
-    return sum(intervals) / len(intervals)
+    # The intervals between date-sorted transactions add up to last - first, so no sort is needed
+    return (max(vendor_dates) - min(vendor_dates)).days / (len(vendor_dates) - 1)
 
 
 def get_average_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -3,18 +3,19 @@ import re
 import numpy as np
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import get_day, parse_date
+from recur_scan.utils import get_day, parse_date  # noqa: F401  # re-exported for existing importers
+
+_ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+})
 
 
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring because of the vendor name - check lowercase match"""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-    }
-    return transaction.name.lower() in always_recurring_vendors
+    return transaction.name.lower() in _ALWAYS_RECURRING_VENDORS
 
 
 def get_is_insurance(transaction: Transaction) -> bool:
@@ -52,15 +53,15 @@ def get_n_transactions_days_apart(
     being n_days_apart from transaction
     """
     n_txs = 0
-    transaction_date = parse_date(transaction.date)
+    # Whole-day differences as plain integer ordinal arithmetic, with no per-pair timedelta
+    transaction_ordinal = transaction.date_ordinal
 
     # Pre-calculate bounds for faster checking
     lower_remainder = n_days_apart - n_days_off
     upper_remainder = n_days_off
 
     for t in all_transactions:
-        t_date = parse_date(t.date)
-        days_diff = abs((t_date - transaction_date).days)
+        days_diff = abs(t.date_ordinal - transaction_ordinal)
 
         # Skip if the difference is less than minimum required
         if days_diff < n_days_apart - n_days_off:
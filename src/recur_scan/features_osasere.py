@@ -1,97 +1,135 @@
 import re
+from functools import lru_cache
 
 import numpy as np  # type: ignore
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import get_day, parse_date
+from recur_scan.utils import get_day
+
+
+def build_vendor_index(transactions: list[Transaction]) -> dict[str, list[Transaction]]:
+    """Group transactions by lowercased vendor name in a single pass, to share across feature calls."""
+    vendor_index: dict[str, list[Transaction]] = {}
+    for t in transactions:
+        vendor_index.setdefault(t.name.lower(), []).append(t)
+    return vendor_index
+
+
+def _vendor_transactions(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    vendor_index: dict[str, list[Transaction]] | None,
+) -> list[Transaction]:
+    """Transactions with the same (case-insensitive) vendor name, from vendor_index when one is given."""
+    name = transaction.name.lower()
+    if vendor_index is not None:
+        return vendor_index.get(name, [])
+    return [t for t in all_transactions if t.name.lower() == name]
 
 
 def has_min_recurrence_period(
     transaction: Transaction,
     all_transactions: list[Transaction],
     min_days: int = 60,
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> bool:
-    """Check if transactions from the same vendor span at least `min_days`."""
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    """Check if transactions from the same vendor span at least `min_days`.
+    vendor_index can be the precomputed build_vendor_index of all_transactions.
+    """
+    vendor_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
     if len(vendor_txs) < 2:
         return False
-    dates = sorted([parse_date(t.date) for t in vendor_txs])
-    return (dates[-1] - dates[0]).days >= min_days
+    ordinals = [t.date_ordinal for t in vendor_txs]
+    return max(ordinals) - min(ordinals) >= min_days
 
 
 def get_day_of_month_consistency(
     transaction: Transaction,
     all_transactions: list[Transaction],
     tolerance_days: int = 7,
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> float:
-    """Calculate the fraction of transactions within `tolerance_days` of the target day."""
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    """Calculate the fraction of transactions within `tolerance_days` of the target day.
+    vendor_index can be the precomputed build_vendor_index of all_transactions.
+    """
+    vendor_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
     if len(vendor_txs) < 2:
         return 0.0
-    target_day = get_day(transaction.date)
-    matches = 0
-    for t in vendor_txs:
-        day_diff = abs(get_day(t.date) - target_day)
-        if day_diff <= tolerance_days or day_diff >= 28 - tolerance_days:  # Handle month-end
-            matches += 1
+    days = np.fromiter((get_day(t.date) for t in vendor_txs), dtype=np.int64, count=len(vendor_txs))
+    day_diff = np.abs(days - get_day(transaction.date))
+    close = (day_diff <= tolerance_days) | (day_diff >= 28 - tolerance_days)  # Handle month-end
+    matches = int(np.count_nonzero(close))
     return matches / len(vendor_txs)
 
 
 def get_day_of_month_variability(
     transaction: Transaction,
     all_transactions: list[Transaction],
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> float:
-    """Measure consistency of day-of-month (lower = more consistent)."""
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    """Measure consistency of day-of-month (lower = more consistent).
+    vendor_index can be the precomputed build_vendor_index of all_transactions.
+    """
+    vendor_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
     if len(vendor_txs) < 2:
         return 31.0  # Max possible variability
 
-    days = [get_day(t.date) for t in vendor_txs]
-    # Handle month-end transitions (e.g., 28th vs 1st)
-    adjusted_days = []
-    for day in days:
-        if day > 28 and day < 31:  # Treat 28+, 1, 2, 3 as close
-            adjusted_days.extend([day, day - 31])
-        else:
-            adjusted_days.append(day)
-    return np.std(adjusted_days)  # type: ignore
+    days = np.fromiter((get_day(t.date) for t in vendor_txs), dtype=np.float64, count=len(vendor_txs))
+    # Handle month-end transitions (e.g., 28th vs 1st): days 29 and 30 also count as day - 31
+    month_end = days[(days > 28) & (days < 31)]  # Treat 28+, 1, 2, 3 as close
+    return float(np.std(np.concatenate((days, month_end - 31))))
 
 
 def get_recurrence_confidence(
     transaction: Transaction,
     all_transactions: list[Transaction],
     decay_rate: float = 2,  # Higher = recent transactions matter more
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> float:
-    """Calculate a confidence score (0-1) based on weighted historical recurrences."""
-    vendor_txs = sorted(
-        [t for t in all_transactions if t.name.lower() == transaction.name.lower()],
-        key=lambda x: x.date,
-    )
+    """Calculate a confidence score (0-1) based on weighted historical recurrences.
+    vendor_index can be the precomputed build_vendor_index of all_transactions.
+    """
+    vendor_txs = sorted(_vendor_transactions(transaction, all_transactions, vendor_index), key=lambda x: x.date)
     if len(vendor_txs) < 2:
         return 0.0
 
     confidence = 0.0
     for i in range(1, len(vendor_txs)):
-        days_diff = (parse_date(vendor_txs[i].date) - parse_date(vendor_txs[i - 1].date)).days
+        days_diff = vendor_txs[i].date_ordinal - vendor_txs[i - 1].date_ordinal
         # Weight by decay_rate^(time ago) and normalize
         confidence += (decay_rate**i) * (1.0 if days_diff <= 35 else 0.0)
 
     return confidence / sum(decay_rate**i for i in range(1, len(vendor_txs)))
 
 
-def is_weekday_consistent(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
-    weekdays = [parse_date(t.date).weekday() for t in vendor_txs]  # Monday=0, Sunday=6
-    return len(set(weekdays)) <= 2  # Allow minor drift (e.g., weekend vs. Monday)
+def is_weekday_consistent(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    vendor_index: dict[str, list[Transaction]] | None = None,
+) -> bool:
+    """Check if the vendor's transactions fall on at most two weekdays.
+    vendor_index can be the precomputed build_vendor_index of all_transactions.
+    """
+    vendor_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
+    # Ordinals modulo 7 identify the weekday (only the number of distinct weekdays matters)
+    weekdays = {t.date_ordinal % 7 for t in vendor_txs}
+    return len(weekdays) <= 2  # Allow minor drift (e.g., weekend vs. Monday)
 
 
-def get_median_period(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
-    dates = sorted([parse_date(t.date) for t in vendor_txs])
-    if len(dates) < 2:
+def get_median_period(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    vendor_index: dict[str, list[Transaction]] | None = None,
+) -> float:
+    """Median gap in days between the vendor's transactions.
+    vendor_index can be the precomputed build_vendor_index of all_transactions.
+    """
+    vendor_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
+    if len(vendor_txs) < 2:
         return 0.0
-    day_diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    return float(np.median(day_diffs))  # Median is robust to outliers
+    ordinals = np.fromiter((t.date_ordinal for t in vendor_txs), dtype=np.int64, count=len(vendor_txs))
+    ordinals.sort()
+    return float(np.median(np.diff(ordinals)))  # Median is robust to outliers
 
 
 # New Features
@@ -145,6 +183,7 @@ def get_fixed_recurring(name: str, transaction: Transaction) -> bool:
 def detect_installment_payments(
     transaction: Transaction,
     all_transactions: list[Transaction],
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> bool:
     """
     Detects installment payment services like AfterPay and similar services.
@@ -152,6 +191,7 @@ def detect_installment_payments(
     Args:
         transaction: The transaction to check
         all_transactions: List of all transactions to analyze for patterns
+        vendor_index: Optional index from build_vendor_index of all_transactions, built once and shared across calls
 
     Returns:
         True if the transaction appears to be an installment payment, False otherwise
@@ -167,7 +207,7 @@ def detect_installment_payments(
         "zip",
     ]
     # Get all transactions from the same vendor
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
     # Installment payments typically have at least 2 payments
     if len(vendor_txs) < 2:
         return False
@@ -177,11 +217,11 @@ def detect_installment_payments(
         return False
 
     # Analyze date patterns - installments often happen every 2-4 weeks
-    dates = sorted([parse_date(t.date) for t in vendor_txs])
-    if len(dates) < 2:
+    ordinals = sorted([t.date_ordinal for t in vendor_txs])
+    if len(ordinals) < 2:
         return False
 
-    day_diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    day_diffs = [ordinals[i] - ordinals[i - 1] for i in range(1, len(ordinals))]
 
     # Check if any consecutive transactions are 10-20 days apart (typical for biweekly payments)
     has_biweekly = any(10 <= diff <= 20 for diff in day_diffs)
@@ -193,6 +233,7 @@ def detect_installment_payments(
 def detect_financial_service_fees(
     transaction: Transaction,
     all_transactions: list[Transaction],
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> bool:
     """
     Detects recurring financial service fees from apps like Albert, FloatMe, etc.
@@ -200,6 +241,7 @@ def detect_financial_service_fees(
     Args:
         transaction: The transaction to check
         all_transactions: List of all transactions to analyze for patterns
+        vendor_index: Optional index from build_vendor_index of all_transactions, built once and shared across calls
 
     Returns:
         True if the transaction appears to be a financial service fee, False otherwise
@@ -222,7 +264,7 @@ def detect_financial_service_fees(
         return False
 
     # Get all transactions from the same vendor
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
 
     # If we have 3+ transactions from the same financial service with the same amount,
     # it's likely a recurring service fee
@@ -297,10 +339,26 @@ def detect_financial_service_fees(
 #     return False
 
 
+# Patterns used by normalize_vendor_name, applied in this order
+_PHONE_DETAIL_PATTERNS = (
+    re.compile(r"\s+\d{3}-\d{3}-\d{4}\s+.*"),
+    re.compile(r"\s+\d{3}-\d{7}\s+.*"),
+    re.compile(r"\s+\d{10}\s+.*"),
+    re.compile(r"\s+\d{3}\-\d{4}\s+.*"),
+)
+_URL_DETAIL_PATTERN = re.compile(r"\s+[a-z0-9]+\.[a-z]{2,3}(/[a-z]+)?\s+.*")
+_CITY_STATE_PATTERN = re.compile(r"\s+[A-Za-z]+\s+[A-Z]{2}.*")
+_SPECIAL_CHAR_PATTERN = re.compile(r"[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8192)
 def normalize_vendor_name(name: str) -> str:
     """
     Normalize vendor names by removing common suffixes and extra spaces.
 
+    Vendor names repeat heavily, so results are cached.
+
     Args:
         name: The vendor name to normalize
 
@@ -319,20 +377,18 @@ def normalize_vendor_name(name: str) -> str:
             name = name[:index]
 
     # Remove phone numbers and location details in common formats
-    name = re.sub(r"\s+\d{3}-\d{3}-\d{4}\s+.*", "", name)
-    name = re.sub(r"\s+\d{3}-\d{7}\s+.*", "", name)
-    name = re.sub(r"\s+\d{10}\s+.*", "", name)
-    name = re.sub(r"\s+\d{3}\-\d{4}\s+.*", "", name)
+    for pattern in _PHONE_DETAIL_PATTERNS:
+        name = pattern.sub("", name)
 
     # Remove URLs and common transaction details
-    name = re.sub(r"\s+[a-z0-9]+\.[a-z]{2,3}(/[a-z]+)?\s+.*", "", name)
+    name = _URL_DETAIL_PATTERN.sub("", name)
 
     # Remove city and state patterns
-    name = re.sub(r"\s+[A-Za-z]+\s+[A-Z]{2}.*", "", name)
+    name = _CITY_STATE_PATTERN.sub("", name)
 
     # Remove special characters and all text after them
-    name = re.split(r"[^\w\s]", name)[0]
-    name = re.sub(r"\s+", " ", name)  # Replace multiple spaces with a single space
+    name = _SPECIAL_CHAR_PATTERN.split(name)[0]
+    name = _WHITESPACE_PATTERN.sub(" ", name)  # Replace multiple spaces with a single space
 
     # Remove extra spaces
     name = " ".join(name.split())
@@ -392,11 +448,11 @@ def detect_housing_payments(
 
     # Sort by date
     similar_txs.sort(key=lambda x: x.date)
-    dates = [parse_date(t.date) for t in similar_txs]
+    ordinals = [t.date_ordinal for t in similar_txs]
 
     # Check if transactions occur roughly monthly (15-45 days apart)
-    if len(dates) >= 2:
-        intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    if len(ordinals) >= 2:
+        intervals = [ordinals[i] - ordinals[i - 1] for i in range(1, len(ordinals))]
         monthly_intervals = [i for i in intervals if 15 <= i <= 45]
 
         # If at least half of the intervals are monthly, consider it a housing payment
@@ -444,6 +500,34 @@ def detect_housing_payments(
 #     return matches / len(vendor_txs)
 
 
+# Streaming service names, matched as substrings of the lowercased name in a single regex scan
+_STREAMING_SERVICES_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "netflix",
+            "hulu",
+            "disney+",
+            "disney plus",
+            "hbo max",
+            "paramount+",
+            "peacock",
+            "apple tv",
+            "amazon prime video",
+            "youtube premium",
+            "spotify",
+            "pandora",
+            "tidal",
+            "apple music",
+            "amazon music",
+            "deezer",
+            "youtube music",
+            "amazon kids+",
+        )
+    )
+)
+
+
 def detect_streaming_services(transaction: Transaction) -> bool:
     """
     Detects if the transaction is from a common streaming service.
@@ -454,28 +538,28 @@ def detect_streaming_services(transaction: Transaction) -> bool:
     Returns:
         True if it's a streaming service, False otherwise
     """
-    streaming_services = [
-        "netflix",
-        "hulu",
-        "disney+",
-        "disney plus",
-        "hbo max",
-        "paramount+",
-        "peacock",
-        "apple tv",
-        "amazon prime video",
-        "youtube premium",
-        "spotify",
-        "pandora",
-        "tidal",
-        "apple music",
-        "amazon music",
-        "deezer",
-        "youtube music",
-        "amazon kids+",
-    ]
-
-    return any(service in transaction.name.lower() for service in streaming_services)
+    return _STREAMING_SERVICES_PATTERN.search(transaction.name.lower()) is not None
+
+
+# Insurance keywords, matched the same way
+_INSURANCE_KEYWORDS_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "insurance",
+            "geico",
+            "progressive",
+            "allstate",
+            "state farm",
+            "farmers",
+            "liberty mutual",
+            "nationwide",
+            "root insurance",
+            "national general",
+            "usaa",
+        )
+    )
+)
 
 
 def detect_insurance_payments(transaction: Transaction) -> bool:
@@ -488,21 +572,7 @@ def detect_insurance_payments(transaction: Transaction) -> bool:
     Returns:
         True if it's an insurance payment, False otherwise
     """
-    insurance_keywords = [
-        "insurance",
-        "geico",
-        "progressive",
-        "allstate",
-        "state farm",
-        "farmers",
-        "liberty mutual",
-        "nationwide",
-        "root insurance",
-        "national general",
-        "usaa",
-    ]
-
-    return any(keyword in transaction.name.lower() for keyword in insurance_keywords)
+    return _INSURANCE_KEYWORDS_PATTERN.search(transaction.name.lower()) is not None
 
 
 # def detect_subscription_box(transaction: Transaction) -> bool:
@@ -675,6 +745,24 @@ def detect_insurance_payments(transaction: Transaction) -> bool:
 #     )
 
 
+# Merchants that are almost always subscriptions, matched the same way
+_RECURRING_MERCHANTS_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "kikoff",
+            "albert",
+            "amazon kids+",
+            "amazon music",
+            "microsoft xbox",
+            "apple",
+            "floatme",
+            "sezzle",
+        )
+    )
+)
+
+
 def is_likely_recurring_by_merchant(transaction: Transaction) -> bool:
     """
     Identifies merchants that are almost always recurring subscriptions.
@@ -685,24 +773,14 @@ def is_likely_recurring_by_merchant(transaction: Transaction) -> bool:
     Returns:
         True if this merchant is likely to be a recurring subscription
     """
-    recurring_merchants = [
-        "kikoff",
-        "albert",
-        "amazon kids+",
-        "amazon music",
-        "microsoft xbox",
-        "apple",
-        "floatme",
-        "sezzle",
-    ]
-
-    return any(merchant.lower() in transaction.name.lower() for merchant in recurring_merchants)
+    return _RECURRING_MERCHANTS_PATTERN.search(transaction.name.lower()) is not None
 
 
 def has_consistent_amount(
     transaction: Transaction,
     all_transactions: list[Transaction],
     exact_match: bool = True,
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> bool:
     """
     Checks if this transaction has the same amount as other transactions from the same merchant.
@@ -711,27 +789,28 @@ def has_consistent_amount(
         transaction: The transaction to check
         all_transactions: List of all transactions to analyze
         exact_match: Whether to require exact match or allow small variance
+        vendor_index: Optional index from build_vendor_index of all_transactions, built once and shared across calls
 
     Returns:
         True if the amount is consistent with other transactions from this merchant
     """
-    merchant_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    merchant_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
     if len(merchant_txs) <= 1:
         return False
 
     target_amount = transaction.amount
-    matches = 0
-    total = 0
+    # Amounts of the other transactions, skipping the transaction itself
+    amounts = np.fromiter((t.amount for t in merchant_txs if t.id != transaction.id), dtype=np.float64)
 
-    for t in merchant_txs:
-        if t.id != transaction.id:  # Skip comparing to self
-            total += 1
-            if (exact_match and t.amount == target_amount) or (
-                not exact_match and abs(t.amount - target_amount) / max(t.amount, target_amount) < 0.05
-            ):
-                matches += 1
+    if exact_match:
+        matches = np.count_nonzero(amounts == target_amount)
+    else:
+        # Two zero amounts give nan (not a match) rather than a ZeroDivisionError
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_diff = np.abs(amounts - target_amount) / np.maximum(amounts, target_amount)
+        matches = np.count_nonzero(relative_diff < 0.05)
 
-    return matches >= total * 0.75  # 75% or more match
+    return bool(matches >= amounts.size * 0.75)  # 75% or more match
 
 
 # def is_round_number_amount(transaction: Transaction) -> bool:
@@ -766,6 +845,7 @@ def has_regular_interval(
     transaction: Transaction,
     all_transactions: list[Transaction],
     max_variance_days: int = 5,
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> bool:
     """
     Checks if transactions from this merchant occur at regular intervals.
@@ -774,16 +854,17 @@ def has_regular_interval(
         transaction: The transaction to check
         all_transactions: List of all transactions to analyze
         max_variance_days: Maximum allowed variance in days between intervals
+        vendor_index: Optional index from build_vendor_index of all_transactions, built once and shared across calls
 
     Returns:
         True if transactions occur at regular intervals
     """
-    merchant_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    merchant_txs = _vendor_transactions(transaction, all_transactions, vendor_index)
     if len(merchant_txs) < 3:
         return False
 
-    dates = sorted([parse_date(t.date) for t in merchant_txs])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    ordinals = sorted([t.date_ordinal for t in merchant_txs])
+    intervals = [ordinals[i] - ordinals[i - 1] for i in range(1, len(ordinals))]
 
     if not intervals:
         return False
@@ -842,13 +923,22 @@ def has_regular_interval(
 def get_new_features(
     transaction: Transaction,
     all_transactions: list[Transaction],
+    vendor_index: dict[str, list[Transaction]] | None = None,
 ) -> dict[str, float]:
-    """Generate new features for the transaction."""
+    """Generate new features for the transaction.
+
+    vendor_index can be the precomputed build_vendor_index of all_transactions; callers scoring every
+    transaction of a list should build it once and pass it here.
+    """
+    if vendor_index is None:
+        vendor_index = build_vendor_index(all_transactions)
     return {
         "is_AT&T_": get_fixed_recurring("AT&T", transaction),
         "is_water_utility": get_fixed_recurring("Water", transaction),
-        "is_installment_payment": detect_installment_payments(transaction, all_transactions),
-        "is_financial_service_fee": detect_financial_service_fees(transaction, all_transactions),
+        "is_installment_payment": detect_installment_payments(transaction, all_transactions, vendor_index=vendor_index),
+        "is_financial_service_fee": detect_financial_service_fees(
+            transaction, all_transactions, vendor_index=vendor_index
+        ),
         # "is_variable_recurring": detect_variable_amount_recurring(
         #     transaction, all_transactions
         # ),
@@ -870,8 +960,8 @@ def get_new_features(
         # ),
         "is_recurring_merchant": is_likely_recurring_by_merchant(transaction),
         # "is_problem_merchant": is_common_misclassified_merchant(transaction),
-        "has_consistent_amount": has_consistent_amount(transaction, all_transactions),
+        "has_consistent_amount": has_consistent_amount(transaction, all_transactions, vendor_index=vendor_index),
         # "is_round_number": is_round_number_amount(transaction),
-        "has_regular_interval": has_regular_interval(transaction, all_transactions),
+        "has_regular_interval": has_regular_interval(transaction, all_transactions, vendor_index=vendor_index),
         # "prediction": simple_classifier(transaction, all_transactions),
     }
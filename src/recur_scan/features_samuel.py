@@ -3,59 +3,97 @@ import numpy as np
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
 
+_ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "amazon prime",
+    "apple music",
+    "microsoft 365",
+    "dropbox",
+    "adobe creative cloud",
+    "discord nitro",
+    "zoom subscription",
+    "patreon",
+    "new york times",
+    "wall street journal",
+    "github copilot",
+    "notion",
+    "evernote",
+    "expressvpn",
+    "nordvpn",
+    "youtube premium",
+    "linkedin premium",
+    "at&t",
+    "afterpay",
+    "amazon+",
+    "walmart+",
+    "amazonprime",
+    "t-mobile",
+    "duke energy",
+    "adobe",
+    "charter comm",
+    "boostmobile",
+    "verizon",
+    "disney+",
+})
+
 
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring because of the vendor name - check lowercase match"""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "amazon prime",
-        "apple music",
-        "microsoft 365",
-        "dropbox",
-        "adobe creative cloud",
-        "discord nitro",
-        "zoom subscription",
-        "patreon",
-        "new york times",
-        "wall street journal",
-        "github copilot",
-        "notion",
-        "evernote",
-        "expressvpn",
-        "nordvpn",
-        "youtube premium",
-        "linkedin premium",
-        "at&t",
-        "afterpay",
-        "amazon+",
-        "walmart+",
-        "amazonprime",
-        "t-mobile",
-        "duke energy",
-        "adobe",
-        "charter comm",
-        "boostmobile",
-        "verizon",
-        "disney+",
-    }
-    return transaction.name.lower() in always_recurring_vendors
-
-
-def get_transaction_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    return sum(1 for t in all_transactions if t.name.lower().strip() == transaction.name.lower().strip())
-
-
-def get_amount_std_dev(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    amounts = [t.amount for t in all_transactions if t.name.lower().strip() == transaction.name.lower().strip()]
-    return float(np.std(amounts, ddof=0)) if amounts else 0.0
-
-
-def get_median_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    amounts = [t.amount for t in all_transactions if t.name.lower().strip() == transaction.name.lower().strip()]
-    return float(np.median(amounts)) if amounts else 0.0
+    return transaction.name.lower() in _ALWAYS_RECURRING_VENDORS
+
+
+def _normalized_name(transaction: Transaction) -> str:
+    return transaction.name.lower().strip()
+
+
+def build_name_amounts(transactions: list[Transaction]) -> dict[str, np.ndarray]:
+    """Group the transaction amounts by normalized vendor name in a single pass, to share across feature calls."""
+    grouped: dict[str, list[float]] = {}
+    for t in transactions:
+        grouped.setdefault(_normalized_name(t), []).append(t.amount)
+    return {name: np.array(amounts, dtype=np.float64) for name, amounts in grouped.items()}
+
+
+def _vendor_amounts(
+    transaction: Transaction, all_transactions: list[Transaction], name_amounts: dict[str, np.ndarray] | None
+) -> np.ndarray:
+    """Amounts of the transactions with the same normalized name, from name_amounts when it is given."""
+    name = _normalized_name(transaction)
+    if name_amounts is not None:
+        return name_amounts.get(name, np.empty(0))
+    return np.array([t.amount for t in all_transactions if _normalized_name(t) == name], dtype=np.float64)
+
+
+def get_transaction_frequency(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    name_amounts: dict[str, np.ndarray] | None = None,
+) -> int:
+    """name_amounts can be the precomputed build_name_amounts of all_transactions."""
+    return int(_vendor_amounts(transaction, all_transactions, name_amounts).size)
+
+
+def get_amount_std_dev(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    name_amounts: dict[str, np.ndarray] | None = None,
+) -> float:
+    """name_amounts can be the precomputed build_name_amounts of all_transactions."""
+    amounts = _vendor_amounts(transaction, all_transactions, name_amounts)
+    return float(amounts.std()) if amounts.size else 0.0
+
+
+def get_median_transaction_amount(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    name_amounts: dict[str, np.ndarray] | None = None,
+) -> float:
+    """name_amounts can be the precomputed build_name_amounts of all_transactions."""
+    amounts = _vendor_amounts(transaction, all_transactions, name_amounts)
+    return float(np.median(amounts)) if amounts.size else 0.0
 
 
 def get_is_weekend_transaction(transaction: Transaction) -> bool:
@@ -1,33 +1,68 @@
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
-from statistics import median, stdev
+from functools import lru_cache
+
+import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import parse_date
+
+
+@dataclass(frozen=True)
+class AmountSummary:
+    """Summary statistics of a list of transaction amounts, computed together in one pass over an array."""
 
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    max: float = 0.0
+    min: float = 0.0
+    std: float = 0.0  # sample standard deviation; 0.0 with fewer than two amounts
 
-def get_total_transaction_amount(all_transactions: list[Transaction]) -> float:
+
+def build_amount_summary(all_transactions: list[Transaction]) -> AmountSummary:
+    """Summarize the transaction amounts once, so the amount getters below can share the result."""
+    if not all_transactions:
+        return AmountSummary()
+    amounts = np.fromiter((t.amount for t in all_transactions), dtype=np.float64, count=len(all_transactions))
+    total = float(amounts.sum())
+    return AmountSummary(
+        count=amounts.size,
+        total=total,
+        mean=total / amounts.size,
+        max=float(amounts.max()),
+        min=float(amounts.min()),
+        std=float(amounts.std(ddof=1)) if amounts.size > 1 else 0.0,
+    )
+
+
+def get_total_transaction_amount(all_transactions: list[Transaction], summary: AmountSummary | None = None) -> float:
     """Get the total amount of all transactions"""
-    return sum(t.amount for t in all_transactions)
+    if summary is None:
+        summary = build_amount_summary(all_transactions)
+    return summary.total
 
 
-def get_average_transaction_amount(all_transactions: list[Transaction]) -> float:
+def get_average_transaction_amount(all_transactions: list[Transaction], summary: AmountSummary | None = None) -> float:
     """Get the average amount of all transactions"""
-    if not all_transactions:
-        return 0.0
-    return sum(t.amount for t in all_transactions) / len(all_transactions)
+    if summary is None:
+        summary = build_amount_summary(all_transactions)
+    return summary.mean
 
 
-def get_max_transaction_amount(all_transactions: list[Transaction]) -> float:
+def get_max_transaction_amount(all_transactions: list[Transaction], summary: AmountSummary | None = None) -> float:
     """Get the maximum transaction amount"""
-    if not all_transactions:
-        return 0.0
-    return max(t.amount for t in all_transactions)
+    if summary is None:
+        summary = build_amount_summary(all_transactions)
+    return summary.max
 
 
-def get_min_transaction_amount(all_transactions: list[Transaction]) -> float:
+def get_min_transaction_amount(all_transactions: list[Transaction], summary: AmountSummary | None = None) -> float:
     """Get the minimum transaction amount"""
-    if not all_transactions:
-        return 0.0
-    return min(t.amount for t in all_transactions)
+    if summary is None:
+        summary = build_amount_summary(all_transactions)
+    return summary.min
 
 
 def get_transaction_count(all_transactions: list[Transaction]) -> int:
@@ -35,47 +70,79 @@ def get_transaction_count(all_transactions: list[Transaction]) -> int:
     return len(all_transactions)
 
 
-def get_transaction_amount_std(all_transactions: list[Transaction]) -> float:
+def get_transaction_amount_std(all_transactions: list[Transaction], summary: AmountSummary | None = None) -> float:
     """Get the standard deviation of transaction amounts"""
-    if len(all_transactions) < 2:  # Standard deviation requires at least two data points
-        return 0.0
-    return stdev(t.amount for t in all_transactions)
+    # Standard deviation requires at least two data points; the summary reports 0.0 otherwise
+    if summary is None:
+        summary = build_amount_summary(all_transactions)
+    return summary.std
 
 
 def get_transaction_amount_median(all_transactions: list[Transaction]) -> float:
     """Get the median transaction amount"""
     if not all_transactions:
         return 0.0
-    return median(t.amount for t in all_transactions)
+    n = len(all_transactions)
+    amounts = np.fromiter((t.amount for t in all_transactions), dtype=np.float64, count=n)
+    # Partition around the middle position(s) instead of sorting every amount
+    k = n // 2
+    if n % 2:
+        return float(np.partition(amounts, k)[k])
+    middle = np.partition(amounts, (k - 1, k))
+    return float((middle[k - 1] + middle[k]) / 2)
 
 
-def get_transaction_amount_range(all_transactions: list[Transaction]) -> float:
+def get_transaction_amount_range(all_transactions: list[Transaction], summary: AmountSummary | None = None) -> float:
     """Get the range of transaction amounts (max - min)"""
-    if not all_transactions:
-        return 0.0
-    return max(t.amount for t in all_transactions) - min(t.amount for t in all_transactions)
+    if summary is None:
+        summary = build_amount_summary(all_transactions)
+    return summary.max - summary.min
+
 
+def build_amount_counts(all_transactions: list[Transaction]) -> Counter[float]:
+    """Count the transactions at each amount once, so per-transaction lookups don't rescan the list."""
+    return Counter(t.amount for t in all_transactions)
 
-def get_unique_transaction_amount_count(all_transactions: list[Transaction]) -> int:
+
+def get_unique_transaction_amount_count(
+    all_transactions: list[Transaction], amount_counts: Counter[float] | None = None
+) -> int:
     """Get the number of unique transaction amounts"""
-    return len({t.amount for t in all_transactions})
+    if amount_counts is None:
+        amount_counts = build_amount_counts(all_transactions)
+    return len(amount_counts)
 
 
-def get_transaction_amount_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_transaction_amount_frequency(
+    transaction: Transaction, all_transactions: list[Transaction], amount_counts: Counter[float] | None = None
+) -> int:
     """Get the frequency of the transaction amount in all transactions"""
-    return sum(1 for t in all_transactions if t.amount == transaction.amount)
+    if amount_counts is None:
+        amount_counts = build_amount_counts(all_transactions)
+    return amount_counts[transaction.amount]
 
 
 def get_transaction_day_of_week(transaction: Transaction) -> int:
     """Get the day of the week for the transaction (0=Monday, 6=Sunday)"""
-    return datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
+    return parse_date(transaction.date).weekday()
 
 
-def get_transaction_time_of_day(transaction: Transaction) -> int:
-    """Get the time of day for the transaction (morning, afternoon, evening, night)"""
+@lru_cache(maxsize=4096)
+def _parse_hour(date_str: str) -> int:
+    """Hour of a "%Y-%m-%d %H:%M:%S" timestamp; -1 when the string has no time.
+
+    Cached because plain YYYY-MM-DD dates always fail this parse, and the exception is the slow part.
+    """
     try:
-        hour = datetime.strptime(transaction.date, "%Y-%m-%d %H:%M:%S").hour
+        return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S").hour
     except ValueError:
+        return -1
+
+
+def get_transaction_time_of_day(transaction: Transaction) -> int:
+    """Get the time of day for the transaction (morning, afternoon, evening, night)"""
+    hour = _parse_hour(transaction.date)
+    if hour < 0:
         return -1  # Default value for missing time
 
     if 6 <= hour < 12:
@@ -92,11 +159,6 @@ def get_average_transaction_interval(all_transactions: list[Transaction]) -> flo
     """Get the average time interval (in days) between transactions"""
     if len(all_transactions) < 2:
         return 0.0
-    intervals = [
-        (
-            datetime.strptime(all_transactions[i].date, "%Y-%m-%d")
-            - datetime.strptime(all_transactions[i - 1].date, "%Y-%m-%d")
-        ).days
-        for i in range(1, len(all_transactions))
-    ]
-    return sum(intervals) / len(intervals)
+    # Consecutive gaps in list order sum to the span from the first transaction to the last
+    span = (parse_date(all_transactions[-1].date) - parse_date(all_transactions[0].date)).days
+    return span / (len(all_transactions) - 1)
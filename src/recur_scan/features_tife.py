@@ -1,86 +1,108 @@
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from datetime import date
-from typing import cast
+from bisect import bisect_left
 
 import numpy as np
 from numpy import ndarray
-from scipy.stats import mode
 
+from recur_scan.table import TransactionTable
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
 
+# The aggregate features take either the transaction list or its columnar TransactionTable
+type Transactions = list[Transaction] | TransactionTable
+
+
+def _amounts(all_transactions: Transactions) -> ndarray:
+    if isinstance(all_transactions, TransactionTable):
+        return all_transactions.amounts
+    return np.fromiter((t.amount for t in all_transactions), dtype=np.float64, count=len(all_transactions))
+
+
+def _day_numbers(all_transactions: Transactions) -> ndarray:
+    """Sorted transaction dates as integer day numbers, so day gaps are plain differences."""
+    if isinstance(all_transactions, TransactionTable):
+        return np.sort(all_transactions.dates.astype(np.int64))
+    days = np.fromiter((t.date_ordinal for t in all_transactions), dtype=np.int64, count=len(all_transactions))
+    days.sort()
+    return days
 
-def get_transaction_frequency(all_transactions: list[Transaction]) -> float:
+
+def get_transaction_frequency(all_transactions: Transactions) -> float:
     if len(all_transactions) < 2:
         return 0.0
-    dates: list[date] = sorted([parse_date(t.date) for t in all_transactions])
-    intervals: list[int] = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    return float(np.mean(intervals)) if intervals else 0.0
+    return float(np.diff(_day_numbers(all_transactions)).mean())
 
 
-def get_interval_consistency(all_transactions: list[Transaction]) -> float:
+def get_interval_consistency(all_transactions: Transactions) -> float:
     if len(all_transactions) < 2:
         return 0.0
-    dates: list[date] = sorted([parse_date(t.date) for t in all_transactions])
-    intervals: list[int] = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    return float(np.std(intervals)) if intervals else 0.0
+    return float(np.diff(_day_numbers(all_transactions)).std())
 
 
-def get_amount_variability(all_transactions: list[Transaction]) -> float:
+def get_amount_variability(all_transactions: Transactions) -> float:
     if not all_transactions:
         return 0.0
-    amounts: list[float] = [t.amount for t in all_transactions]
-    mean_amount: float = float(np.mean(amounts))
-    return float(np.std(amounts) / mean_amount) if mean_amount > 0 else 0.0
+    amounts = _amounts(all_transactions)
+    mean_amount = float(amounts.mean())
+    return float(amounts.std()) / mean_amount if mean_amount > 0 else 0.0
 
 
-def get_amount_range(all_transactions: list[Transaction]) -> float:
-    amounts = [t.amount for t in all_transactions]
-    return max(amounts) - min(amounts) if amounts else 0.0
+def get_amount_range(all_transactions: Transactions) -> float:
+    if not all_transactions:
+        return 0.0
+    amounts = _amounts(all_transactions)
+    return float(amounts.max() - amounts.min())
 
 
-def get_transaction_count(all_transactions: list[Transaction]) -> int:
+def get_transaction_count(all_transactions: Transactions) -> int:
     return len(all_transactions)
 
 
-def get_interval_mode(all_transactions: list[Transaction]) -> float:
+def _interval_counts(all_transactions: Transactions) -> ndarray:
+    """Histogram of the day gaps between consecutive transaction dates, indexed by gap length.
+
+    Padded to cover the monthly (28-31 day) bin, so fixed bins can be sliced without bounds checks.
+    """
+    return np.bincount(np.diff(_day_numbers(all_transactions)), minlength=32)
+
+
+def get_interval_mode(all_transactions: Transactions) -> float:
     if len(all_transactions) < 2:
         return 0.0
-    dates = sorted([parse_date(t.date) for t in all_transactions])
-    intervals: list[int] = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    if not intervals:
-        return 0.0
-    mode_result = mode(intervals, keepdims=True)
-    mode_array = cast(ndarray, mode_result.mode)
-    if mode_array.size > 0:
-        mode_value = int(mode_array.item(0))  # type: ignore[call-overload, operator]
-        return float(mode_value)
-    return 0.0
+    # argmax picks the shortest gap among ties, as scipy.stats.mode did
+    return float(_interval_counts(all_transactions).argmax())
 
 
-def get_normalized_interval_consistency(all_transactions: list[Transaction]) -> float:
+def get_normalized_interval_consistency(all_transactions: Transactions) -> float:
     if len(all_transactions) < 2:
         return 0.0
-    dates = sorted([parse_date(t.date) for t in all_transactions])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    mean_interval = float(np.mean(intervals)) if intervals else 0.0
-    # return float(np.std(intervals) / mean_interval) if mean_interval > 0 else 0.0
-    std_dev = float(np.std(intervals)) if intervals else 0.0  # Ensure type is float
+    intervals = np.diff(_day_numbers(all_transactions))
+    mean_interval = float(intervals.mean())
+    std_dev = float(intervals.std())
     return std_dev / mean_interval if mean_interval > 0 else 0.0
 
 
-def get_days_since_last_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    prior_transactions = [
-        t
-        for t in all_transactions
-        if parse_date(t.date) < parse_date(transaction.date) and t.amount == transaction.amount
-    ]
-    if not prior_transactions:
-        return -1.0
-    last_date = max([parse_date(t.date) for t in prior_transactions])
-    return (parse_date(transaction.date) - last_date).days
+def build_amount_dates(transactions: list[Transaction]) -> dict[float, ndarray]:
+    """Group the sorted date ordinals of the transactions by amount in a single pass, to share across feature calls."""
+    grouped: dict[float, list[int]] = {}
+    for t in transactions:
+        grouped.setdefault(t.amount, []).append(t.date_ordinal)
+    return {amount: np.sort(np.array(ordinals, dtype=np.int64)) for amount, ordinals in grouped.items()}
+
+
+def get_days_since_last_same_amount(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    amount_dates: dict[float, ndarray] | None = None,
+) -> float:
+    """amount_dates can be the precomputed build_amount_dates of all_transactions."""
+    current = transaction.date_ordinal
+    if amount_dates is not None:
+        ordinals = amount_dates.get(transaction.amount, np.empty(0, dtype=np.int64))
+        # Sorted, so the latest earlier date sits just before the insertion point of the current one
+        n_prior = int(np.searchsorted(ordinals, current))
+        return current - int(ordinals[n_prior - 1]) if n_prior else -1.0
+    prior = [t.date_ordinal for t in all_transactions if t.amount == transaction.amount and t.date_ordinal < current]
+    return current - max(prior) if prior else -1.0
 
 
 def get_amount_relative_change(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -91,64 +113,116 @@ def get_amount_relative_change(transaction: Transaction, all_transactions: list[
     return (transaction.amount - last_amount) / last_amount if last_amount > 0 else 0.0
 
 
-def get_merchant_name_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    return sum(1 for t in all_transactions if t.name == transaction.name)
+def build_merchant_amounts(transactions: list[Transaction]) -> dict[str, ndarray]:
+    """Group the transaction amounts by merchant name in a single pass, to share across feature calls."""
+    grouped: dict[str, list[float]] = {}
+    for t in transactions:
+        grouped.setdefault(t.name, []).append(t.amount)
+    return {name: np.array(amounts, dtype=np.float64) for name, amounts in grouped.items()}
+
 
+def _merchant_amounts(
+    transaction: Transaction, all_transactions: list[Transaction], merchant_amounts: dict[str, ndarray] | None
+) -> ndarray:
+    if merchant_amounts is not None:
+        return merchant_amounts.get(transaction.name, np.empty(0))
+    return np.array([t.amount for t in all_transactions if t.name == transaction.name], dtype=np.float64)
 
-def get_interval_histogram(all_transactions: list[Transaction]) -> dict[str, float]:
+
+def get_merchant_name_frequency(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    merchant_amounts: dict[str, ndarray] | None = None,
+) -> int:
+    return int(_merchant_amounts(transaction, all_transactions, merchant_amounts).size)
+
+
+def get_interval_histogram(all_transactions: Transactions) -> dict[str, float]:
     if len(all_transactions) < 2:
         return {"biweekly": 0.0, "monthly": 0.0}
-    dates = sorted([parse_date(t.date) for t in all_transactions])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    biweekly = sum(1 for i in intervals if 13 <= i <= 15) / len(intervals) if intervals else 0.0
-    monthly = sum(1 for i in intervals if 28 <= i <= 31) / len(intervals) if intervals else 0.0
+    counts = _interval_counts(all_transactions)
+    n_intervals = len(all_transactions) - 1
+    biweekly = int(counts[13:16].sum()) / n_intervals
+    monthly = int(counts[28:32].sum()) / n_intervals
     return {"biweekly": biweekly, "monthly": monthly}
 
 
-def get_amount_stability_score(all_transactions: list[Transaction]) -> float:
+def get_amount_stability_score(all_transactions: Transactions) -> float:
     if not all_transactions:
         return 0.0
-    amounts = [t.amount for t in all_transactions]
-    mean = np.mean(amounts)
-    std = np.std(amounts)
-    return sum(1 for a in amounts if abs(a - mean) <= std) / len(amounts) if std > 0 else 1.0
+    amounts = _amounts(all_transactions)
+    std = amounts.std()
+    if std <= 0:
+        return 1.0
+    # Share of amounts within one standard deviation of the mean
+    return int(np.count_nonzero(np.abs(amounts - amounts.mean()) <= std)) / amounts.size
 
 
-def get_dominant_interval_strength(all_transactions: list[Transaction]) -> float:
+def get_dominant_interval_strength(all_transactions: Transactions) -> float:
     if len(all_transactions) < 2:
         return 0.0
-    dates = sorted([parse_date(t.date) for t in all_transactions])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    if not intervals:
-        return 0.0
-    bins = [(6, 8), (13, 15), (28, 31)]
-    counts = [sum(1 for i in intervals if lo <= i <= hi) for lo, hi in bins]
-    max_count = max(counts) if counts else 0
-    return max_count / len(intervals) if intervals else 0.0
+    counts = _interval_counts(all_transactions)
+    # Weekly (6-8), biweekly (13-15) and monthly (28-31) day bins
+    max_count = max(int(counts[6:9].sum()), int(counts[13:16].sum()), int(counts[28:32].sum()))
+    return max_count / (len(all_transactions) - 1)
+
+
+def _near_amount_mask(amounts: ndarray, reference: float, threshold: float) -> ndarray:
+    """Which amounts lie within threshold of reference, relative to reference (floored at 0.01)."""
+    mask: ndarray = np.abs(amounts - reference) / max(reference, 0.01) <= threshold
+    return mask
+
+
+def _near_amount_count(sorted_amounts: list[float], reference: float, threshold: float) -> int:
+    """How many of the ascending amounts _near_amount_mask would select, found by bisection.
+
+    The relative difference only grows moving away from reference on either side, so the near amounts form one run.
+    """
+    scale = max(reference, 0.01)
+
+    def _near(amount: float) -> bool:
+        return abs(amount - reference) / scale <= threshold
+
+    start = bisect_left(sorted_amounts, True, key=lambda amount: amount >= reference or _near(amount))
+    stop = bisect_left(sorted_amounts, True, key=lambda amount: amount > reference and not _near(amount))
+    return stop - start
+
+
+def build_sorted_amounts(transactions: list[Transaction]) -> list[float]:
+    """Sort the transaction amounts once, so near-amount counts can bisect them across feature calls.
+
+    A list rather than an array, since bisection reads single elements and list indexing is cheaper.
+    """
+    return sorted(t.amount for t in transactions)
 
 
 def get_near_amount_consistency(
-    transaction: Transaction, all_transactions: list[Transaction], threshold: float = 0.05
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    threshold: float = 0.05,
+    sorted_amounts: list[float] | None = None,
 ) -> float:
+    """sorted_amounts can be the precomputed build_sorted_amounts of all_transactions."""
     if not all_transactions:
         return 0.0
-    amounts = [t.amount for t in all_transactions]
-    similar = sum(1 for a in amounts if abs(a - transaction.amount) / max(transaction.amount, 0.01) <= threshold)
-    return similar / len(amounts)
+    if sorted_amounts is not None:
+        similar = _near_amount_count(sorted_amounts, transaction.amount, threshold)
+    else:
+        similar = int(np.count_nonzero(_near_amount_mask(_amounts(all_transactions), transaction.amount, threshold)))
+    return similar / len(all_transactions)
 
 
 def get_merchant_amount_signature(
-    transaction: Transaction, all_transactions: list[Transaction], threshold: float = 0.05
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    threshold: float = 0.05,
+    merchant_amounts: dict[str, ndarray] | None = None,
 ) -> float:
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    if not merchant_transactions:
+    amounts = _merchant_amounts(transaction, all_transactions, merchant_amounts)
+    if amounts.size == 0:
         return 0.0
-    similar = sum(
-        1
-        for t in merchant_transactions
-        if abs(t.amount - transaction.amount) / max(transaction.amount, 0.01) <= threshold
-    )
-    return similar / len(merchant_transactions)
+    similar = np.count_nonzero(_near_amount_mask(amounts, transaction.amount, threshold))
+    return int(similar) / amounts.size
 
 
 def get_amount_cluster_count(
@@ -156,21 +230,16 @@ def get_amount_cluster_count(
 ) -> int:
     if len(all_transactions) < 2:
         return 0
-    amounts = [t.amount for t in all_transactions]
-    dates = sorted([parse_date(t.date) for t in all_transactions])
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    cluster_count = 0
-    for i, a in enumerate(amounts):
-        if abs(a - transaction.amount) / max(transaction.amount, 0.01) <= threshold and i > 0 and intervals[i - 1] > 5:
-            cluster_count += 1
-    return cluster_count
+    near = _near_amount_mask(_amounts(all_transactions), transaction.amount, threshold)
+    ordinals = np.fromiter((t.date_ordinal for t in all_transactions), dtype=np.int64, count=len(all_transactions))
+    ordinals.sort()
+    # The i-th amount (in list order) is paired with the gap ending at the i-th date (in date order)
+    return int(np.count_nonzero(near[1:] & (np.diff(ordinals) > 5)))
 
 
-def get_transaction_density(all_transactions: list[Transaction]) -> float:
-    if not all_transactions:
-        return 0.0
-    dates = [parse_date(t.date) for t in all_transactions]
-    if len(dates) < 2:
+def get_transaction_density(all_transactions: Transactions) -> float:
+    if len(all_transactions) < 2:
         return 0.0
-    time_span = (max(dates) - min(dates)).days
+    days = _day_numbers(all_transactions)
+    time_span = int(days[-1] - days[0])
     return len(all_transactions) / time_span if time_span > 0 else 0.0
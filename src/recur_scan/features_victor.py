@@ -1,15 +1,10 @@
-from datetime import datetime
-
 from recur_scan.transactions import Transaction
+from recur_scan.utils import parse_date
 
 
 def get_avg_days_between(all_transactions: list[Transaction]) -> float:
-    dates = sorted([t.date for t in all_transactions])
-    if len(dates) > 1:
-        deltas = [
-            (datetime.strptime(dates[i + 1], "%Y-%m-%d") - datetime.strptime(dates[i], "%Y-%m-%d")).days
-            for i in range(len(dates) - 1)
-        ]
-        return sum(deltas) / len(deltas)
-    else:
+    if len(all_transactions) < 2:
         return 0.0
+    # The gaps between sorted dates sum to the span from the first date to the last
+    dates = [t.date for t in all_transactions]
+    return (parse_date(max(dates)) - parse_date(min(dates))).days / (len(dates) - 1)
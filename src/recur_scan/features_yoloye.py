@@ -1,16 +1,48 @@
-from datetime import datetime
+import numpy as np
+from numpy import ndarray
 
 from recur_scan.features_original import get_n_transactions_days_apart
 from recur_scan.transactions import Transaction
 
 
-def _get_days(date: str) -> int:
-    """Convert a date string (YYYY-MM-DD) into days since epoch (Jan 1, 1970)."""
-    return (datetime.strptime(date, "%Y-%m-%d") - datetime(1970, 1, 1)).days
+def build_sorted_ordinals(transactions: list[Transaction]) -> ndarray:
+    """Sort the transaction date ordinals once, so the delayed and early counts can bisect them across feature calls."""
+    ordinals = np.fromiter((t.date_ordinal for t in transactions), dtype=np.int64, count=len(transactions))
+    ordinals.sort()
+    return ordinals
+
+
+def _count_in_window(sorted_ordinals: ndarray, first: int, last: int) -> int:
+    """Count the sorted ordinals between first and last (inclusive)."""
+    start = np.searchsorted(sorted_ordinals, first, side="left")
+    return int(np.searchsorted(sorted_ordinals, last, side="right") - start)
+
+
+def _count_days_after(
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    low: int,
+    high: int,
+    sorted_ordinals: ndarray | None,
+) -> int:
+    """Count the transactions dated between low and high days (inclusive) after the given transaction."""
+    if not all_transactions:
+        return 0
+    base = transaction.date_ordinal
+    if sorted_ordinals is not None:
+        return _count_in_window(sorted_ordinals, base + low, base + high)
+    days_diff = (
+        np.fromiter((t.date_ordinal for t in all_transactions), dtype=np.int64, count=len(all_transactions)) - base
+    )
+    return int(np.count_nonzero((days_diff >= low) & (days_diff <= high)))
 
 
 def get_n_transactions_delayed(
-    transaction: Transaction, all_transactions: list[Transaction], expected_interval: int, max_delay: int = 5
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    expected_interval: int,
+    max_delay: int = 5,
+    sorted_ordinals: ndarray | None = None,
 ) -> int:
     """
     Count how many times a transaction happens later than expected but still follows a pattern.
@@ -19,56 +51,103 @@ def get_n_transactions_delayed(
     - all_transactions: List of all transactions.
     - expected_interval: The expected number of days between transactions (e.g., 30 for monthly).
     - max_delay: The number of extra days allowed (default is 5 days).
+    - sorted_ordinals: Optional precomputed build_sorted_ordinals of all_transactions.
     Returns:
     - Number of delayed transactions that still fit the expected interval.
     """
-    n_txs = 0
-    transaction_days = _get_days(transaction.date)
-
-    for t in all_transactions:
-        t_days = _get_days(t.date)
-        days_diff = t_days - transaction_days
-
-        # Check if the transaction is within the delayed period
-        if expected_interval <= days_diff <= expected_interval + max_delay:
-            n_txs += 1
-
-    return n_txs
+    return _count_days_after(
+        transaction, all_transactions, expected_interval, expected_interval + max_delay, sorted_ordinals
+    )
+
+
+# Expected interval and max delay of each predefined period, as used by the get_delayed_* functions below
+DELAYED_PERIODS: dict[str, tuple[int, int]] = {
+    "weekly": (7, 2),
+    "fortnightly": (14, 3),
+    "monthly": (30, 5),
+    "quarterly": (90, 7),
+    "semi_annual": (180, 10),
+    "annual": (365, 15),
+}
+# The same windows as day offsets from the reference date, to query every period in one searchsorted call
+_DELAYED_STARTS = np.array([interval for interval, _ in DELAYED_PERIODS.values()], dtype=np.int64)
+_DELAYED_ENDS = np.array([interval + max_delay for interval, max_delay in DELAYED_PERIODS.values()], dtype=np.int64)
+
+
+def get_delayed_counts(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> dict[str, int]:
+    """Count the delayed transactions of every predefined period at once, keyed by period name.
+
+    Matches calling each get_delayed_* function, but reads the transaction's date only once.
+    sorted_ordinals can be the precomputed build_sorted_ordinals of all_transactions.
+    """
+    if not all_transactions:
+        return dict.fromkeys(DELAYED_PERIODS, 0)
+    if sorted_ordinals is None:
+        sorted_ordinals = build_sorted_ordinals(all_transactions)
+    base = transaction.date_ordinal
+    counts = np.searchsorted(sorted_ordinals, base + _DELAYED_ENDS, side="right") - np.searchsorted(
+        sorted_ordinals, base + _DELAYED_STARTS, side="left"
+    )
+    return dict(zip(DELAYED_PERIODS, counts.tolist(), strict=True))
 
 
 # 🚀 Predefined Intervals for Recurring Transactions
-def get_delayed_weekly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_delayed_weekly(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> int:
     """Find delayed weekly transactions (7 days ± 2 days)."""
-    return get_n_transactions_delayed(transaction, all_transactions, expected_interval=7, max_delay=2)
+    expected_interval, max_delay = DELAYED_PERIODS["weekly"]
+    return get_n_transactions_delayed(transaction, all_transactions, expected_interval, max_delay, sorted_ordinals)
 
 
-def get_delayed_fortnightly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_delayed_fortnightly(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> int:
     """Find delayed fortnightly transactions (14 days ± 3 days)."""
-    return get_n_transactions_delayed(transaction, all_transactions, expected_interval=14, max_delay=3)
+    expected_interval, max_delay = DELAYED_PERIODS["fortnightly"]
+    return get_n_transactions_delayed(transaction, all_transactions, expected_interval, max_delay, sorted_ordinals)
 
 
-def get_delayed_monthly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_delayed_monthly(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> int:
     """Find delayed monthly transactions (30 days ± 5 days)."""
-    return get_n_transactions_delayed(transaction, all_transactions, expected_interval=30, max_delay=5)
+    expected_interval, max_delay = DELAYED_PERIODS["monthly"]
+    return get_n_transactions_delayed(transaction, all_transactions, expected_interval, max_delay, sorted_ordinals)
 
 
-def get_delayed_quarterly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_delayed_quarterly(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> int:
     """Find delayed quarterly transactions (90 days ± 7 days)."""
-    return get_n_transactions_delayed(transaction, all_transactions, expected_interval=90, max_delay=7)
+    expected_interval, max_delay = DELAYED_PERIODS["quarterly"]
+    return get_n_transactions_delayed(transaction, all_transactions, expected_interval, max_delay, sorted_ordinals)
 
 
-def get_delayed_semi_annual(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_delayed_semi_annual(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> int:
     """Find delayed semi-annual transactions (180 days ± 10 days)."""
-    return get_n_transactions_delayed(transaction, all_transactions, expected_interval=180, max_delay=10)
+    expected_interval, max_delay = DELAYED_PERIODS["semi_annual"]
+    return get_n_transactions_delayed(transaction, all_transactions, expected_interval, max_delay, sorted_ordinals)
 
 
-def get_delayed_annual(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_delayed_annual(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> int:
     """Find delayed annual transactions (365 days ± 15 days)."""
-    return get_n_transactions_delayed(transaction, all_transactions, expected_interval=365, max_delay=15)
+    expected_interval, max_delay = DELAYED_PERIODS["annual"]
+    return get_n_transactions_delayed(transaction, all_transactions, expected_interval, max_delay, sorted_ordinals)
 
 
 def get_n_transactions_early(
-    transaction: Transaction, all_transactions: list[Transaction], expected_interval: int, max_early: int = 5
+    transaction: Transaction,
+    all_transactions: list[Transaction],
+    expected_interval: int,
+    max_early: int = 5,
+    sorted_ordinals: ndarray | None = None,
 ) -> int:
     """
     Count how many times a transaction happens earlier than expected but still follows a pattern.
@@ -77,26 +156,23 @@ def get_n_transactions_early(
     - all_transactions: List of all transactions.
     - expected_interval: The expected number of days between transactions (e.g., 30 for monthly).
     - max_early: The number of days a transaction can occur earlier than expected (default is 5 days).
+    - sorted_ordinals: Optional precomputed build_sorted_ordinals of all_transactions.
     Returns:
     - Number of early transactions that still fit the expected interval.
     """
-    n_txs = 0
-    transaction_days = _get_days(transaction.date)
+    # Day differences are whole days, so "before the expected interval" ends one day short of it
+    return _count_days_after(
+        transaction, all_transactions, expected_interval - max_early, expected_interval - 1, sorted_ordinals
+    )
 
-    for t in all_transactions:
-        t_days = _get_days(t.date)
-        days_diff = t_days - transaction_days
 
-        # Check if the transaction occurs before the expected interval
-        if expected_interval - max_early <= days_diff < expected_interval:
-            n_txs += 1
-
-    return n_txs
-
-
-def get_early_weekly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_early_weekly(
+    transaction: Transaction, all_transactions: list[Transaction], sorted_ordinals: ndarray | None = None
+) -> int:
     """Detects early weekly payments (7 days - 2 days = within 5-6 days)."""
-    return get_n_transactions_early(transaction, all_transactions, expected_interval=7, max_early=2)
+    return get_n_transactions_early(
+        transaction, all_transactions, expected_interval=7, max_early=2, sorted_ordinals=sorted_ordinals
+    )
 
 
 def get_early_fortnightly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from recur_scan.transactions import Transaction
+
+
+@dataclass(frozen=True)
+class TransactionTable:
+    """Column-oriented view of a list of transactions.
+
+    Each field holds one attribute for every transaction, in the order the transactions were given,
+    so per-merchant aggregations become boolean masks and NumPy reductions instead of Python loops
+    over Transaction objects.
+    """
+
+    ids: np.ndarray
+    user_ids: np.ndarray  # object (str)
+    names: np.ndarray  # object (str)
+    name_codes: np.ndarray  # int32 index into name_categories
+    name_categories: pd.Index  # distinct merchant names
+    amounts: np.ndarray  # float64
+    dates: np.ndarray  # datetime64[D]
+
+    @classmethod
+    def from_transactions(cls, transactions: list[Transaction]) -> "TransactionTable":
+        """Build a table from a list of transactions, keeping their order."""
+        n = len(transactions)
+        names = np.array([t.name for t in transactions], dtype=object)
+        # Encode names once so merchant filters compare integers rather than strings
+        categorical = pd.Categorical(names)
+        return cls(
+            ids=np.array([t.id for t in transactions]),
+            user_ids=np.array([t.user_id for t in transactions], dtype=object),
+            names=names,
+            name_codes=categorical.codes.astype(np.int32),
+            name_categories=categorical.categories,
+            amounts=np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n),
+            dates=np.array([t.parsed_date for t in transactions], dtype="datetime64[D]"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def name_code(self, name: str) -> int:
+        """Integer code of a merchant name in name_codes; -1 if the name is not in the table."""
+        return int(self.name_categories.get_indexer([name])[0])
+
+    def merchant_mask(self, user_id: str, name: str) -> np.ndarray:
+        """Boolean mask of the rows belonging to the given user and merchant."""
+        mask: np.ndarray = self.name_codes == self.name_code(name)
+        # Only rows that already matched the merchant need the string compare on user id
+        mask[mask] = self.user_ids[mask] == user_id
+        return mask
+
+    def merchant_amount_std(self, user_id: str, name: str) -> float:
+        """Standard deviation of the merchant's amounts divided by their mean; 0.0 if the mean is not positive.
+
+        Matches merchant_amount_std_feature in features_laurels given the merchant's amount statistics.
+        """
+        amounts = self.amounts[self.merchant_mask(user_id, name)]
+        if amounts.size == 0:
+            return 0.0
+        mean = float(amounts.mean())
+        return float(amounts.std()) / mean if mean > 0 else 0.0
+
+    def rolling_amount_mean(self, user_id: str, name: str, window: int = 3) -> float:
+        """Mean of the last `window` amounts for the user and merchant; 0.0 if there are none.
+
+        Matches rolling_amount_mean_feature in features_laurels on the same transactions.
+        """
+        amounts = self.amounts[self.merchant_mask(user_id, name)][-window:]
+        return float(amounts.mean()) if amounts.size else 0.0
+
+    def identical_transaction_ratio(self, transaction: Transaction) -> float:
+        """Share of all rows with the same user, merchant and amount as the transaction.
+
+        Matches identical_transaction_ratio_feature in features_laurels when the table holds all transactions.
+        """
+        if len(self) == 0:
+            return 0.0
+        mask = self.merchant_mask(transaction.user_id, transaction.name) & (self.amounts == transaction.amount)
+        return int(np.count_nonzero(mask)) / len(self)
@@ -1,12 +1,15 @@
 import csv
+import datetime
 import os
 from collections import defaultdict
 from dataclasses import asdict, dataclass, fields
 
 from loguru import logger
 
+from recur_scan.utils import parse_date
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Transaction:
     id: int  # unique identifier
     user_id: str  # user id
@@ -14,6 +17,16 @@ class Transaction:
     date: str  # date of the transaction
     amount: float  # amount of the transaction
 
+    @property
+    def parsed_date(self) -> datetime.date:
+        """The transaction date, parsed through the shared parse_date cache."""
+        return parse_date(self.date)
+
+    @property
+    def date_ordinal(self) -> int:
+        """The transaction date as a proleptic Gregorian ordinal, so day gaps are plain integer differences."""
+        return parse_date(self.date).toordinal()
+
 
 # Create a type alias for grouped transactions that maps a tuple of (user_id, name) to a list of transactions
 type GroupedTransactions = dict[tuple[str, str], list[Transaction]]
@@ -2,12 +2,24 @@ from datetime import date, datetime
 from functools import lru_cache
 
 
-@lru_cache(maxsize=1024)
-def parse_date(date_str: str) -> date:
-    """Parse a date string into a datetime.date object."""
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str | date) -> date:
+    """Parse a date string into a datetime.date object; date objects are returned as dates without reparsing."""
+    if isinstance(date_str, datetime):
+        return date_str.date()
+    if isinstance(date_str, date):
+        return date_str
+    # Fast path for the zero-padded YYYY-MM-DD strings in the data through the C ISO parser. The shape check keeps
+    # out the other ISO forms it accepts, and anything it rejects goes through strptime for the usual error messages.
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
+@lru_cache(maxsize=4096)
 def get_day(date: str) -> int:
     """Get the day of the month from a transaction date."""
     return int(date.split("-")[2])
@@ -0,0 +1,82 @@
+"""Transaction lists, and the create_transaction helper that builds them, shared across test modules.
+
+Each one is built once per session and returned as a tuple, so a feature that sorts its input in place
+cannot reorder it for later tests; pass list(...) where a list is required.
+"""
+
+import pytest
+
+from recur_scan.transactions import Transaction
+
+
+def _create_transaction(id, user_id, name, date, amount):
+    return Transaction(id=id, user_id=user_id, name=name, date=date, amount=amount)
+
+
+@pytest.fixture(scope="session")
+def create_transaction():
+    """Build a Transaction from positional fields; requested by the test modules that share this helper."""
+    return _create_transaction
+
+
+@pytest.fixture(scope="session")
+def mixed_vendor_txns() -> tuple[Transaction, ...]:
+    """Vendor, mobile carrier and one-off transactions shared by the interval and mobile tests."""
+    return (
+        Transaction(id=1, user_id="user1", name="vendor1", amount=100, date="2024-01-01"),
+        Transaction(id=2, user_id="user1", name="vendor1", amount=100, date="2024-01-02"),
+        Transaction(id=3, user_id="user1", name="vendor1", amount=200, date="2024-01-03"),
+        Transaction(id=4, user_id="user1", name="T-Mobile", amount=50, date="2024-01-04"),
+        Transaction(id=5, user_id="user1", name="AT&T", amount=60, date="2024-01-05"),
+        Transaction(id=6, user_id="user1", name="Verizon", amount=70, date="2024-01-06"),
+        Transaction(id=7, user_id="user1", name="vendor1", amount=100, date="2024-01-26"),
+        Transaction(id=8, user_id="user1", name="vendor2", amount=100.99, date="2024-01-07"),
+        Transaction(id=9, user_id="user1", name="vendor2", amount=100.99, date="2024-01-14"),
+        Transaction(id=10, user_id="user1", name="vendor2", amount=100.99, date="2024-01-21"),
+        Transaction(id=11, user_id="user1", name="Sony Playstation", amount=500, date="2024-01-15"),
+    )
+
+
+@pytest.fixture(scope="session")
+def utility_txns() -> tuple[Transaction, ...]:
+    """Insurance, telecom, utility and lookalike transactions shared by the frequency and dispersion tests."""
+    return (
+        Transaction(id=1, user_id="user1", name="Allstate Insurance", amount=100, date="2024-01-01"),
+        Transaction(id=2, user_id="user1", name="AT&T", amount=100, date="2024-01-01"),
+        Transaction(id=3, user_id="user1", name="Duke Energy", amount=200, date="2024-01-02"),
+        Transaction(id=4, user_id="user1", name="HighEnergy Soft Drinks", amount=2.99, date="2024-01-03"),
+    )
+
+
+@pytest.fixture(scope="session")
+def vendor12_txns() -> tuple[Transaction, ...]:
+    """Three vendor1 and three vendor2 transactions on consecutive days, shared by the amount tests."""
+    return (
+        Transaction(id=1, user_id="user1", name="vendor1", amount=100, date="2024-01-01"),
+        Transaction(id=2, user_id="user1", name="vendor1", amount=150, date="2024-01-02"),
+        Transaction(id=3, user_id="user1", name="vendor1", amount=200, date="2024-01-03"),
+        Transaction(id=4, user_id="user1", name="vendor2", amount=50, date="2024-01-04"),
+        Transaction(id=5, user_id="user1", name="vendor2", amount=60, date="2024-01-05"),
+        Transaction(id=6, user_id="user1", name="vendor2", amount=70, date="2024-01-06"),
+    )
+
+
+@pytest.fixture(scope="session")
+def netflix_spotify_txns() -> tuple[Transaction, ...]:
+    """Two monthly Netflix charges and one Spotify charge for a single user."""
+    return (
+        Transaction(id=1, user_id="user1", name="Netflix", date="2024-03-01", amount=15.99),
+        Transaction(id=2, user_id="user1", name="Netflix", date="2024-02-01", amount=15.99),
+        Transaction(id=3, user_id="user1", name="Spotify", date="2024-02-10", amount=9.99),
+    )
+
+
+@pytest.fixture(scope="session")
+def four_tx_basic() -> tuple[Transaction, ...]:
+    """Four name1 transactions, two of them for the same amount on the same day."""
+    return (
+        _create_transaction(1, "user1", "name1", "2024-01-01", 100.0),
+        _create_transaction(2, "user1", "name1", "2024-01-01", 100.0),
+        _create_transaction(3, "user1", "name1", "2024-01-02", 200.0),
+        _create_transaction(4, "user1", "name1", "2024-01-03", 2.99),
+    )
@@ -0,0 +1,36 @@
+import pytest
+
+from recur_scan.features import build_group_inputs, get_all_features, get_features
+from recur_scan.transactions import Transaction
+
+
+def test_build_group_inputs(netflix_spotify_txns: tuple[Transaction, ...]) -> None:
+    """Test that build_group_inputs indexes the transaction list once for every transaction to share."""
+    transactions = list(netflix_spotify_txns)
+    inputs = build_group_inputs(transactions)
+    assert set(inputs.groups["user1"]) == {"Netflix", "Spotify"}
+    assert inputs.amount_counts[15.99] == 2
+    assert inputs.name_counts["Netflix"] == 2
+    assert inputs.vendor_index["netflix"] == [netflix_spotify_txns[0], netflix_spotify_txns[1]]
+    assert inputs.amount_summary.count == 3
+    expected = get_features(netflix_spotify_txns[0], list(netflix_spotify_txns))
+    assert get_features(netflix_spotify_txns[0], transactions, inputs) == pytest.approx(expected, nan_ok=True)
+
+
+def test_get_all_features(
+    netflix_spotify_txns: tuple[Transaction, ...], mixed_vendor_txns: tuple[Transaction, ...]
+) -> None:
+    """Test that get_all_features matches get_features called on each transaction in turn."""
+    # Out of date order with varying amounts, so a feature that sorts its input in place would change the others
+    unsorted_txns = (
+        Transaction(id=1, user_id="user1", name="Gym", date="2024-03-04", amount=42.0),
+        Transaction(id=2, user_id="user1", name="Gym", date="2024-01-02", amount=40.0),
+        Transaction(id=3, user_id="user1", name="Gym", date="2024-04-01", amount=55.5),
+        Transaction(id=4, user_id="user1", name="Gym", date="2024-02-05", amount=38.25),
+        Transaction(id=5, user_id="user1", name="Gym", date="2024-05-03", amount=47.0),
+    )
+    for txns in (netflix_spotify_txns, mixed_vendor_txns, unsorted_txns):
+        # A fresh copy per call, since some features sort the list they are given
+        expected = [get_features(transaction, list(txns)) for transaction in txns]
+        assert get_all_features(list(txns)) == [pytest.approx(features, nan_ok=True) for features in expected]
+    assert get_all_features([]) == []
@@ -174,3 +174,5 @@ def test_compute_recurring_inputs_at() -> None:
     assert len(user_vendor_txns) == 2
     assert "by_vendor" in preprocessed
     assert "netflix" in preprocessed["by_vendor"]
+    # A shared preprocessing result is reused rather than rebuilt
+    assert compute_recurring_inputs_at(transactions[1], transactions, preprocessed)[2] is preprocessed
@@ -1,7 +1,5 @@
 # test features
 
-from datetime import datetime
-
 import pytest
 
 from recur_scan.features_freedom import (
@@ -13,7 +11,7 @@ from recur_scan.features_freedom import (
 from recur_scan.transactions import Transaction
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transactions_with_dates():
     return [
         Transaction(
@@ -21,28 +19,28 @@ def sample_transactions_with_dates():
             user_id="user1",
             name="Sample",
             amount=100.0,
-            date=datetime(2023, 1, 1).strftime("%Y-%m-%d"),  # Sunday
+            date="2023-01-01",  # Sunday
         ),
         Transaction(
             id=2,
             user_id="user1",
             name="Sample",
             amount=100.0,
-            date=datetime(2023, 1, 15).strftime("%Y-%m-%d"),  # Sunday
+            date="2023-01-15",  # Sunday
         ),
         Transaction(
             id=3,
             user_id="user1",
             name="Sample",
             amount=100.0,
-            date=datetime(2023, 2, 1).strftime("%Y-%m-%d"),  # Wednesday
+            date="2023-02-01",  # Wednesday
         ),
         Transaction(
             id=4,
             user_id="user1",
             name="Sample",
             amount=50.0,
-            date=datetime(2023, 2, 15).strftime("%Y-%m-%d"),  # Wednesday
+            date="2023-02-15",  # Wednesday
         ),
     ]
 
@@ -74,17 +72,15 @@ def test_get_periodicity_confidence():
 def test_get_recurrence_streak_function():
     # 3-month streak
     streak_trans = [
-        Transaction(id=1, user_id="user1", name="Sample", amount=100, date=datetime(2023, 3, 1).strftime("%Y-%m-%d")),
-        Transaction(id=2, user_id="user1", name="Sample", amount=100, date=datetime(2023, 2, 1).strftime("%Y-%m-%d")),
-        Transaction(id=3, user_id="user1", name="Sample", amount=100, date=datetime(2023, 1, 1).strftime("%Y-%m-%d")),
+        Transaction(id=1, user_id="user1", name="Sample", amount=100, date="2023-03-01"),
+        Transaction(id=2, user_id="user1", name="Sample", amount=100, date="2023-02-01"),
+        Transaction(id=3, user_id="user1", name="Sample", amount=100, date="2023-01-01"),
     ]
     assert get_recurrence_streak(streak_trans[0], streak_trans) == 2
 
     # Broken streak
     broken_streak_trans = [
-        Transaction(id=1, user_id="user1", name="Sample", amount=100, date=datetime(2023, 3, 1).strftime("%Y-%m-%d")),
-        Transaction(
-            id=2, user_id="user1", name="Sample", amount=100, date=datetime(2023, 1, 1).strftime("%Y-%m-%d")
-        ),  # Missing February
+        Transaction(id=1, user_id="user1", name="Sample", amount=100, date="2023-03-01"),
+        Transaction(id=2, user_id="user1", name="Sample", amount=100, date="2023-01-01"),  # Missing February
     ]
     assert get_recurrence_streak(broken_streak_trans[0], broken_streak_trans) == 0
@@ -3,6 +3,7 @@
 import pytest
 
 from recur_scan.features_happy import (
+    build_name_counts,
     get_day_of_month_consistency,
     get_n_transactions_same_description,
     get_percent_transactions_same_description,
@@ -12,7 +13,7 @@ from recur_scan.transactions import Transaction
 
 
 # Test data setup
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transactions():
     return [
         Transaction(id=1, user_id="user1", name="Supermarket", amount=50.0, date="2023-01-15"),
@@ -24,7 +25,7 @@ def sample_transactions():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def periodic_transactions():
     return [
         Transaction(id=1, user_id="user1", name="Streaming", amount=10.0, date="2023-01-01"),
@@ -45,6 +46,11 @@ def test_get_n_transactions_same_description(sample_transactions):
     # Test with empty list
     assert get_n_transactions_same_description(target, []) == 0
 
+    # Test with precomputed name counts
+    name_counts = build_name_counts(sample_transactions)
+    assert get_n_transactions_same_description(sample_transactions[0], sample_transactions, name_counts) == 3
+    assert get_n_transactions_same_description(target, sample_transactions, name_counts) == 1
+
 
 def test_get_percent_transactions_same_description(sample_transactions):
     target = sample_transactions[0]  # Groceries transaction
@@ -56,6 +62,17 @@ def test_get_percent_transactions_same_description(sample_transactions):
     # Test with empty list
     assert get_percent_transactions_same_description(target, []) == 0.0
 
+    # Test with precomputed name counts
+    name_counts = build_name_counts(sample_transactions)
+    assert get_percent_transactions_same_description(sample_transactions[0], sample_transactions, name_counts) == 0.5
+
+
+def test_build_name_counts(sample_transactions):
+    name_counts = build_name_counts(sample_transactions)
+    assert name_counts == {"Supermarket": 3, "Employer": 1, "Landlord": 2}
+    assert name_counts["Unknown"] == 0
+    assert build_name_counts([]) == {}
+
 
 def test_get_transaction_frequency(sample_transactions, periodic_transactions):
     # Test with periodic transactions (weekly)
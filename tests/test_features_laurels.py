@@ -3,6 +3,7 @@ import pytest
 from recur_scan.features_laurels import (
     _aggregate_transactions,
     _calculate_intervals,
+    _calculate_intervals_float,
     _calculate_statistics,
     date_irregularity_dominance,
     day_consistency_score_feature,
@@ -26,8 +27,53 @@ from recur_scan.features_laurels import (
     transaction_month_feature,
     transaction_pattern_complexity,
 )
-from recur_scan.features_original import parse_date
 from recur_scan.transactions import Transaction
+from recur_scan.utils import parse_date
+
+
+def _interval_stats(transactions: list[Transaction]) -> dict[str, float]:
+    """Interval statistics of a transaction list, parsing each date once."""
+    dates = [parse_date(t.date) for t in transactions]
+    return _calculate_statistics([float(i) for i in _calculate_intervals(dates)])
+
+
+# Shared transaction lists and their statistics, built once for the whole module
+@pytest.fixture(scope="module")
+def recurring_txs():
+    return [
+        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
+        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
+        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def irregular_txs():
+    return [
+        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
+        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
+        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def rec_interval_stats(recurring_txs):
+    return _interval_stats(recurring_txs)
+
+
+@pytest.fixture(scope="module")
+def irr_interval_stats(irregular_txs):
+    return _interval_stats(irregular_txs)
+
+
+@pytest.fixture(scope="module")
+def rec_amount_stats(recurring_txs):
+    return _calculate_statistics([t.amount for t in recurring_txs])
+
+
+@pytest.fixture(scope="module")
+def irr_amount_stats(irregular_txs):
+    return _calculate_statistics([t.amount for t in irregular_txs])
 
 
 # Helper Tests
@@ -42,6 +88,14 @@ def test_aggregate_transactions():
     assert agg["1"]["Netflix"][0].amount == 16.77
 
 
+def test_calculate_intervals():
+    dates = [parse_date("2025-01-01"), parse_date("2025-02-01"), parse_date("2025-03-01")]
+    assert _calculate_intervals(dates) == [31, 28]
+    assert _calculate_intervals(dates[:1]) == []
+    assert _calculate_intervals_float(dates).tolist() == [31.0, 28.0]
+    assert _calculate_intervals_float([]).size == 0
+
+
 def test_calculate_statistics():
     transactions = [
         Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
@@ -71,43 +125,17 @@ def test_identical_transaction_ratio_feature():
     assert identical_transaction_ratio_feature(single_tx, all_txs, merchant_txs) == 0.5
 
 
-def test_is_monthly_recurring_feature():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
+def test_is_monthly_recurring_feature(recurring_txs, irregular_txs):
     assert is_monthly_recurring_feature(recurring_txs) == 1.0
     assert is_monthly_recurring_feature(irregular_txs) < 0.8
     assert is_monthly_recurring_feature([]) == 0.0
 
 
-def test_recurrence_likelihood_feature():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
-    rec_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in recurring_txs if parse_date(t.date)])
-    ])
-    irr_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in irregular_txs if parse_date(t.date)])
-    ])
-    rec_amount_stats = _calculate_statistics([t.amount for t in recurring_txs])
-    irr_amount_stats = _calculate_statistics([t.amount for t in irregular_txs])
-    rec_score = recurrence_likelihood_feature(recurring_txs, rec_stats, rec_amount_stats)
-    irr_score = recurrence_likelihood_feature(irregular_txs, irr_stats, irr_amount_stats)
+def test_recurrence_likelihood_feature(
+    recurring_txs, irregular_txs, rec_interval_stats, irr_interval_stats, rec_amount_stats, irr_amount_stats
+):
+    rec_score = recurrence_likelihood_feature(recurring_txs, rec_interval_stats, rec_amount_stats)
+    irr_score = recurrence_likelihood_feature(irregular_txs, irr_interval_stats, irr_amount_stats)
     assert rec_score > 0.5  # Fixed: 0.5217 > 0.5, not 0.9
     assert irr_score < 0.5  # Matches observed behavior
 
@@ -117,32 +145,14 @@ def test_is_varying_amount_recurring_feature():
     assert is_varying_amount_recurring_feature({"mean": 60.0, "std": 50.0}, {"mean": 100.0, "std": 0.0}) == 0
 
 
-def test_day_consistency_score_feature():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
+def test_day_consistency_score_feature(recurring_txs, irregular_txs):
     assert day_consistency_score_feature(recurring_txs) > 0.9
     assert day_consistency_score_feature(irregular_txs) < 0.6
     assert day_consistency_score_feature([recurring_txs[0]]) == 0.5
 
 
-def test_is_near_periodic_interval_feature():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in recurring_txs if parse_date(t.date)])
-    ])
-    assert is_near_periodic_interval_feature(stats) > 0.8
+def test_is_near_periodic_interval_feature(rec_interval_stats):
+    assert is_near_periodic_interval_feature(rec_interval_stats) > 0.8
     assert is_near_periodic_interval_feature({"mean": 17.0, "std": 6.5}) < 0.5
 
 
@@ -161,24 +171,14 @@ def test_merchant_interval_mean_feature():
     assert merchant_interval_mean_feature({"mean": 0.0, "std": 0.0}) == 60.0
 
 
-def test_time_since_last_transaction_same_merchant_feature():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    dates = [parse_date(t.date) for t in recurring_txs if parse_date(t.date)]
+def test_time_since_last_transaction_same_merchant_feature(recurring_txs):
+    dates = [parse_date(t.date) for t in recurring_txs]
     assert time_since_last_transaction_same_merchant_feature(dates) == pytest.approx(30.0 / 365, abs=0.01)
     assert time_since_last_transaction_same_merchant_feature([]) == 0.0
 
 
-def test_is_deposit_feature():
+def test_is_deposit_feature(recurring_txs):
     single_tx = Transaction(id="t1", user_id="1", name="MerchantA", amount=100.0, date="2025-03-17")
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
     assert is_deposit_feature(single_tx, recurring_txs) == 1
     assert is_deposit_feature(single_tx, [single_tx]) == 0
 
@@ -199,17 +199,7 @@ def test_transaction_month_feature():
     )  # January
 
 
-def test_rolling_amount_mean_feature():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
+def test_rolling_amount_mean_feature(recurring_txs, irregular_txs):
     assert rolling_amount_mean_feature(recurring_txs) == pytest.approx(16.77)
     assert rolling_amount_mean_feature([irregular_txs[0]]) == 55.0
 
@@ -219,13 +209,8 @@ def test_low_amount_variation_feature():
     assert low_amount_variation_feature({"mean": 100.0, "std": 20.0}) == 0  # 0.2 > 0.1
 
 
-def test_is_single_transaction_feature():
+def test_is_single_transaction_feature(recurring_txs):
     single_tx = Transaction(id="t1", user_id="1", name="MerchantA", amount=100.0, date="2025-03-17")
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
     assert is_single_transaction_feature([single_tx]) == 1
     assert is_single_transaction_feature(recurring_txs) == 0
 
@@ -235,89 +220,31 @@ def test_interval_variability_feature():
     assert interval_variability_feature({"mean": 0.0, "std": 0.0}) == 1.0
 
 
-def test_merchant_amount_frequency_feature():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
+def test_merchant_amount_frequency_feature(recurring_txs, irregular_txs):
     assert merchant_amount_frequency_feature(recurring_txs) == 1  # All 16.77
     assert merchant_amount_frequency_feature(irregular_txs) == 1  # All 55.0
 
 
-def test_non_recurring_irregularity_score():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
-    rec_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in recurring_txs if parse_date(t.date)])
-    ])
-    irr_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in irregular_txs if parse_date(t.date)])
-    ])
-    rec_amount_stats = _calculate_statistics([t.amount for t in recurring_txs])
-    irr_amount_stats = _calculate_statistics([t.amount for t in irregular_txs])
-    rec_score = non_recurring_irregularity_score(recurring_txs, rec_stats, rec_amount_stats)
-    irr_score = non_recurring_irregularity_score(irregular_txs, irr_stats, irr_amount_stats)
+def test_non_recurring_irregularity_score(
+    recurring_txs, irregular_txs, rec_interval_stats, irr_interval_stats, rec_amount_stats, irr_amount_stats
+):
+    rec_score = non_recurring_irregularity_score(recurring_txs, rec_interval_stats, rec_amount_stats)
+    irr_score = non_recurring_irregularity_score(irregular_txs, irr_interval_stats, irr_amount_stats)
     assert rec_score < 0.2
     assert irr_score > 0.25  # Fixed: 0.2533 > 0.25, not 0.4
 
 
-def test_transaction_pattern_complexity():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
-    rec_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in recurring_txs if parse_date(t.date)])
-    ])
-    irr_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in irregular_txs if parse_date(t.date)])
-    ])
-    rec_score = transaction_pattern_complexity(recurring_txs, rec_stats)
-    irr_score = transaction_pattern_complexity(irregular_txs, irr_stats)
+def test_transaction_pattern_complexity(recurring_txs, irregular_txs, rec_interval_stats, irr_interval_stats):
+    rec_score = transaction_pattern_complexity(recurring_txs, rec_interval_stats)
+    irr_score = transaction_pattern_complexity(irregular_txs, irr_interval_stats)
     assert rec_score < 0.2
     assert irr_score > 0.23  # Fixed: 0.2302 > 0.23, not 0.3
 
 
-def test_date_irregularity_dominance():
-    recurring_txs = [
-        Transaction(id="t1", user_id="1", name="Netflix", amount=16.77, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Netflix", amount=16.77, date="2025-02-01"),
-        Transaction(id="t3", user_id="1", name="Netflix", amount=16.77, date="2025-03-01"),
-    ]
-    irregular_txs = [
-        Transaction(id="t1", user_id="1", name="Dave", amount=55.0, date="2025-01-01"),
-        Transaction(id="t2", user_id="1", name="Dave", amount=55.0, date="2025-01-15"),
-        Transaction(id="t3", user_id="1", name="Dave", amount=55.0, date="2025-02-12"),
-    ]
-    rec_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in recurring_txs if parse_date(t.date)])
-    ])
-    irr_stats = _calculate_statistics([
-        float(i) for i in _calculate_intervals([parse_date(t.date) for t in irregular_txs if parse_date(t.date)])
-    ])
-    rec_amount_stats = _calculate_statistics([t.amount for t in recurring_txs])
-    irr_amount_stats = _calculate_statistics([t.amount for t in irregular_txs])
-    rec_score = date_irregularity_dominance(recurring_txs, rec_stats, rec_amount_stats)
-    irr_score = date_irregularity_dominance(irregular_txs, irr_stats, irr_amount_stats)
+def test_date_irregularity_dominance(
+    recurring_txs, irregular_txs, rec_interval_stats, irr_interval_stats, rec_amount_stats, irr_amount_stats
+):
+    rec_score = date_irregularity_dominance(recurring_txs, rec_interval_stats, rec_amount_stats)
+    irr_score = date_irregularity_dominance(irregular_txs, irr_interval_stats, irr_amount_stats)
     assert rec_score < 0.3
     assert irr_score > 0.49  # Fixed: 0.4977 > 0.49, not 0.6
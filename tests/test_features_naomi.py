@@ -15,71 +15,53 @@ from recur_scan.features_naomi import (
 from recur_scan.transactions import Transaction
 
 
-class MockTransaction:
-    def __init__(self, user_id, name, date, amount):
-        self.user_id = user_id
-        self.name = name
-        self.date = date
-        self.amount = amount
-
-
-def test_get_is_monthly_recurring():
-    transactions = [
-        MockTransaction("user1", "Netflix", "2024-03-01", 15.99),
-        MockTransaction("user1", "Netflix", "2024-02-01", 15.99),
-        MockTransaction("user1", "Spotify", "2024-02-10", 9.99),
-    ]
-    transaction = MockTransaction("user1", "Netflix", "2024-04-01", 15.99)
-    assert not get_is_monthly_recurring(transaction, transactions)  # Only 1 prior monthly interval, need 2
-    transaction = MockTransaction("user1", "Spotify", "2024-03-11", 9.99)
-    assert not get_is_monthly_recurring(transaction, transactions)  # Only 1 prior interval
+def test_get_is_monthly_recurring(netflix_spotify_txns):
+    transaction = Transaction(id=4, user_id="user1", name="Netflix", date="2024-04-01", amount=15.99)
+    assert not get_is_monthly_recurring(transaction, netflix_spotify_txns)  # Only 1 prior monthly interval, need 2
+    transaction = Transaction(id=5, user_id="user1", name="Spotify", date="2024-03-11", amount=9.99)
+    assert not get_is_monthly_recurring(transaction, netflix_spotify_txns)  # Only 1 prior interval
 
 
 def test_get_is_similar_amount():
     transactions = [
-        MockTransaction("user1", "Netflix", "2024-04-01", 15.99),
-        MockTransaction("user1", "Netflix", "2024-03-01", 16.10),
-        MockTransaction("user1", "Spotify", "2024-03-01", 9.99),
+        Transaction(id=1, user_id="user1", name="Netflix", date="2024-04-01", amount=15.99),
+        Transaction(id=2, user_id="user1", name="Netflix", date="2024-03-01", amount=16.10),
+        Transaction(id=3, user_id="user1", name="Spotify", date="2024-03-01", amount=9.99),
     ]
-    transaction = MockTransaction("user1", "Netflix", "2024-05-01", 16.20)
+    transaction = Transaction(id=4, user_id="user1", name="Netflix", date="2024-05-01", amount=16.20)
     assert get_is_similar_amount(transaction, transactions)
-    transaction = MockTransaction("user1", "Netflix", "2024-05-01", 20.00)
+    transaction = Transaction(id=5, user_id="user1", name="Netflix", date="2024-05-01", amount=20.00)
     assert not get_is_similar_amount(transaction, transactions)
 
 
-def test_get_transaction_interval_consistency():
-    transactions = [
-        MockTransaction("user1", "Netflix", "2024-03-01", 15.99),
-        MockTransaction("user1", "Netflix", "2024-02-01", 15.99),
-        MockTransaction("user1", "Spotify", "2024-02-10", 9.99),
-    ]
-    transaction = MockTransaction("user1", "Netflix", "2024-04-01", 15.99)
-    assert get_transaction_interval_consistency(transaction, transactions) >= 0
-    transaction = MockTransaction("user1", "Random Service", "2024-05-01", 50.00)
-    assert get_transaction_interval_consistency(transaction, transactions) == 0
+def test_get_transaction_interval_consistency(netflix_spotify_txns):
+    transaction = Transaction(id=4, user_id="user1", name="Netflix", date="2024-04-01", amount=15.99)
+    assert get_transaction_interval_consistency(transaction, netflix_spotify_txns) >= 0
+    transaction = Transaction(id=5, user_id="user1", name="Random Service", date="2024-05-01", amount=50.00)
+    assert get_transaction_interval_consistency(transaction, netflix_spotify_txns) == 0
 
 
-def test_get_cluster_label():
-    transactions = [
-        MockTransaction("user1", "Netflix", "2024-03-01", 15.99),
-        MockTransaction("user1", "Netflix", "2024-02-01", 15.99),
-        MockTransaction("user1", "Spotify", "2024-02-10", 9.99),
-    ]
-    transaction = MockTransaction("user1", "Netflix", "2024-05-01", 15.80)
-    assert get_cluster_label(transaction, transactions) == 1
-    transaction = MockTransaction("user1", "Random Service", "2024-05-01", 50.00)
-    assert get_cluster_label(transaction, transactions) == 0
-
-
-def test_get_subscription_keyword_score():
-    transaction = MockTransaction("user1", "Netflix", "2024-05-01", 15.99)
-    assert get_subscription_keyword_score(transaction) == 1.0
-    transaction = MockTransaction("user1", "Some Service Premium", "2024-05-01", 20.00)
-    assert get_subscription_keyword_score(transaction) == 0.8
-    transaction = MockTransaction("user1", "Grocery Store", "2024-05-01", 50.00)
-    assert get_subscription_keyword_score(transaction) == 0.0
-    transaction = Transaction(id=1, user_id="user1", name="Sample Transaction", amount=50, date="2024-01-01")
-    assert get_subscription_keyword_score(transaction) == 0.0
+def test_get_cluster_label(netflix_spotify_txns):
+    transaction = Transaction(id=4, user_id="user1", name="Netflix", date="2024-05-01", amount=15.80)
+    assert get_cluster_label(transaction, netflix_spotify_txns) == 1
+    transaction = Transaction(id=5, user_id="user1", name="Random Service", date="2024-05-01", amount=50.00)
+    assert get_cluster_label(transaction, netflix_spotify_txns) == 0
+
+
+@pytest.mark.parametrize(
+    ("transaction", "expected_score"),
+    [
+        (Transaction(id=1, user_id="user1", name="Netflix", date="2024-05-01", amount=15.99), 1.0),
+        (
+            Transaction(id=2, user_id="user1", name="Some Service Premium", date="2024-05-01", amount=20.00),
+            0.8,
+        ),
+        (Transaction(id=3, user_id="user1", name="Grocery Store", date="2024-05-01", amount=50.00), 0.0),
+        (Transaction(id=1, user_id="user1", name="Sample Transaction", amount=50, date="2024-01-01"), 0.0),
+    ],
+)
+def test_get_subscription_keyword_score(transaction, expected_score):
+    assert get_subscription_keyword_score(transaction) == expected_score
 
 
 def test_get_recurring_confidence_score():
@@ -14,136 +14,81 @@ from recur_scan.features_nnanna import (
 from recur_scan.transactions import Transaction
 
 
-def test_get_time_interval_between_transactions() -> None:
+def test_get_time_interval_between_transactions(mixed_vendor_txns: tuple[Transaction, ...]) -> None:
     """
     Test that get_time_interval_between_transactions returns the correct average time interval between
     transactions with the same amount.
     """
-    transactions = [
-        Transaction(id=1, user_id="user1", name="vendor1", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="vendor1", amount=100, date="2024-01-02"),
-        Transaction(id=3, user_id="user1", name="vendor1", amount=200, date="2024-01-03"),
-        Transaction(id=4, user_id="user1", name="T-Mobile", amount=50, date="2024-01-04"),
-        Transaction(id=5, user_id="user1", name="AT&T", amount=60, date="2024-01-05"),
-        Transaction(id=6, user_id="user1", name="Verizon", amount=70, date="2024-01-06"),
-        Transaction(id=7, user_id="user1", name="vendor1", amount=100, date="2024-01-26"),
-        Transaction(id=8, user_id="user1", name="vendor2", amount=100.99, date="2024-01-07"),
-        Transaction(id=9, user_id="user1", name="vendor2", amount=100.99, date="2024-01-14"),
-        Transaction(id=10, user_id="user1", name="vendor2", amount=100.99, date="2024-01-21"),
-        Transaction(id=11, user_id="user1", name="Sony Playstation", amount=500, date="2024-01-15"),
-    ]
-    assert get_time_interval_between_transactions(transactions[0], transactions) == 12.5
-    assert get_time_interval_between_transactions(transactions[2], transactions) == 365.0
-
-
-def test_get_mobile_transaction() -> None:
+    assert get_time_interval_between_transactions(mixed_vendor_txns[0], mixed_vendor_txns) == 12.5
+    assert get_time_interval_between_transactions(mixed_vendor_txns[2], mixed_vendor_txns) == 365.0
+
+
+@pytest.mark.parametrize(
+    ("index", "expected"),
+    [
+        (3, True),  # T-Mobile
+        (4, True),  # AT&T
+        (5, True),  # Verizon
+        (0, False),  # vendor1
+    ],
+)
+def test_get_mobile_transaction(mixed_vendor_txns: tuple[Transaction, ...], index: int, expected: bool) -> None:
     """
     Test that get_mobile_transaction returns True for mobile company transactions and False otherwise.
     """
-    transactions = [
-        Transaction(id=1, user_id="user1", name="vendor1", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="vendor1", amount=100, date="2024-01-02"),
-        Transaction(id=3, user_id="user1", name="vendor1", amount=200, date="2024-01-03"),
-        Transaction(id=4, user_id="user1", name="T-Mobile", amount=50, date="2024-01-04"),
-        Transaction(id=5, user_id="user1", name="AT&T", amount=60, date="2024-01-05"),
-        Transaction(id=6, user_id="user1", name="Verizon", amount=70, date="2024-01-06"),
-        Transaction(id=7, user_id="user1", name="vendor1", amount=100, date="2024-01-26"),
-        Transaction(id=8, user_id="user1", name="vendor2", amount=100.99, date="2024-01-07"),
-        Transaction(id=9, user_id="user1", name="vendor2", amount=100.99, date="2024-01-14"),
-        Transaction(id=10, user_id="user1", name="vendor2", amount=100.99, date="2024-01-21"),
-        Transaction(id=11, user_id="user1", name="Sony Playstation", amount=500, date="2024-01-15"),
-    ]
-    assert get_mobile_transaction(transactions[3]) is True  # T-Mobile
-    assert get_mobile_transaction(transactions[4]) is True  # AT&T
-    assert get_mobile_transaction(transactions[5]) is True  # Verizon
-    assert get_mobile_transaction(transactions[0]) is False  # vendor1
+    assert get_mobile_transaction(mixed_vendor_txns[index]) is expected
 
 
-def test_get_transaction_frequency() -> None:
+def test_get_transaction_frequency(utility_txns: tuple[Transaction, ...]) -> None:
     """Test get_transaction_frequency."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="Allstate Insurance", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="AT&T", amount=100, date="2024-01-01"),
-        Transaction(id=3, user_id="user1", name="Duke Energy", amount=200, date="2024-01-02"),
-        Transaction(id=4, user_id="user1", name="HighEnergy Soft Drinks", amount=2.99, date="2024-01-03"),
-    ]
-    assert get_transaction_frequency(transactions[0], transactions) == 0.0
+    assert get_transaction_frequency(utility_txns[0], utility_txns) == 0.0
     assert (
         get_transaction_frequency(
-            Transaction(id=12, user_id="user1", name="vendor3", amount=99.99, date="2024-01-08"), transactions
+            Transaction(id=12, user_id="user1", name="vendor3", amount=99.99, date="2024-01-08"), utility_txns
         )
         == 0.0
     )
 
 
-def test_get_dispersion_transaction_amount() -> None:
+def test_get_dispersion_transaction_amount(utility_txns: tuple[Transaction, ...]) -> None:
     """Test get_dispersion_transaction_amount."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="Allstate Insurance", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="AT&T", amount=100, date="2024-01-01"),
-        Transaction(id=3, user_id="user1", name="Duke Energy", amount=200, date="2024-01-02"),
-        Transaction(id=4, user_id="user1", name="HighEnergy Soft Drinks", amount=2.99, date="2024-01-03"),
-    ]
     assert (
-        get_dispersion_transaction_amount(transactions[0], transactions) == 0.0
+        get_dispersion_transaction_amount(utility_txns[0], utility_txns) == 0.0
     )  # Replace with the correct expected value
 
 
-def test_get_mad_transaction_amount() -> None:
+def test_get_mad_transaction_amount(vendor12_txns: tuple[Transaction, ...]) -> None:
     """Test get_mad_transaction_amount."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="vendor1", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="vendor1", amount=150, date="2024-01-02"),
-        Transaction(id=3, user_id="user1", name="vendor1", amount=200, date="2024-01-03"),
-        Transaction(id=4, user_id="user1", name="vendor2", amount=50, date="2024-01-04"),
-        Transaction(id=5, user_id="user1", name="vendor2", amount=60, date="2024-01-05"),
-        Transaction(id=6, user_id="user1", name="vendor2", amount=70, date="2024-01-06"),
-    ]
     # Test for vendor1
-    assert pytest.approx(get_mad_transaction_amount(transactions[0], transactions)) == 50.0
+    assert pytest.approx(get_mad_transaction_amount(vendor12_txns[0], vendor12_txns)) == 50.0
     # Test for vendor2
-    assert pytest.approx(get_mad_transaction_amount(transactions[3], transactions)) == 10.0
+    assert pytest.approx(get_mad_transaction_amount(vendor12_txns[3], vendor12_txns)) == 10.0
     # Test for a vendor with only one transaction
     assert (
         get_mad_transaction_amount(
-            Transaction(id=7, user_id="user1", name="vendor3", amount=100, date="2024-01-07"), transactions
+            Transaction(id=7, user_id="user1", name="vendor3", amount=100, date="2024-01-07"), vendor12_txns
         )
         == 0.0
     )
 
 
-def test_get_coefficient_of_variation() -> None:
+def test_get_coefficient_of_variation(vendor12_txns: tuple[Transaction, ...]) -> None:
     """Test get_coefficient_of_variation."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="vendor1", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="vendor1", amount=150, date="2024-01-02"),
-        Transaction(id=3, user_id="user1", name="vendor1", amount=200, date="2024-01-03"),
-        Transaction(id=4, user_id="user1", name="vendor2", amount=50, date="2024-01-04"),
-        Transaction(id=5, user_id="user1", name="vendor2", amount=60, date="2024-01-05"),
-        Transaction(id=6, user_id="user1", name="vendor2", amount=70, date="2024-01-06"),
-    ]
     # Test for vendor1
-    assert pytest.approx(get_coefficient_of_variation(transactions[0], transactions), rel=1e-4) == 0.2721655269759087
+    assert pytest.approx(get_coefficient_of_variation(vendor12_txns[0], vendor12_txns), rel=1e-4) == 0.2721655269759087
     # Test for vendor2
-    assert pytest.approx(get_coefficient_of_variation(transactions[3], transactions), rel=1e-4) == 0.13608276348795434
+    assert pytest.approx(get_coefficient_of_variation(vendor12_txns[3], vendor12_txns), rel=1e-4) == 0.13608276348795434
     # Test for a vendor with only one transaction
     assert (
         get_coefficient_of_variation(
-            Transaction(id=7, user_id="user1", name="vendor3", amount=100, date="2024-01-07"), transactions
-        )
-        == 0.0
-    )
-    # Test for a vendor with mean = 0 (edge case)
-    assert (
-        get_coefficient_of_variation(
-            Transaction(id=8, user_id="user1", name="vendor4", amount=0, date="2024-01-08"), transactions
+            Transaction(id=7, user_id="user1", name="vendor3", amount=100, date="2024-01-07"), vendor12_txns
         )
         == 0.0
     )
     # Test for a vendor with mean = 0 (edge case)
     assert (
         get_coefficient_of_variation(
-            Transaction(id=8, user_id="user1", name="vendor4", amount=0, date="2024-01-08"), transactions
+            Transaction(id=8, user_id="user1", name="vendor4", amount=0, date="2024-01-08"), vendor12_txns
         )
         == 0.0
     )
@@ -174,24 +119,16 @@ def test_get_transaction_interval_consistency() -> None:
     )
 
 
-def test_get_average_transaction_amount() -> None:
+def test_get_average_transaction_amount(vendor12_txns: tuple[Transaction, ...]) -> None:
     """Test get_average_transaction_amount."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="vendor1", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="vendor1", amount=150, date="2024-01-02"),
-        Transaction(id=3, user_id="user1", name="vendor1", amount=200, date="2024-01-03"),
-        Transaction(id=4, user_id="user1", name="vendor2", amount=50, date="2024-01-04"),
-        Transaction(id=5, user_id="user1", name="vendor2", amount=60, date="2024-01-05"),
-        Transaction(id=6, user_id="user1", name="vendor2", amount=70, date="2024-01-06"),
-    ]
     # Test for vendor1
-    assert pytest.approx(get_average_transaction_amount(transactions[0], transactions)) == 150.0
+    assert pytest.approx(get_average_transaction_amount(vendor12_txns[0], vendor12_txns)) == 150.0
     # Test for vendor2
-    assert pytest.approx(get_average_transaction_amount(transactions[3], transactions)) == 60.0
+    assert pytest.approx(get_average_transaction_amount(vendor12_txns[3], vendor12_txns)) == 60.0
     # Test for a vendor with only one transaction
     assert (
         get_average_transaction_amount(
-            Transaction(id=7, user_id="user1", name="vendor3", amount=100, date="2024-01-07"), transactions
+            Transaction(id=7, user_id="user1", name="vendor3", amount=100, date="2024-01-07"), vendor12_txns
         )
         == 0.0
     )
@@ -2,6 +2,7 @@
 import pytest
 
 from recur_scan.features_osasere import (
+    build_vendor_index,
     detect_financial_service_fees,
     detect_housing_payments,
     detect_installment_payments,
@@ -12,6 +13,7 @@ from recur_scan.features_osasere import (
     # new imports
     get_fixed_recurring,
     get_median_period,
+    get_new_features,
     get_recurrence_confidence,
     has_consistent_amount,
     has_min_recurrence_period,
@@ -35,6 +37,10 @@ def test_has_min_recurrence_period() -> None:
     assert has_min_recurrence_period(transactions[0], transactions, min_days=60)
     # Spotify only has one transaction
     assert not has_min_recurrence_period(transactions[3], transactions)
+    # A precomputed vendor index gives the same results
+    vendor_index = build_vendor_index(transactions)
+    assert has_min_recurrence_period(transactions[0], transactions, min_days=60, vendor_index=vendor_index)
+    assert not has_min_recurrence_period(transactions[3], transactions, vendor_index=vendor_index)
 
 
 # Osaseres tests
@@ -124,75 +130,106 @@ def test_get_median_period() -> None:
     assert get_median_period(transactions[3], transactions) == 14.0
     # Single transaction should return 0
     assert get_median_period(transactions[6], transactions) == 0.0
+    # A precomputed vendor index gives the same result
+    vendor_index = build_vendor_index(transactions)
+    assert get_median_period(transactions[3], transactions, vendor_index=vendor_index) == 14.0
 
 
 # Helper function to create transactions
-def create_transaction(id, name, amount, date):
+def _osasere_tx(id, name, amount, date):
     return Transaction(id=id, user_id="test_user", name=name, amount=amount, date=date)
 
 
-# Test data
-SAMPLE_TRANSACTIONS = [
-    create_transaction(1, "Netflix Subscription", 15.99, "2024-01-15"),
-    create_transaction(2, "Netflix Subscription", 15.99, "2024-02-15"),
-    create_transaction(3, "AfterPay Payment", 50.00, "2024-01-01"),
-    create_transaction(4, "AfterPay Payment", 50.00, "2024-01-15"),
-    create_transaction(5, "Albert App Fee", 5.00, "2024-01-01"),
-    create_transaction(6, "Albert App Fee", 5.00, "2024-02-01"),
-    create_transaction(7, "Albert App Fee", 5.00, "2024-03-01"),
-    create_transaction(8, "Rent - Apartment LLC", 1200.00, "2024-01-01"),
-    create_transaction(9, "Rent - Apartment LLC", 1200.00, "2024-02-01"),
-    create_transaction(10, "GEICO Insurance", 85.00, "2024-01-01"),
-    create_transaction(11, "Kikoff Credit Builder", 10.00, "2024-01-01"),
-    create_transaction(12, "Spotify Premium", 9.99, "2024-01-01"),
-    create_transaction(13, "Amazon Prime Video", 12.99, "2024-01-01"),
-    create_transaction(14, "Variable Payment Inc", 100.00, "2024-01-01"),
-    create_transaction(15, "Variable Payment Inc", 105.00, "2024-02-01"),
-    create_transaction(16, "Irregular Service", 20.00, "2024-01-01"),
-    create_transaction(17, "Irregular Service", 20.00, "2024-03-15"),
-    create_transaction(18, "Rent - 123 Main St Apt 3B", 1500.00, "2024-01-01"),
-    create_transaction(19, "Rent - 123 Main St Apt 3B", 1500.00, "2024-02-01"),
-]
+@pytest.fixture(scope="module")
+def sample_txns() -> tuple[Transaction, ...]:
+    """Test data shared by the detector tests; a tuple so no test can mutate it."""
+    return (
+        _osasere_tx(1, "Netflix Subscription", 15.99, "2024-01-15"),
+        _osasere_tx(2, "Netflix Subscription", 15.99, "2024-02-15"),
+        _osasere_tx(3, "AfterPay Payment", 50.00, "2024-01-01"),
+        _osasere_tx(4, "AfterPay Payment", 50.00, "2024-01-15"),
+        _osasere_tx(5, "Albert App Fee", 5.00, "2024-01-01"),
+        _osasere_tx(6, "Albert App Fee", 5.00, "2024-02-01"),
+        _osasere_tx(7, "Albert App Fee", 5.00, "2024-03-01"),
+        _osasere_tx(8, "Rent - Apartment LLC", 1200.00, "2024-01-01"),
+        _osasere_tx(9, "Rent - Apartment LLC", 1200.00, "2024-02-01"),
+        _osasere_tx(10, "GEICO Insurance", 85.00, "2024-01-01"),
+        _osasere_tx(11, "Kikoff Credit Builder", 10.00, "2024-01-01"),
+        _osasere_tx(12, "Spotify Premium", 9.99, "2024-01-01"),
+        _osasere_tx(13, "Amazon Prime Video", 12.99, "2024-01-01"),
+        _osasere_tx(14, "Variable Payment Inc", 100.00, "2024-01-01"),
+        _osasere_tx(15, "Variable Payment Inc", 105.00, "2024-02-01"),
+        _osasere_tx(16, "Irregular Service", 20.00, "2024-01-01"),
+        _osasere_tx(17, "Irregular Service", 20.00, "2024-03-15"),
+        _osasere_tx(18, "Rent - 123 Main St Apt 3B", 1500.00, "2024-01-01"),
+        _osasere_tx(19, "Rent - 123 Main St Apt 3B", 1500.00, "2024-02-01"),
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_index(sample_txns):
+    """Vendor index of the sample transactions, built once for the tests that reuse it."""
+    return build_vendor_index(list(sample_txns))
+
+
+def test_build_vendor_index(sample_txns, sample_index):
+    """Test that the index groups transactions by lowercased vendor name in their original order."""
+    assert sample_index["albert app fee"] == [sample_txns[4], sample_txns[5], sample_txns[6]]
+    assert sum(len(group) for group in sample_index.values()) == len(sample_txns)
+    assert build_vendor_index([_osasere_tx(1, "Netflix", 1.0, "2024-01-01")]) == {
+        "netflix": [_osasere_tx(1, "Netflix", 1.0, "2024-01-01")]
+    }
+    assert build_vendor_index([]) == {}
+
+
+def test_get_new_features(sample_txns, sample_index):
+    """Test that get_new_features gives the same features with or without a precomputed vendor index."""
+    transactions = list(sample_txns)
+    for transaction in transactions:
+        assert get_new_features(transaction, transactions, sample_index) == get_new_features(transaction, transactions)
+    assert get_new_features(transactions[4], transactions)["is_financial_service_fee"]
 
 
 def test_get_fixed_recurring():
     """Test fixed recurring payment detection."""
-    t = create_transaction(1, "Netflix Subscription", 15.99, "2024-01-15")
+    t = _osasere_tx(1, "Netflix Subscription", 15.99, "2024-01-15")
     assert get_fixed_recurring("Netflix", t) is True
     assert get_fixed_recurring("Spotify", t) is False
     assert get_fixed_recurring("netflix", t) is True  # Case insensitive
     assert get_fixed_recurring("flix", t) is True  # Partial match
 
 
-def test_detect_installment_payments():
+def test_detect_installment_payments(sample_txns, sample_index):
     """Test installment payment detection."""
     # Positive case
-    t = SAMPLE_TRANSACTIONS[2]  # AfterPay Payment
-    assert detect_installment_payments(t, SAMPLE_TRANSACTIONS) is True
+    t = sample_txns[2]  # AfterPay Payment
+    assert detect_installment_payments(t, sample_txns) is True
+    assert detect_installment_payments(t, sample_txns, vendor_index=sample_index) is True
 
     # Negative case - wrong interval
     bad_interval = [
-        create_transaction(21, "Klarna Payment", 75.00, "2024-01-01"),
-        create_transaction(22, "Klarna Payment", 75.00, "2024-03-01"),  # >20 days apart
+        _osasere_tx(21, "Klarna Payment", 75.00, "2024-01-01"),
+        _osasere_tx(22, "Klarna Payment", 75.00, "2024-03-01"),  # >20 days apart
     ]
     assert detect_installment_payments(bad_interval[0], bad_interval) is False
 
 
-def test_detect_financial_service_fees():
+def test_detect_financial_service_fees(sample_txns, sample_index):
     """Test financial service fee detection."""
     # Positive case (Albert has 3 consistent payments)
-    t = SAMPLE_TRANSACTIONS[4]
-    assert detect_financial_service_fees(t, SAMPLE_TRANSACTIONS) is True
+    t = sample_txns[4]
+    assert detect_financial_service_fees(t, sample_txns) is True
+    assert detect_financial_service_fees(t, sample_txns, vendor_index=sample_index) is True
 
     # Negative case - not enough transactions
-    single_fee = create_transaction(23, "Dave App Fee", 3.00, "2024-01-01")
-    assert detect_financial_service_fees(single_fee, SAMPLE_TRANSACTIONS) is False
+    single_fee = _osasere_tx(23, "Dave App Fee", 3.00, "2024-01-01")
+    assert detect_financial_service_fees(single_fee, sample_txns) is False
 
     # Negative case - inconsistent amounts
     inconsistent = [
-        create_transaction(24, "FloatMe Fee", 5.00, "2024-01-01"),
-        create_transaction(25, "FloatMe Fee", 10.00, "2024-02-01"),
-        create_transaction(26, "FloatMe Fee", 5.00, "2024-03-01"),
+        _osasere_tx(24, "FloatMe Fee", 5.00, "2024-01-01"),
+        _osasere_tx(25, "FloatMe Fee", 10.00, "2024-02-01"),
+        _osasere_tx(26, "FloatMe Fee", 5.00, "2024-03-01"),
     ]
     assert detect_financial_service_fees(inconsistent[0], inconsistent) is False
 
@@ -207,77 +244,97 @@ def test_normalize_vendor_name():
     assert normalize_vendor_name("Service Co contact@example.com") == "service"
 
 
-def test_detect_housing_payments():
+def test_detect_housing_payments(sample_txns):
     """Test housing payment detection."""
     # Positive case - consistent monthly payments
-    t = SAMPLE_TRANSACTIONS[7]
-    assert detect_housing_payments(t, SAMPLE_TRANSACTIONS) is True
+    t = sample_txns[7]
+    assert detect_housing_payments(t, sample_txns) is True
 
     # Positive case - normalized name matching
-    t = SAMPLE_TRANSACTIONS[17]
-    assert detect_housing_payments(t, SAMPLE_TRANSACTIONS) is True
+    t = sample_txns[17]
+    assert detect_housing_payments(t, sample_txns) is True
 
     # Negative case - not housing related
-    t = SAMPLE_TRANSACTIONS[0]
-    assert detect_housing_payments(t, SAMPLE_TRANSACTIONS) is False
-
-
-def test_detect_streaming_services():
-    """Test streaming service detection."""
-    assert detect_streaming_services(SAMPLE_TRANSACTIONS[0]) is True  # Netflix
-    assert detect_streaming_services(SAMPLE_TRANSACTIONS[11]) is True  # Spotify
-    assert detect_streaming_services(SAMPLE_TRANSACTIONS[12]) is True  # Amazon Prime
-    assert detect_streaming_services(SAMPLE_TRANSACTIONS[4]) is False  # Albert
+    t = sample_txns[0]
+    assert detect_housing_payments(t, sample_txns) is False
+
+
+# Single-transaction detectors checked against the shared sample: (detector, sample index, expected)
+DETECTOR_CASES = [
+    (detect_streaming_services, 0, True),  # Netflix
+    (detect_streaming_services, 11, True),  # Spotify
+    (detect_streaming_services, 12, True),  # Amazon Prime
+    (detect_streaming_services, 4, False),  # Albert
+    (is_likely_recurring_by_merchant, 10, True),  # Kikoff
+    (is_likely_recurring_by_merchant, 4, True),  # Albert
+    (is_likely_recurring_by_merchant, 0, False),  # Netflix
+]
 
 
-def test_detect_insurance_payments():
+@pytest.mark.parametrize(
+    ("detector", "index", "expected"),
+    DETECTOR_CASES,
+    ids=[f"{detector.__name__}-{index}" for detector, index, _ in DETECTOR_CASES],
+)
+def test_detectors(sample_txns, detector, index, expected):
+    """Test the name-only detectors (detect_streaming_services, is_likely_recurring_by_merchant) in one sweep."""
+    assert detector(sample_txns[index]) is expected
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("GEICO Insurance", True),
+        ("Progressive Insurance", True),
+        ("Netflix Subscription", False),
+    ],
+)
+def test_detect_insurance_payments(name, expected):
     """Test insurance payment detection."""
-    assert detect_insurance_payments(SAMPLE_TRANSACTIONS[9]) is True  # GEICO
-    assert detect_insurance_payments(create_transaction(30, "Progressive Insurance", 120.00, "2024-01-01")) is True
-    assert detect_insurance_payments(SAMPLE_TRANSACTIONS[0]) is False  # Netflix
+    assert detect_insurance_payments(_osasere_tx(30, name, 120.00, "2024-01-01")) is expected
 
 
-def test_is_likely_recurring_by_merchant():
-    """Test merchant-based recurring detection."""
-    assert is_likely_recurring_by_merchant(SAMPLE_TRANSACTIONS[10]) is True  # Kikoff
-    assert is_likely_recurring_by_merchant(SAMPLE_TRANSACTIONS[4]) is True  # Albert
-    assert is_likely_recurring_by_merchant(SAMPLE_TRANSACTIONS[0]) is False  # Netflix
-
-
-def test_has_consistent_amount():
+def test_has_consistent_amount(sample_txns, sample_index):
     """Test consistent amount detection."""
     # Exact match case
-    t = SAMPLE_TRANSACTIONS[0]
-    assert has_consistent_amount(t, SAMPLE_TRANSACTIONS) is True
+    t = sample_txns[0]
+    assert has_consistent_amount(t, sample_txns) is True
 
     # Approximate match case
-    t = SAMPLE_TRANSACTIONS[13]
-    assert has_consistent_amount(t, SAMPLE_TRANSACTIONS, exact_match=False) is True
-    assert has_consistent_amount(t, SAMPLE_TRANSACTIONS, exact_match=True) is False
+    t = sample_txns[13]
+    assert has_consistent_amount(t, sample_txns, exact_match=False) is True
+    assert has_consistent_amount(t, sample_txns, exact_match=True) is False
+    assert has_consistent_amount(t, sample_txns, exact_match=True, vendor_index=sample_index) is False
 
     # Negative case
-    t = create_transaction(31, "Inconsistent", 10.00, "2024-01-01")
+    t = _osasere_tx(31, "Inconsistent", 10.00, "2024-01-01")
     inconsistent = [
         t,
-        create_transaction(32, "Inconsistent", 20.00, "2024-02-01"),
-        create_transaction(33, "Inconsistent", 10.00, "2024-03-01"),
+        _osasere_tx(32, "Inconsistent", 20.00, "2024-02-01"),
+        _osasere_tx(33, "Inconsistent", 10.00, "2024-03-01"),
     ]
     assert has_consistent_amount(t, inconsistent) is False
 
+    # Zero amounts are never an approximate match instead of dividing by zero
+    zeros = [
+        _osasere_tx(36, "Free Trial", 0.0, "2024-01-01"),
+        _osasere_tx(37, "Free Trial", 0.0, "2024-02-01"),
+    ]
+    assert has_consistent_amount(zeros[0], zeros, exact_match=False) is False
+    assert has_consistent_amount(zeros[0], zeros, exact_match=True) is True
 
-def test_has_regular_interval():
-    """Test regular interval detection."""
-    t = SAMPLE_TRANSACTIONS[0]
-    assert has_regular_interval(t, SAMPLE_TRANSACTIONS) is False
 
+def test_has_regular_interval(sample_txns, sample_index):
+    """Test regular interval detection."""
     # Negative case - not enough transactions
-    t = create_transaction(34, "New Service", 10.00, "2024-01-01")
+    t = _osasere_tx(34, "New Service", 10.00, "2024-01-01")
     few_transactions = [
         t,
-        create_transaction(35, "New Service", 10.00, "2024-02-01"),
+        _osasere_tx(35, "New Service", 10.00, "2024-02-01"),
     ]
     assert has_regular_interval(t, few_transactions) is False
 
     # Negative case - irregular intervals
-    t = SAMPLE_TRANSACTIONS[15]
-    assert has_regular_interval(t, SAMPLE_TRANSACTIONS) is False
+    t = sample_txns[15]
+    assert has_regular_interval(t, sample_txns) is False
+    assert has_regular_interval(t, sample_txns, vendor_index=sample_index) is False
@@ -1,3 +1,5 @@
+import pytest
+
 from recur_scan.features_original import (
     get_ends_in_99,
     get_is_always_recurring,
@@ -33,35 +35,59 @@ from recur_scan.features_praise import (
 from recur_scan.transactions import Transaction
 
 
-# Helper function to create transactions
-def create_transaction(id, user_id, name, date, amount):
-    return Transaction(id=id, user_id=user_id, name=name, date=date, amount=amount)
+@pytest.fixture(scope="session")
+def days_apart_txns(create_transaction) -> tuple[Transaction, ...]:
+    """Seven same-amount transactions with pairs roughly 14 days apart."""
+    return (
+        create_transaction(1, "user1", "name1", "2024-01-01", 2.99),
+        create_transaction(2, "user1", "name1", "2024-01-02", 2.99),
+        create_transaction(3, "user1", "name1", "2024-01-14", 2.99),
+        create_transaction(4, "user1", "name1", "2024-01-15", 2.99),
+        create_transaction(4, "user1", "name1", "2024-01-16", 2.99),
+        create_transaction(4, "user1", "name1", "2024-01-29", 2.99),
+        create_transaction(4, "user1", "name1", "2024-01-31", 2.99),
+    )
 
 
-def test_get_n_transactions_same_amount() -> None:
-    """Test that get_n_transactions_same_amount returns the correct number of transactions with the same amount."""
-    transactions = [
-        create_transaction(1, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(3, "user1", "name1", "2024-01-02", 200.0),
-        create_transaction(4, "user1", "name1", "2024-01-03", 2.99),
-    ]
-    assert get_n_transactions_same_amount(transactions[0], transactions) == 2
-    assert get_n_transactions_same_amount(transactions[2], transactions) == 1
+@pytest.fixture(scope="session")
+def netflix_monthly(create_transaction) -> tuple[Transaction, ...]:
+    """Three monthly Netflix charges, the last one two days late."""
+    return (
+        create_transaction(1, "user1", "Netflix", "2024-01-01", 15.99),
+        create_transaction(2, "user1", "Netflix", "2024-02-01", 15.99),
+        create_transaction(3, "user1", "Netflix", "2024-03-03", 15.99),
+    )
 
 
-def test_get_percent_transactions_same_amount() -> None:
-    """Test that get_percent_transactions_same_amount returns correct percentage."""
-    transactions = [
-        create_transaction(1, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(3, "user1", "name1", "2024-01-02", 200.0),
-        create_transaction(4, "user1", "name1", "2024-01-03", 2.99),
-    ]
-    assert get_percent_transactions_same_amount(transactions[0], transactions) == 0.5  # 2/4
+@pytest.fixture(scope="session")
+def vendor_a_weekly(create_transaction) -> tuple[Transaction, ...]:
+    """Three same-amount VendorA charges exactly a week apart."""
+    return (
+        create_transaction(1, "user1", "VendorA", "2024-01-01", 100.0),
+        create_transaction(2, "user1", "VendorA", "2024-01-08", 100.0),
+        create_transaction(3, "user1", "VendorA", "2024-01-15", 100.0),
+    )
+
+
+@pytest.mark.parametrize(
+    ("index", "func", "expected"),
+    [
+        (0, get_n_transactions_same_amount, 2),
+        (2, get_n_transactions_same_amount, 1),
+        (0, get_percent_transactions_same_amount, 0.5),  # 2/4
+        # (100 + 100 + 200 + 2.99) / 4 = 100.7475 ≈ 100.75
+        (0, lambda _, txs: round(get_average_transaction_amount(txs), 2), 100.75),
+        (0, lambda _, txs: get_max_transaction_amount(txs), 200.0),
+        (0, lambda _, txs: get_min_transaction_amount(txs), 2.99),
+    ],
+    ids=["n_same_amount", "n_same_amount_unique", "pct_same_amount", "average", "max", "min"],
+)
+def test_scalar_features(four_tx_basic, index, func, expected) -> None:
+    """Test the amount-count and amount-summary features over the shared four-transaction list."""
+    assert func(four_tx_basic[index], four_tx_basic) == expected
 
 
-def test_is_recurring_merchant() -> None:
+def test_is_recurring_merchant(create_transaction) -> None:
     """Test that is_recurring_merchant returns True for recurring merchants."""
     transaction = create_transaction(1, "user1", "Google Play", "2023-01-01", 10.00)
     assert is_recurring_merchant(transaction)
@@ -69,18 +95,7 @@ def test_is_recurring_merchant() -> None:
     assert not is_recurring_merchant(transaction)
 
 
-def test_get_avg_days_between_same_merchant_amount() -> None:
-    """Test get_avg_days_between_same_merchant_amount returns correct average days."""
-    transactions = [
-        create_transaction(1, "user1", "VendorA", "2023-01-01", 100.0),
-        create_transaction(2, "user1", "VendorA", "2023-01-08", 100.0),
-        create_transaction(3, "user1", "VendorA", "2023-01-15", 100.0),
-    ]
-    transaction = transactions[0]
-    assert get_avg_days_between_same_merchant_amount(transaction, transactions) == 7.0
-
-
-def test_get_is_always_recurring() -> None:
+def test_get_is_always_recurring(create_transaction) -> None:
     """Test get_is_always_recurring identifies recurring vendors."""
     transaction = create_transaction(1, "user1", "Netflix", "2024-01-01", 15.99)
     assert get_is_always_recurring(transaction)
@@ -88,7 +103,7 @@ def test_get_is_always_recurring() -> None:
     assert not get_is_always_recurring(transaction)
 
 
-def test_get_is_utility() -> None:
+def test_get_is_utility(create_transaction) -> None:
     """Test get_is_utility identifies utility payments."""
     transaction = create_transaction(1, "user1", "Electric Utility", "2024-01-01", 75.0)
     assert get_is_utility(transaction)
@@ -96,7 +111,7 @@ def test_get_is_utility() -> None:
     assert not get_is_utility(transaction)
 
 
-def test_get_is_phone() -> None:
+def test_get_is_phone(create_transaction) -> None:
     """Test get_is_phone identifies phone payments."""
     transaction = create_transaction(1, "user1", "AT&T Wireless", "2024-01-01", 60.0)
     assert get_is_phone(transaction)
@@ -104,113 +119,43 @@ def test_get_is_phone() -> None:
     assert not get_is_phone(transaction)
 
 
-def test_get_n_transactions_days_apart() -> None:
+def test_get_n_transactions_days_apart(days_apart_txns) -> None:
     """Test get_n_transactions_days_apart."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="name1", amount=2.99, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="name1", amount=2.99, date="2024-01-02"),
-        Transaction(id=3, user_id="user1", name="name1", amount=2.99, date="2024-01-14"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-15"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-16"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-29"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-31"),
-    ]
-    assert get_n_transactions_days_apart(transactions[0], transactions, 14, 0) == 2
-    assert get_n_transactions_days_apart(transactions[0], transactions, 14, 1) == 4
+    assert get_n_transactions_days_apart(days_apart_txns[0], days_apart_txns, 14, 0) == 2
+    assert get_n_transactions_days_apart(days_apart_txns[0], days_apart_txns, 14, 1) == 4
 
 
-def test_get_n_transactions_same_day() -> None:
+def test_get_n_transactions_same_day(netflix_monthly) -> None:
     """Test get_n_transactions_same_day counts transactions on same day of month."""
-    transactions = [
-        create_transaction(1, "user1", "Netflix", "2024-01-01", 15.99),
-        create_transaction(2, "user1", "Netflix", "2024-02-01", 15.99),
-        create_transaction(3, "user1", "Netflix", "2024-03-03", 15.99),
-    ]
-    transaction = transactions[0]
-    assert get_n_transactions_same_day(transaction, transactions, 1) == 2
+    transaction = netflix_monthly[0]
+    assert get_n_transactions_same_day(transaction, netflix_monthly, 1) == 2
 
 
-def test_get_pct_transactions_days_apart() -> None:
+def test_get_pct_transactions_days_apart(days_apart_txns) -> None:
     """Test get_pct_transactions_days_apart."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="name1", amount=2.99, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="name1", amount=2.99, date="2024-01-02"),
-        Transaction(id=3, user_id="user1", name="name1", amount=2.99, date="2024-01-14"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-15"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-16"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-29"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-31"),
-    ]
-    assert get_pct_transactions_days_apart(transactions[0], transactions, 14, 0) == 2 / 7
-    assert get_pct_transactions_days_apart(transactions[0], transactions, 14, 1) == 4 / 7
+    assert get_pct_transactions_days_apart(days_apart_txns[0], days_apart_txns, 14, 0) == 2 / 7
+    assert get_pct_transactions_days_apart(days_apart_txns[0], days_apart_txns, 14, 1) == 4 / 7
 
 
-def test_get_is_insurance() -> None:
+def test_get_is_insurance(create_transaction) -> None:
     """Test get_is_insurance."""
-    assert get_is_insurance(
-        Transaction(id=1, user_id="user1", name="Allstate Insurance", amount=100, date="2024-01-01")
-    )
-    assert not get_is_insurance(Transaction(id=2, user_id="user1", name="AT&T", amount=100, date="2024-01-01"))
+    assert get_is_insurance(create_transaction(1, "user1", "Allstate Insurance", "2024-01-01", 100))
+    assert not get_is_insurance(create_transaction(2, "user1", "AT&T", "2024-01-01", 100))
 
 
-def test_get_pct_transactions_same_day() -> None:
+def test_get_pct_transactions_same_day(netflix_monthly) -> None:
     """Test get_pct_transactions_same_day calculates correct percentage."""
-    transactions = [
-        create_transaction(1, "user1", "Netflix", "2024-01-01", 15.99),
-        create_transaction(2, "user1", "Netflix", "2024-02-01", 15.99),
-        create_transaction(3, "user1", "Netflix", "2024-03-03", 15.99),
-    ]
-    transaction = transactions[0]
-    assert get_pct_transactions_same_day(transaction, transactions, 1) == 2 / 3
+    transaction = netflix_monthly[0]
+    assert get_pct_transactions_same_day(transaction, netflix_monthly, 1) == 2 / 3
 
 
-def test_get_ends_in_99() -> None:
+def test_get_ends_in_99(four_tx_basic) -> None:
     """Test that get_ends_in_99 returns True for amounts ending in 99."""
-    transactions = [
-        Transaction(id=1, user_id="user1", name="name1", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="name1", amount=100, date="2024-01-01"),
-        Transaction(id=3, user_id="user1", name="name1", amount=200, date="2024-01-02"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-03"),
-    ]
-    assert not get_ends_in_99(transactions[0])
-    assert get_ends_in_99(transactions[3])
+    assert not get_ends_in_99(four_tx_basic[0])
+    assert get_ends_in_99(four_tx_basic[3])
 
 
-def test_get_average_transaction_amount() -> None:
-    """Test get_average_transaction_amount calculates correct average."""
-    transactions = [
-        create_transaction(1, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(3, "user1", "name1", "2024-01-02", 200.0),
-        create_transaction(4, "user1", "name1", "2024-01-03", 2.99),
-    ]
-    # (100 + 100 + 200 + 2.99) / 4 = 100.7475 ≈ 100.75
-    assert round(get_average_transaction_amount(transactions), 2) == 100.75
-
-
-def test_get_max_transaction_amount() -> None:
-    """Test get_max_transaction_amount identifies maximum amount."""
-    transactions = [
-        create_transaction(1, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(3, "user1", "name1", "2024-01-02", 200.0),
-        create_transaction(4, "user1", "name1", "2024-01-03", 2.99),
-    ]
-    assert get_max_transaction_amount(transactions) == 200.0
-
-
-def test_get_min_transaction_amount() -> None:
-    """Test get_min_transaction_amount identifies minimum amount."""
-    transactions = [
-        create_transaction(1, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "name1", "2024-01-01", 100.0),
-        create_transaction(3, "user1", "name1", "2024-01-02", 200.0),
-        create_transaction(4, "user1", "name1", "2024-01-03", 2.99),
-    ]
-    assert get_min_transaction_amount(transactions) == 2.99
-
-
-def test_get_most_frequent_names() -> None:
+def test_get_most_frequent_names(create_transaction) -> None:
     """Test get_most_frequent_names identifies merchants with multiple amounts."""
     transactions = [
         create_transaction(1, "user1", "StoreA", "2024-01-01", 10.0),
@@ -222,7 +167,7 @@ def test_get_most_frequent_names() -> None:
     assert len(get_most_frequent_names(transactions)) == 1  # StoreA has multiple amounts
 
 
-def test_is_recurring() -> None:
+def test_is_recurring(create_transaction) -> None:
     """Test is_recurring identifies recurring transactions."""
     transactions = [
         create_transaction(1, "user1", "Netflix", "2024-01-01", 15.99),
@@ -233,7 +178,7 @@ def test_is_recurring() -> None:
     assert is_recurring(transaction, transactions)
 
 
-def test_amount_ends_in_99() -> None:
+def test_amount_ends_in_99(create_transaction) -> None:
     """Test that amount_ends_in_99 correctly identifies amounts ending with .99"""
     # Test positive case
     transaction = create_transaction(1, "user1", "Store", "2024-01-01", 9.99)
@@ -245,7 +190,7 @@ def test_amount_ends_in_99() -> None:
     assert not amount_ends_in_99(transaction), "Should not detect amount ending with .98"
 
 
-def test_amount_ends_in_00() -> None:
+def test_amount_ends_in_00(create_transaction) -> None:
     """Test amount_ends_in_00 correctly identifies .00 amounts"""
     transaction = create_transaction(1, "user1", "Store", "2024-01-01", 10.00)
     assert amount_ends_in_00(transaction)
@@ -253,7 +198,7 @@ def test_amount_ends_in_00() -> None:
     assert not amount_ends_in_00(transaction)
 
 
-def test_get_n_transactions_same_merchant_amount() -> None:
+def test_get_n_transactions_same_merchant_amount(create_transaction) -> None:
     """Test counting transactions with same merchant and amount"""
     transactions = [
         create_transaction(1, "user1", "VendorA", "2024-01-01", 100.0),
@@ -264,7 +209,7 @@ def test_get_n_transactions_same_merchant_amount() -> None:
     assert get_n_transactions_same_merchant_amount(transaction, transactions) == 2
 
 
-def test_get_percent_transactions_same_merchant_amount() -> None:
+def test_get_percent_transactions_same_merchant_amount(create_transaction) -> None:
     """Test percentage of transactions with same merchant/amount"""
     transactions = [
         create_transaction(1, "user1", "VendorA", "2024-01-01", 100.0),
@@ -275,51 +220,23 @@ def test_get_percent_transactions_same_merchant_amount() -> None:
     assert get_percent_transactions_same_merchant_amount(transaction, transactions) == 2 / 3
 
 
-def test_get_interval_variance_coefficient() -> None:
-    """Test interval consistency measurement"""
-    transactions = [
-        create_transaction(1, "user1", "VendorA", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "VendorA", "2024-01-08", 100.0),
-        create_transaction(3, "user1", "VendorA", "2024-01-15", 100.0),
-    ]
-    transaction = transactions[0]
-    assert get_interval_variance_coefficient(transaction, transactions) == 0.0  # Perfectly consistent
-
-
-def test_get_stddev_days_between_same_merchant_amount() -> None:
-    """Test standard deviation of transaction intervals"""
-    transactions = [
-        create_transaction(1, "user1", "VendorA", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "VendorA", "2024-01-08", 100.0),
-        create_transaction(3, "user1", "VendorA", "2024-01-15", 100.0),
-    ]
-    transaction = transactions[0]
-    assert get_stddev_days_between_same_merchant_amount(transaction, transactions) == 0.0
-
-
-def test_get_days_since_last_same_merchant_amount() -> None:
-    """Test days since last same merchant/amount transaction"""
-    transactions = [
-        create_transaction(1, "user1", "VendorA", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "VendorA", "2024-01-08", 100.0),
-        create_transaction(3, "user1", "VendorA", "2024-01-15", 100.0),
-    ]
-    transaction = transactions[2]
-    assert get_days_since_last_same_merchant_amount(transaction, transactions) == 7
-
-
-def test_is_expected_transaction_date() -> None:
-    """Test if transaction occurs on expected date"""
-    transactions = [
-        create_transaction(1, "user1", "VendorA", "2024-01-01", 100.0),
-        create_transaction(2, "user1", "VendorA", "2024-01-08", 100.0),
-        create_transaction(3, "user1", "VendorA", "2024-01-15", 100.0),
-    ]
-    transaction = transactions[2]
-    assert is_expected_transaction_date(transaction, transactions)
+@pytest.mark.parametrize(
+    ("index", "func", "expected"),
+    [
+        (0, get_avg_days_between_same_merchant_amount, 7.0),
+        (0, get_interval_variance_coefficient, 0.0),  # Perfectly consistent
+        (0, get_stddev_days_between_same_merchant_amount, 0.0),
+        (2, get_days_since_last_same_merchant_amount, 7),
+        (2, is_expected_transaction_date, True),
+    ],
+    ids=["avg_days", "interval_variance", "stddev_days", "days_since_last", "expected_date"],
+)
+def test_vendor_a_weekly_features(vendor_a_weekly, index, func, expected) -> None:
+    """Test the interval features over three VendorA charges exactly a week apart."""
+    assert func(vendor_a_weekly[index], vendor_a_weekly) == expected
 
 
-def test_has_incrementing_numbers() -> None:
+def test_has_incrementing_numbers(create_transaction) -> None:
     """Test detection of incrementing numbers in transaction names"""
     transactions = [
         create_transaction(1, "user1", "Payment #1001", "2024-01-01", 50.0),
@@ -342,7 +259,7 @@ def test_has_incrementing_numbers() -> None:
     )
 
 
-def test_has_consistent_reference_codes() -> None:
+def test_has_consistent_reference_codes(create_transaction) -> None:
     """Test detection of consistent reference codes"""
     transactions = [
         create_transaction(1, "user1", "Payment REF:ABC123", "2024-01-01", 50.0),
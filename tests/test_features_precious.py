@@ -15,52 +15,51 @@ from recur_scan.features_precious import (
     is_recurring_merchant,
     is_subscription_amount,
 )
-from recur_scan.transactions import Transaction
 
 # ------------------ Fixtures ------------------
 
 
-@pytest.fixture
-def sample_transactions():
+@pytest.fixture(scope="session")
+def sample_transactions(create_transaction):
     """
-    A list of transactions used for testing.
+    A tuple of transactions used for testing.
     """
-    return [
-        Transaction(id=1, user_id="user1", name="AT&T", amount=50.99, date="2023-01-01"),
-        Transaction(id=2, user_id="user1", name="Netflix", amount=12.99, date="2023-01-05"),
-        Transaction(id=3, user_id="user1", name="AT&T", amount=50.99, date="2023-01-31"),
-        Transaction(id=4, user_id="user1", name="Spotify", amount=9.99, date="2023-02-10"),
-        Transaction(id=5, user_id="user1", name="AT&T", amount=50.99, date="2023-03-02"),
-        Transaction(id=6, user_id="user1", name="Electric Co", amount=100.00, date="2023-03-15"),
-    ]
-
-
-@pytest.fixture
-def recurring_transactions():
+    return (
+        create_transaction(1, "user1", "AT&T", "2023-01-01", 50.99),
+        create_transaction(2, "user1", "Netflix", "2023-01-05", 12.99),
+        create_transaction(3, "user1", "AT&T", "2023-01-31", 50.99),
+        create_transaction(4, "user1", "Spotify", "2023-02-10", 9.99),
+        create_transaction(5, "user1", "AT&T", "2023-03-02", 50.99),
+        create_transaction(6, "user1", "Electric Co", "2023-03-15", 100.00),
+    )
+
+
+@pytest.fixture(scope="session")
+def recurring_transactions(create_transaction):
     """
     Transactions with the same merchant and amount (for AT&T) exactly 30 days apart.
     """
-    return [
-        Transaction(id=1, user_id="user1", name="AT&T", amount=50.99, date="2023-01-01"),
-        Transaction(id=2, user_id="user1", name="AT&T", amount=50.99, date="2023-01-31"),
-        Transaction(id=3, user_id="user1", name="AT&T", amount=50.99, date="2023-03-02"),
-    ]
+    return (
+        create_transaction(1, "user1", "AT&T", "2023-01-01", 50.99),
+        create_transaction(2, "user1", "AT&T", "2023-01-31", 50.99),
+        create_transaction(3, "user1", "AT&T", "2023-03-02", 50.99),
+    )
 
 
 # ------------------ Tests for Miscellaneous Functions ------------------
 
 
-def test_get_is_utility():
-    t1 = Transaction(id=6, user_id="user1", name="Duke Energy", amount=100, date="2023-02-01")
-    t2 = Transaction(id=7, user_id="user1", name="Coffee Shop", amount=5, date="2023-02-01")
+def test_get_is_utility(create_transaction):
+    t1 = create_transaction(6, "user1", "Duke Energy", "2023-02-01", 100)
+    t2 = create_transaction(7, "user1", "Coffee Shop", "2023-02-01", 5)
     assert get_is_utility(t1) is True
     assert get_is_utility(t2) is False
 
 
-def test_get_is_phone():
-    t1 = Transaction(id=8, user_id="user1", name="AT&T", amount=50.99, date="2023-03-01")
-    t2 = Transaction(id=9, user_id="user1", name="Verizon Wireless", amount=60, date="2023-03-02")
-    t3 = Transaction(id=10, user_id="user1", name="Local Cafe", amount=5, date="2023-03-03")
+def test_get_is_phone(create_transaction):
+    t1 = create_transaction(8, "user1", "AT&T", "2023-03-01", 50.99)
+    t2 = create_transaction(9, "user1", "Verizon Wireless", "2023-03-02", 60)
+    t3 = create_transaction(10, "user1", "Local Cafe", "2023-03-03", 5)
     assert get_is_phone(t1) is True
     assert get_is_phone(t2) is True
     assert get_is_phone(t3) is False
@@ -71,19 +70,19 @@ def test_get_is_phone():
 # ------------------ Tests for Amount Ending Functions ------------------
 
 
-def test_amount_ends_in_00():
-    t2 = Transaction(id=4, user_id="user1", name="Vendor", amount=15.00, date="2024-01-02")
+def test_amount_ends_in_00(create_transaction):
+    t2 = create_transaction(4, "user1", "Vendor", "2024-01-02", 15.00)
     assert amount_ends_in_00(t2) is True
 
 
 # ------------------ Tests for Amount Frequency Functions ------------------
 
 
-def test_get_n_transactions_same_merchant_amount():
-    t1 = Transaction(id=1, user_id="user1", name="AT&T", amount=50.99, date="2023-01-01")
-    t2 = Transaction(id=2, user_id="user1", name="AT&T", amount=50.99, date="2023-01-31")
-    t3 = Transaction(id=3, user_id="user1", name="AT&T", amount=50.99, date="2023-03-02")
-    t4 = Transaction(id=4, user_id="user1", name="Spotify", amount=9.99, date="2023-02-01")
+def test_get_n_transactions_same_merchant_amount(create_transaction):
+    t1 = create_transaction(1, "user1", "AT&T", "2023-01-01", 50.99)
+    t2 = create_transaction(2, "user1", "AT&T", "2023-01-31", 50.99)
+    t3 = create_transaction(3, "user1", "AT&T", "2023-03-02", 50.99)
+    t4 = create_transaction(4, "user1", "Spotify", "2023-02-01", 9.99)
     txs = [t1, t2, t3, t4]
     assert get_n_transactions_same_merchant_amount(t1, txs) == 3
     assert get_percent_transactions_same_merchant_amount(t4, txs) == 1 / 4
@@ -93,59 +92,56 @@ def test_get_n_transactions_same_merchant_amount():
 
 
 def test_get_avg_stddev_days_between_same_merchant_amount(recurring_transactions):
-    avg = get_avg_days_between_same_merchant_amount(recurring_transactions[1], recurring_transactions)
-    stddev = get_stddev_days_between_same_merchant_amount(recurring_transactions[1], recurring_transactions)
+    avg = get_avg_days_between_same_merchant_amount(recurring_transactions[1], list(recurring_transactions))
+    stddev = get_stddev_days_between_same_merchant_amount(recurring_transactions[1], list(recurring_transactions))
     assert pytest.approx(avg) == 30.0
     assert pytest.approx(stddev) == 0.0
 
 
 def test_get_days_since_last_same_merchant_amount(recurring_transactions):
-    assert get_days_since_last_same_merchant_amount(recurring_transactions[1], recurring_transactions) == 30
-    assert get_days_since_last_same_merchant_amount(recurring_transactions[2], recurring_transactions) == 30
+    assert get_days_since_last_same_merchant_amount(recurring_transactions[1], list(recurring_transactions)) == 30
+    assert get_days_since_last_same_merchant_amount(recurring_transactions[2], list(recurring_transactions)) == 30
 
 
-def test_get_recurring_frequency():
-    t1 = Transaction(id=1, user_id="user1", name="AT&T", amount=50.99, date="2023-01-01")
-    t2 = Transaction(id=2, user_id="user1", name="AT&T", amount=50.99, date="2023-01-31")
-    t3 = Transaction(id=3, user_id="user1", name="AT&T", amount=50.99, date="2023-03-02")
-    freq = get_recurring_frequency(t1, [t1, t2, t3])
+def test_get_recurring_frequency(recurring_transactions):
+    freq = get_recurring_frequency(recurring_transactions[0], list(recurring_transactions))
     assert freq == 3
 
 
 # ------------------ Tests for Miscellaneous Functions ------------------
 
 
-def test_is_subscription_amount():
-    t1 = Transaction(id=11, user_id="user1", name="Vendor", amount=9.99, date="2023-04-01")
-    t2 = Transaction(id=12, user_id="user1", name="Vendor", amount=5.00, date="2023-04-02")
+def test_is_subscription_amount(create_transaction):
+    t1 = create_transaction(11, "user1", "Vendor", "2023-04-01", 9.99)
+    t2 = create_transaction(12, "user1", "Vendor", "2023-04-02", 5.00)
     assert is_subscription_amount(t1) is True
     assert is_subscription_amount(t2) is False
 
 
-def test_get_additional_features():
-    t = Transaction(id=13, user_id="user1", name="Spotify", amount=9.99, date="2023-04-01")
+def test_get_additional_features(create_transaction):
+    t = create_transaction(13, "user1", "Spotify", "2023-04-01", 9.99)
     txs = [
         t,
-        Transaction(id=14, user_id="user1", name="Spotify", amount=9.99, date="2023-04-15"),
-        Transaction(id=15, user_id="user1", name="Spotify", amount=9.99, date="2023-05-01"),
+        create_transaction(14, "user1", "Spotify", "2023-04-15", 9.99),
+        create_transaction(15, "user1", "Spotify", "2023-05-01", 9.99),
     ]
     feats = get_additional_features(t, txs)
     for key in ["day_of_week", "day_of_month", "is_weekend", "merchant_total_count"]:
         assert key in feats
 
 
-def test_get_amount_variation_features():
+def test_get_amount_variation_features(create_transaction):
     txs = [
-        Transaction(id=16, user_id="user1", name="AT&T", amount=50.99, date="2023-01-01"),
-        Transaction(id=17, user_id="user1", name="AT&T", amount=50.99, date="2023-01-31"),
-        Transaction(id=18, user_id="user1", name="AT&T", amount=50.99, date="2023-03-02"),
+        create_transaction(16, "user1", "AT&T", "2023-01-01", 50.99),
+        create_transaction(17, "user1", "AT&T", "2023-01-31", 50.99),
+        create_transaction(18, "user1", "AT&T", "2023-03-02", 50.99),
     ]
     features = get_amount_variation_features(txs[0], txs, threshold=0.2)
     assert pytest.approx(features["merchant_avg"]) == 50.99
     assert features["relative_amount_diff"] == 0.0
     assert features["amount_anomaly"] is False
 
-    t_anomaly = Transaction(id=19, user_id="user1", name="AT&T", amount=100.0, date="2023-04-01")
+    t_anomaly = create_transaction(19, "user1", "AT&T", "2023-04-01", 100.0)
     features_anomaly = get_amount_variation_features(t_anomaly, txs, threshold=0.2)
     expected_relative = abs(100.0 - 50.99) / 50.99
     assert pytest.approx(features_anomaly["relative_amount_diff"]) == expected_relative
@@ -155,10 +151,10 @@ def test_get_amount_variation_features():
 # ------------------ Test for is_recurring_merchant ------------------
 
 
-def test_is_recurring_merchant():
+def test_is_recurring_merchant(create_transaction):
     # Test with a known recurring vendor
-    t1 = Transaction(id=100, user_id="user1", name="AT&T", amount=50.99, date="2023-01-01")
+    t1 = create_transaction(100, "user1", "AT&T", "2023-01-01", 50.99)
     # Test with a vendor that should not be recognized as recurring.
-    t2 = Transaction(id=101, user_id="user1", name="Local Cafe", amount=5.00, date="2023-01-02")
+    t2 = create_transaction(101, "user1", "Local Cafe", "2023-01-02", 5.00)
     assert is_recurring_merchant(t1) is True
     assert is_recurring_merchant(t2) is False
@@ -1,3 +1,5 @@
+import pytest
+
 from recur_scan.features_raphael import (
     get_has_irregular_spike,
     get_is_common_subscription_amount,
@@ -12,123 +14,106 @@ from recur_scan.features_raphael import (
 )
 from recur_scan.transactions import Transaction
 
-# Test data setup
-user_id = "user1"
-transactions = [
-    Transaction(id=1, user_id="user1", name="Netflix", amount=15.99, date="2024-01-01"),
-    Transaction(id=2, user_id="user1", name="Hulu", amount=12.99, date="2024-01-15"),
-    Transaction(id=3, user_id="user1", name="Spotify", amount=9.99, date="2024-02-01"),
-    Transaction(id=4, user_id="user1", name="Auto Insurance", amount=100.00, date="2024-01-10"),
-    Transaction(id=5, user_id="user1", name="T-Mobile Payment", amount=50.00, date="2024-01-20"),
-    Transaction(id=6, user_id="user1", name="Electric Utility Bill", amount=75.00, date="2024-01-25"),
-    Transaction(id=7, user_id="user1", name="Netflix", amount=15.99, date="2024-02-01"),
-    Transaction(id=8, user_id="user1", name="Netflix", amount=15.99, date="2024-03-01"),
-    Transaction(id=9, user_id="user2", name="Disney+", amount=10.99, date="2024-01-01"),
-]
-test_transaction = Transaction(id=10, user_id="user1", name="Netflix", amount=15.99, date="2024-03-01")
-
-
-def get_user_transactions(transactions: list[Transaction], user_id: str) -> list[Transaction]:
-    """Filter transactions to only include those belonging to the same user."""
-    return [t for t in transactions if t.user_id == user_id]
-
-
-def test_get_n_transactions_days_apart() -> None:
-    user_transactions = get_user_transactions(transactions, "user1")
+
+@pytest.fixture(scope="session")
+def transactions(create_transaction) -> tuple[Transaction, ...]:
+    """Subscriptions, bills and one other user's charge shared by the tests."""
+    return (
+        create_transaction(1, "user1", "Netflix", "2024-01-01", 15.99),
+        create_transaction(2, "user1", "Hulu", "2024-01-15", 12.99),
+        create_transaction(3, "user1", "Spotify", "2024-02-01", 9.99),
+        create_transaction(4, "user1", "Auto Insurance", "2024-01-10", 100.00),
+        create_transaction(5, "user1", "T-Mobile Payment", "2024-01-20", 50.00),
+        create_transaction(6, "user1", "Electric Utility Bill", "2024-01-25", 75.00),
+        create_transaction(7, "user1", "Netflix", "2024-02-01", 15.99),
+        create_transaction(8, "user1", "Netflix", "2024-03-01", 15.99),
+        create_transaction(9, "user2", "Disney+", "2024-01-01", 10.99),
+    )
+
+
+@pytest.fixture(scope="session")
+def user_transactions(transactions) -> list[Transaction]:
+    """The shared transactions filtered once to those belonging to user1."""
+    return [t for t in transactions if t.user_id == "user1"]
+
+
+@pytest.fixture(scope="session")
+def test_transaction(create_transaction) -> Transaction:
+    """A later Netflix charge checked against the shared transactions."""
+    return create_transaction(10, "user1", "Netflix", "2024-03-01", 15.99)
+
+
+def test_get_n_transactions_days_apart(user_transactions, test_transaction) -> None:
     result = get_n_transactions_days_apart(test_transaction, user_transactions, 30, 2)
     assert result == 2  # Netflix transactions are 30 days apart
 
 
-def test_get_pct_transactions_days_apart() -> None:
-    user_transactions = get_user_transactions(transactions, "user1")
+def test_get_pct_transactions_days_apart(user_transactions, test_transaction) -> None:
     pct = get_pct_transactions_days_apart(test_transaction, user_transactions, 30, 2)
     assert pct >= 0.1
 
 
-def test_get_n_transactions_same_day() -> None:
-    test_transactions = [
-        Transaction(id=1, user_id="user1", name="name1", amount=100, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="name1", amount=100, date="2024-01-01"),
-        Transaction(id=3, user_id="user1", name="name1", amount=200, date="2024-01-02"),
-        Transaction(id=4, user_id="user1", name="name1", amount=2.99, date="2024-01-03"),
-    ]
+def test_get_n_transactions_same_day(four_tx_basic) -> None:
     # Function returns count of OTHER transactions on same day
-    assert get_n_transactions_same_day(test_transactions[0], test_transactions, 0) == 1
+    assert get_n_transactions_same_day(four_tx_basic[0], four_tx_basic, 0) == 1
     # With 1-day tolerance, should catch Jan 1 and Jan 2 transactions
-    assert get_n_transactions_same_day(test_transactions[0], test_transactions, 1) == 2
+    assert get_n_transactions_same_day(four_tx_basic[0], four_tx_basic, 1) == 2
     # Only Jan 2 transaction
-    assert get_n_transactions_same_day(test_transactions[2], test_transactions, 0) == 0
+    assert get_n_transactions_same_day(four_tx_basic[2], four_tx_basic, 0) == 0
 
 
-def test_get_pct_transactions_same_day() -> None:
-    user_transactions = get_user_transactions(transactions, "user1")
+def test_get_pct_transactions_same_day(user_transactions, test_transaction) -> None:
     pct = get_pct_transactions_same_day(test_transaction, user_transactions, 0)
     assert pct >= 0.1
 
 
-def test_get_is_common_subscription_amount() -> None:
-    assert get_is_common_subscription_amount(
-        Transaction(id=20, user_id="user1", name="Hulu", amount=9.99, date="2024-01-01")
-    )
-    assert not get_is_common_subscription_amount(
-        Transaction(id=21, user_id="user1", name="Store Purchase", amount=27.5, date="2024-01-15")
-    )
+def test_get_is_common_subscription_amount(create_transaction) -> None:
+    assert get_is_common_subscription_amount(create_transaction(20, "user1", "Hulu", "2024-01-01", 9.99))
+    assert not get_is_common_subscription_amount(create_transaction(21, "user1", "Store Purchase", "2024-01-15", 27.5))
 
 
-def test_get_occurs_same_week() -> None:
-    assert get_occurs_same_week(
-        Transaction(id=22, user_id="user1", name="Netflix", amount=15.99, date="2024-03-01"), transactions
-    )
+def test_get_occurs_same_week(transactions, create_transaction) -> None:
+    assert get_occurs_same_week(create_transaction(22, "user1", "Netflix", "2024-03-01", 15.99), transactions)
     assert not get_occurs_same_week(
-        Transaction(id=23, user_id="user1", name="One-time Purchase", amount=99.99, date="2024-01-20"),
+        create_transaction(23, "user1", "One-time Purchase", "2024-01-20", 99.99),
         transactions,
     )
 
 
-def test_get_is_similar_name() -> None:
+def test_get_is_similar_name(transactions, create_transaction) -> None:
     assert get_is_similar_name(
-        Transaction(id=24, user_id="user1", name="Spotify Premium", amount=9.99, date="2024-02-01"),
+        create_transaction(24, "user1", "Spotify Premium", "2024-02-01", 9.99),
         transactions,
     )
     assert not get_is_similar_name(
-        Transaction(id=25, user_id="user1", name="Amazon Purchase", amount=50.0, date="2024-03-05"),
+        create_transaction(25, "user1", "Amazon Purchase", "2024-03-05", 50.0),
         transactions,
     )
 
 
-def test_get_is_fixed_interval() -> None:
+def test_get_is_fixed_interval(transactions, create_transaction) -> None:
     user_transactions = [
-        Transaction(id=1, user_id="user1", name="Netflix", amount=15.99, date="2024-01-01"),
-        Transaction(id=2, user_id="user1", name="Netflix", amount=15.99, date="2024-02-01"),
-        Transaction(id=3, user_id="user1", name="Netflix", amount=15.99, date="2024-03-01"),
+        create_transaction(1, "user1", "Netflix", "2024-01-01", 15.99),
+        create_transaction(2, "user1", "Netflix", "2024-02-01", 15.99),
+        create_transaction(3, "user1", "Netflix", "2024-03-01", 15.99),
     ]
-    assert get_is_fixed_interval(
-        Transaction(id=26, user_id="user1", name="Netflix", amount=15.99, date="2024-03-01"), user_transactions
-    )
-    assert not get_is_fixed_interval(
-        Transaction(id=27, user_id="user1", name="Gas Station", amount=40.0, date="2024-02-10"), transactions
-    )
+    assert get_is_fixed_interval(create_transaction(26, "user1", "Netflix", "2024-03-01", 15.99), user_transactions)
+    assert not get_is_fixed_interval(create_transaction(27, "user1", "Gas Station", "2024-02-10", 40.0), transactions)
 
 
-def test_get_has_irregular_spike() -> None:
+def test_get_has_irregular_spike(transactions, create_transaction) -> None:
     user_transactions = [
         *transactions,
-        Transaction(id=28, user_id="user1", name="Internet Bill", amount=80.0, date="2024-02-01"),
-        Transaction(id=29, user_id="user1", name="Internet Bill", amount=90.0, date="2024-01-01"),
+        create_transaction(28, "user1", "Internet Bill", "2024-02-01", 80.0),
+        create_transaction(29, "user1", "Internet Bill", "2024-01-01", 90.0),
     ]
     assert get_has_irregular_spike(
-        Transaction(id=30, user_id="user1", name="Internet Bill", amount=150.0, date="2024-03-01"),
+        create_transaction(30, "user1", "Internet Bill", "2024-03-01", 150.0),
         user_transactions,
     )
-    assert not get_has_irregular_spike(
-        Transaction(id=31, user_id="user1", name="Spotify", amount=9.99, date="2024-02-01"), transactions
-    )
+    assert not get_has_irregular_spike(create_transaction(31, "user1", "Spotify", "2024-02-01", 9.99), transactions)
 
 
-def test_get_is_first_of_month() -> None:
-    assert get_is_first_of_month(
-        Transaction(id=32, user_id="user1", name="Rent Payment", amount=1200.0, date="2024-02-01")
-    )
-    assert not get_is_first_of_month(
-        Transaction(id=33, user_id="user1", name="Grocery", amount=75.0, date="2024-02-15")
-    )
+def test_get_is_first_of_month(create_transaction) -> None:
+    assert get_is_first_of_month(create_transaction(32, "user1", "Rent Payment", "2024-02-01", 1200.0))
+    assert not get_is_first_of_month(create_transaction(33, "user1", "Grocery", "2024-02-15", 75.0))
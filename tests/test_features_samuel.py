@@ -1,6 +1,7 @@
 import pytest
 
 from recur_scan.features_samuel import (
+    build_name_amounts,
     get_amount_std_dev,
     get_is_always_recurring,
     get_is_weekend_transaction,
@@ -15,6 +16,22 @@ def test_get_is_always_recurring():
     assert get_is_always_recurring(transaction) is True
 
 
+def test_build_name_amounts():
+    transactions = [
+        Transaction(id=1, user_id="user1", name="Netflix", amount=100, date="2024-01-01"),
+        Transaction(id=2, user_id="user1", name="netflix ", amount=120, date="2024-01-08"),
+        Transaction(id=3, user_id="user1", name="Hulu", amount=10, date="2024-01-15"),
+    ]
+    name_amounts = build_name_amounts(transactions)
+    assert name_amounts.keys() == {"netflix", "hulu"}
+    assert name_amounts["netflix"].tolist() == [100.0, 120.0]
+    assert build_name_amounts([]) == {}
+    # Vendors missing from the index have no amounts
+    other = Transaction(id=4, user_id="user1", name="Spotify", amount=10, date="2024-01-15")
+    assert get_transaction_frequency(other, transactions, name_amounts) == 0
+    assert get_amount_std_dev(other, transactions, name_amounts) == 0.0
+
+
 def test_get_transaction_frequency():
     transactions = [
         Transaction(id=1, user_id="user1", name="Netflix", amount=100, date="2024-01-01"),
@@ -22,6 +39,7 @@ def test_get_transaction_frequency():
         Transaction(id=3, user_id="user1", name="Netflix", amount=100, date="2024-01-15"),
     ]
     assert get_transaction_frequency(transactions[0], transactions) == 3
+    assert get_transaction_frequency(transactions[0], transactions, build_name_amounts(transactions)) == 3
 
 
 def test_get_amount_std_dev():
@@ -31,6 +49,10 @@ def test_get_amount_std_dev():
         Transaction(id=3, user_id="user1", name="Netflix", amount=110, date="2024-01-15"),
     ]
     assert pytest.approx(get_amount_std_dev(transactions[0], transactions), 0.01) == 8.16
+    name_amounts = build_name_amounts(transactions)
+    assert get_amount_std_dev(transactions[0], transactions, name_amounts) == get_amount_std_dev(
+        transactions[0], transactions
+    )
 
 
 def test_get_median_transaction_amount():
@@ -40,6 +62,7 @@ def test_get_median_transaction_amount():
         Transaction(id=3, user_id="user1", name="Netflix", amount=100, date="2024-01-15"),
     ]
     assert get_median_transaction_amount(transactions[0], transactions) == 100
+    assert get_median_transaction_amount(transactions[0], transactions, build_name_amounts(transactions)) == 100
 
 
 def test_get_is_weekend_transaction():
@@ -2,6 +2,8 @@
 import pytest
 
 from recur_scan.features_segun import (
+    build_amount_counts,
+    build_amount_summary,
     get_average_transaction_amount,
     get_average_transaction_interval,
     get_max_transaction_amount,
@@ -19,6 +21,23 @@ from recur_scan.features_segun import (
 from recur_scan.transactions import Transaction
 
 
+def test_build_amount_summary() -> None:
+    """Test that build_amount_summary computes every amount statistic in one pass."""
+    transactions = [
+        Transaction(id=1, user_id="user1", name="name1", amount=100.0, date="2024-01-01"),
+        Transaction(id=2, user_id="user1", name="name1", amount=150.0, date="2024-01-01"),
+        Transaction(id=3, user_id="user1", name="name1", amount=200.0, date="2024-01-02"),
+    ]
+    summary = build_amount_summary(transactions)
+    assert (summary.count, summary.total, summary.mean, summary.max, summary.min) == (3, 450.0, 150.0, 200.0, 100.0)
+    assert summary.std == pytest.approx(50.0)
+    # The getters read the shared summary instead of rescanning the transactions
+    assert get_transaction_amount_range([], summary) == 100.0
+    assert get_average_transaction_amount([], summary) == 150.0
+    assert build_amount_summary(transactions[:1]).std == 0.0
+    assert build_amount_summary([]).total == 0.0
+
+
 def test_get_total_transaction_amount() -> None:
     """Test that get_total_transaction_amount returns the correct total amount."""
     transactions = [
@@ -87,6 +106,8 @@ def test_get_transaction_amount_median() -> None:
         Transaction(id=3, user_id="user1", name="name1", amount=200.0, date="2024-01-02"),
     ]
     assert get_transaction_amount_median(transactions) == 150.0
+    assert get_transaction_amount_median(transactions[:2]) == 125.0  # even count averages the middle pair
+    assert get_transaction_amount_median([]) == 0.0
 
 
 def test_get_transaction_amount_range() -> None:
@@ -119,6 +140,20 @@ def test_get_transaction_amount_frequency() -> None:
     assert get_transaction_amount_frequency(transactions[0], transactions) == 2
 
 
+def test_build_amount_counts() -> None:
+    """Test that build_amount_counts counts each amount once for the amount lookups to share."""
+    transactions = [
+        Transaction(id=1, user_id="user1", name="name1", amount=100.0, date="2024-01-01"),
+        Transaction(id=2, user_id="user1", name="name1", amount=150.0, date="2024-01-01"),
+        Transaction(id=3, user_id="user1", name="name1", amount=100.0, date="2024-01-02"),
+    ]
+    amount_counts = build_amount_counts(transactions)
+    assert amount_counts == {100.0: 2, 150.0: 1}
+    assert get_transaction_amount_frequency(transactions[1], transactions, amount_counts) == 1
+    assert get_unique_transaction_amount_count(transactions, amount_counts) == 2
+    assert get_transaction_amount_frequency(transactions[0], [], build_amount_counts([])) == 0
+
+
 def test_get_transaction_day_of_week() -> None:
     """Test that get_transaction_day_of_week returns the correct day of the week."""
     transaction = Transaction(id=1, user_id="user1", name="name1", amount=100.0, date="2024-01-01")  # Monday
@@ -129,6 +164,8 @@ def test_get_transaction_time_of_day() -> None:
     """Test that get_transaction_time_of_day returns the correct time of day."""
     transaction = Transaction(id=1, user_id="user1", name="name1", amount=100.0, date="2024-01-01 15:30:00")
     assert get_transaction_time_of_day(transaction) == 2
+    transaction = Transaction(id=2, user_id="user1", name="name1", amount=100.0, date="2024-01-01")
+    assert get_transaction_time_of_day(transaction) == -1  # no time component
 
 
 def test_get_average_transaction_interval() -> None:
@@ -139,3 +176,4 @@ def test_get_average_transaction_interval() -> None:
         Transaction(id=3, user_id="user1", name="name1", amount=100.0, date="2024-01-10"),
     ]
     assert get_average_transaction_interval(transactions) == 4.5  # (4 + 5) / 2
+    assert get_average_transaction_interval(transactions[:1]) == 0.0
@@ -4,6 +4,9 @@ import numpy as np
 import pytest
 
 from recur_scan.features_tife import (
+    build_amount_dates,
+    build_merchant_amounts,
+    build_sorted_amounts,
     get_amount_cluster_count,
     get_amount_range,
     get_amount_relative_change,
@@ -22,6 +25,7 @@ from recur_scan.features_tife import (
     get_transaction_density,
     get_transaction_frequency,
 )
+from recur_scan.table import TransactionTable
 from recur_scan.transactions import Transaction
 
 
@@ -37,6 +41,30 @@ def transactions():
     ]
 
 
+@pytest.fixture
+def transactions_tbl(transactions):
+    """Fixture providing the test transactions as a columnar TransactionTable."""
+    return TransactionTable.from_transactions(transactions)
+
+
+@pytest.fixture
+def merchant_amounts(transactions):
+    """Fixture providing the merchant amount index of the test transactions."""
+    return build_merchant_amounts(transactions)
+
+
+@pytest.fixture
+def amount_dates(transactions):
+    """Fixture providing the per-amount date index of the test transactions."""
+    return build_amount_dates(transactions)
+
+
+@pytest.fixture
+def sorted_amounts(transactions):
+    """Fixture providing the sorted amounts of the test transactions."""
+    return build_sorted_amounts(transactions)
+
+
 @pytest.fixture
 def empty_transactions():
     """Fixture providing an empty transaction list."""
@@ -92,6 +120,12 @@ def test_get_interval_mode(transactions, empty_transactions, single_transaction)
     assert get_interval_mode(transactions) == 14  # 14 appears twice
     assert get_interval_mode(empty_transactions) == 0.0
     assert get_interval_mode(single_transaction) == 0.0
+    tied = [
+        Transaction(id=1, user_id="user1", name="vendor1", amount=100.0, date="2024-01-22"),
+        Transaction(id=2, user_id="user1", name="vendor1", amount=100.0, date="2024-01-01"),
+        Transaction(id=3, user_id="user1", name="vendor1", amount=100.0, date="2024-01-08"),
+    ]
+    assert get_interval_mode(tied) == 7  # 7 and 14 tie, the shorter gap wins
 
 
 def test_get_normalized_interval_consistency(transactions, empty_transactions, single_transaction) -> None:
@@ -105,10 +139,20 @@ def test_get_normalized_interval_consistency(transactions, empty_transactions, s
     assert get_normalized_interval_consistency(single_transaction) == 0.0
 
 
-def test_get_days_since_last_same_amount(transactions) -> None:
+def test_get_days_since_last_same_amount(transactions, amount_dates) -> None:
     """Test that get_days_since_last_same_amount calculates days since the last identical amount."""
     assert get_days_since_last_same_amount(transactions[1], transactions) == 14  # 2024-01-15 - 2024-01-01
     assert get_days_since_last_same_amount(transactions[0], transactions) == -1.0  # No prior same amount
+    assert get_days_since_last_same_amount(transactions[1], transactions, amount_dates) == 14
+    assert get_days_since_last_same_amount(transactions[4], transactions, amount_dates) == 60  # 03-15 - 01-15
+    assert get_days_since_last_same_amount(transactions[0], transactions, amount_dates) == -1.0
+
+
+def test_build_amount_dates(amount_dates, empty_transactions) -> None:
+    """Test that build_amount_dates groups the date ordinals by amount in date order."""
+    assert amount_dates.keys() == {100.0, 105.0, 200.0}
+    assert (amount_dates[100.0] == [datetime(2024, m, d).toordinal() for m, d in [(1, 1), (1, 15), (3, 15)]]).all()
+    assert build_amount_dates(empty_transactions) == {}
 
 
 def test_get_amount_cluster_count(transactions, empty_transactions, single_transaction) -> None:
@@ -127,10 +171,18 @@ def test_get_amount_relative_change(transactions) -> None:
     assert get_amount_relative_change(transactions[0], transactions) == 0.0  # No prior
 
 
-def test_get_merchant_name_frequency(transactions) -> None:
+def test_get_merchant_name_frequency(transactions, merchant_amounts) -> None:
     """Test that get_merchant_name_frequency counts transactions with the same merchant."""
     assert get_merchant_name_frequency(transactions[0], transactions) == 4  # vendor1 has 4
     assert get_merchant_name_frequency(transactions[4], transactions) == 1  # vendor2 has 1
+    assert get_merchant_name_frequency(transactions[0], transactions, merchant_amounts) == 4
+
+
+def test_build_merchant_amounts(merchant_amounts, empty_transactions) -> None:
+    """Test that build_merchant_amounts groups amounts by merchant name in transaction order."""
+    assert merchant_amounts.keys() == {"vendor1", "vendor2"}
+    assert merchant_amounts["vendor1"].tolist() == [100.0, 100.0, 105.0, 200.0]
+    assert build_merchant_amounts(empty_transactions) == {}
 
 
 def test_get_interval_histogram(transactions, empty_transactions, single_transaction) -> None:
@@ -150,6 +202,7 @@ def test_get_amount_stability_score(transactions, empty_transactions) -> None:
     expected_score = sum(1 for a in amounts if abs(a - mean) <= std) / len(amounts)
     assert pytest.approx(get_amount_stability_score(transactions)) == expected_score
     assert get_amount_stability_score(empty_transactions) == 0.0
+    assert get_amount_stability_score(transactions[:2]) == 1.0  # identical amounts
 
 
 def test_get_dominant_interval_strength(transactions, empty_transactions, single_transaction) -> None:
@@ -159,19 +212,32 @@ def test_get_dominant_interval_strength(transactions, empty_transactions, single
     assert get_dominant_interval_strength(single_transaction) == 0.0
 
 
-def test_get_near_amount_consistency(transactions, empty_transactions) -> None:
+def test_get_near_amount_consistency(transactions, empty_transactions, sorted_amounts) -> None:
     """Test that get_near_amount_consistency calculates the proportion of near-amount transactions."""
     assert (
         pytest.approx(get_near_amount_consistency(transactions[0], transactions)) == 4 / 5
     )  # 100, 100, 105, 100 within 5%
     assert get_near_amount_consistency(transactions[0], empty_transactions) == 0.0
+    # Bisecting the shared sorted amounts counts the same run, including the 105 on the 5% boundary
+    assert get_near_amount_consistency(transactions[0], transactions, sorted_amounts=sorted_amounts) == 4 / 5
+    assert get_near_amount_consistency(transactions[3], transactions, 0.0, sorted_amounts) == 1 / 5
+
 
+def test_build_sorted_amounts(sorted_amounts, empty_transactions) -> None:
+    """Test that build_sorted_amounts lists the amounts in ascending order."""
+    assert sorted_amounts == [100.0, 100.0, 100.0, 105.0, 200.0]
+    assert build_sorted_amounts(empty_transactions) == []
 
-def test_get_merchant_amount_signature(transactions, empty_transactions) -> None:
+
+def test_get_merchant_amount_signature(transactions, empty_transactions, merchant_amounts) -> None:
     """Test that get_merchant_amount_signature calculates the signature for the merchant."""
     # vendor1: [100, 100, 105, 200], 3 within 5% of 100
     assert pytest.approx(get_merchant_amount_signature(transactions[0], transactions)) == 3 / 4
     assert get_merchant_amount_signature(transactions[4], transactions) == 1.0  # vendor2: [100]
+    assert (
+        pytest.approx(get_merchant_amount_signature(transactions[0], transactions, merchant_amounts=merchant_amounts))
+        == 3 / 4
+    )
     assert get_merchant_amount_signature(transactions[0], empty_transactions) == 0.0
 
 
@@ -188,3 +254,24 @@ def test_get_transaction_density(transactions, empty_transactions, single_transa
     assert pytest.approx(get_transaction_density(transactions)) == len(transactions) / time_span
     assert get_transaction_density(empty_transactions) == 0.0
     assert get_transaction_density(single_transaction) == 0.0
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        get_transaction_frequency,
+        get_interval_consistency,
+        get_amount_variability,
+        get_amount_range,
+        get_transaction_count,
+        get_interval_mode,
+        get_normalized_interval_consistency,
+        get_interval_histogram,
+        get_amount_stability_score,
+        get_dominant_interval_strength,
+        get_transaction_density,
+    ],
+)
+def test_features_accept_transaction_table(func, transactions, transactions_tbl) -> None:
+    """Test that the aggregate features give the same result on a TransactionTable as on the list."""
+    assert func(transactions_tbl) == pytest.approx(func(transactions))
@@ -11,3 +11,6 @@ def test_get_avg_days_between():
         Transaction(id=3, user_id="1", name="vendor", amount=100, date="2024-01-03"),
     ]
     assert get_avg_days_between(transactions) == 1.0
+    # Out-of-order dates average the same as sorted ones
+    assert get_avg_days_between(list(reversed(transactions))) == 1.0
+    assert get_avg_days_between(transactions[:1]) == 0.0
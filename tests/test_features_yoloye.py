@@ -3,7 +3,9 @@
 import pytest
 
 from recur_scan.features_yoloye import (
+    build_sorted_ordinals,
     get_delayed_annual,
+    get_delayed_counts,
     get_delayed_fortnightly,
     get_delayed_monthly,
     get_delayed_quarterly,
@@ -21,7 +23,7 @@ from recur_scan.features_yoloye import (
 from recur_scan.transactions import Transaction
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_transaction():
     return Transaction(
         id=0,
@@ -32,7 +34,7 @@ def sample_transaction():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def delayed_transactions():
     # Base date: 2023-01-01
     return [
@@ -87,7 +89,7 @@ def delayed_transactions():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def early_transactions():
     # Base date: 2023-01-01
     return [
@@ -162,58 +164,43 @@ def test_get_n_transactions_delayed(sample_transaction, delayed_transactions):
     assert get_n_transactions_delayed(sample_transaction, [far_future], expected_interval=30, max_delay=5) == 0
 
 
-def test_get_delayed_weekly(sample_transaction, delayed_transactions):
-    # Weekly transaction is 8 days after base (7+1), should be detected
-    result = get_delayed_weekly(sample_transaction, delayed_transactions)
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_delayed_weekly(sample_transaction, []) == 0
-
-
-def test_get_delayed_fortnightly(sample_transaction, delayed_transactions):
-    # Fortnightly transaction is 16 days after base (14+2), should be detected
-    result = get_delayed_fortnightly(sample_transaction, delayed_transactions)
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_delayed_fortnightly(sample_transaction, []) == 0
-
-
-def test_get_delayed_monthly(sample_transaction, delayed_transactions):
-    # Monthly transaction is 33 days after base (30+3), should be detected
-    result = get_delayed_monthly(sample_transaction, delayed_transactions)
-    assert result == 1
+@pytest.mark.parametrize(
+    "delayed_counter",
+    [
+        get_delayed_weekly,  # 8 days after base (7+1)
+        get_delayed_fortnightly,  # 16 days after base (14+2)
+        get_delayed_monthly,  # 33 days after base (30+3)
+        get_delayed_quarterly,  # 95 days after base (90+5)
+        get_delayed_semi_annual,  # 188 days after base (180+8)
+        get_delayed_annual,  # 375 days after base (365+10)
+    ],
+    ids=lambda counter: counter.__name__,
+)
+def test_get_delayed_periods(sample_transaction, delayed_transactions, delayed_counter):
+    # Exactly one of the delayed transactions falls in each period's window
+    assert delayed_counter(sample_transaction, delayed_transactions) == 1
 
     # Test with empty transactions list
-    assert get_delayed_monthly(sample_transaction, []) == 0
-
-
-def test_get_delayed_quarterly(sample_transaction, delayed_transactions):
-    # Quarterly transaction is 95 days after base (90+5), should be detected
-    result = get_delayed_quarterly(sample_transaction, delayed_transactions)
-    assert result == 1
+    assert delayed_counter(sample_transaction, []) == 0
+
+
+def test_get_delayed_counts(sample_transaction, delayed_transactions):
+    # One count per period, matching the get_delayed_* functions
+    counters = {
+        "weekly": get_delayed_weekly,
+        "fortnightly": get_delayed_fortnightly,
+        "monthly": get_delayed_monthly,
+        "quarterly": get_delayed_quarterly,
+        "semi_annual": get_delayed_semi_annual,
+        "annual": get_delayed_annual,
+    }
+    counts = get_delayed_counts(sample_transaction, delayed_transactions)
+    assert counts == {period: counter(sample_transaction, delayed_transactions) for period, counter in counters.items()}
+    ordinals = build_sorted_ordinals(delayed_transactions)
+    assert get_delayed_counts(sample_transaction, delayed_transactions, ordinals) == counts
 
     # Test with empty transactions list
-    assert get_delayed_quarterly(sample_transaction, []) == 0
-
-
-def test_get_delayed_semi_annual(sample_transaction, delayed_transactions):
-    # Semi-annual transaction is 188 days after base (180+8), should be detected
-    result = get_delayed_semi_annual(sample_transaction, delayed_transactions)
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_delayed_semi_annual(sample_transaction, []) == 0
-
-
-def test_get_delayed_annual(sample_transaction, delayed_transactions):
-    # Annual transaction is 375 days after base (365+10), should be detected
-    result = get_delayed_annual(sample_transaction, delayed_transactions)
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_delayed_annual(sample_transaction, []) == 0
+    assert get_delayed_counts(sample_transaction, []) == dict.fromkeys(counters, 0)
 
 
 def test_get_n_transactions_early(sample_transaction, early_transactions):
@@ -236,6 +223,22 @@ def test_get_n_transactions_early(sample_transaction, early_transactions):
     assert get_n_transactions_early(sample_transaction, [too_close], expected_interval=30, max_early=5) == 0
 
 
+def test_build_sorted_ordinals(sample_transaction, delayed_transactions, early_transactions):
+    # The shared sorted ordinals give the same counts as scanning the transactions
+    ordinals = build_sorted_ordinals(delayed_transactions)
+    assert list(ordinals) == sorted(t.date_ordinal for t in delayed_transactions)
+    for interval, max_delay in [(7, 2), (30, 5), (365, 15)]:
+        assert get_n_transactions_delayed(
+            sample_transaction, delayed_transactions, interval, max_delay, ordinals
+        ) == get_n_transactions_delayed(sample_transaction, delayed_transactions, interval, max_delay)
+    early_ordinals = build_sorted_ordinals(early_transactions)
+    assert get_n_transactions_early(sample_transaction, early_transactions, 30, 5, early_ordinals) == 1
+    assert get_early_weekly(sample_transaction, early_transactions, early_ordinals) == get_early_weekly(
+        sample_transaction, early_transactions
+    )
+    assert build_sorted_ordinals([]).size == 0
+
+
 def test_get_early_weekly(sample_transaction, early_transactions):
     # Weekly transaction is 6 days after base (7-1), should be detected
     result = get_early_weekly(sample_transaction, early_transactions)
@@ -245,117 +248,22 @@ def test_get_early_weekly(sample_transaction, early_transactions):
     assert get_early_weekly(sample_transaction, []) == 0
 
 
-def test_get_early_fortnightly(sample_transaction):
-    # Note: This function uses get_n_transactions_days_apart in the implementation
-    # which has different behavior than get_n_transactions_early
-
-    # Create a transaction that would match with get_n_transactions_days_apart
-    # For days_apart=14, days_off=3, we need a transaction that's either:
-    # - 11-14 days apart (14-3 to 14)
-    # - 14-17 days apart (14 to 14+3)
-    # - or any multiple of 14 ±3 days
-    matching_tx = Transaction(
-        id=6,
-        user_id="user",
-        date="2023-01-13",  # 12 days after base (within 14±3)
-        amount=100.0,
-        name="Test",
-    )
-
-    result = get_early_fortnightly(sample_transaction, [matching_tx])
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_early_fortnightly(sample_transaction, []) == 0
-
-
-def test_get_early_monthly(sample_transaction):
-    # Note: This function uses get_n_transactions_days_apart in the implementation
-
-    # Create a transaction that would match with get_n_transactions_days_apart
-    # For days_apart=30, days_off=5, we need a transaction that's either:
-    # - 25-30 days apart (30-5 to 30)
-    # - 30-35 days apart (30 to 30+5)
-    # - or any multiple of 30 ±5 days
-    matching_tx = Transaction(
-        id=6,
-        user_id="user",
-        date="2023-01-28",  # 27 days after base (within 30±5)
-        amount=100.0,
-        name="Test",
-    )
-
-    result = get_early_monthly(sample_transaction, [matching_tx])
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_early_monthly(sample_transaction, []) == 0
-
-
-def test_get_early_quarterly(sample_transaction):
-    # Note: This function uses get_n_transactions_days_apart in the implementation
-
-    # Create a transaction that would match with get_n_transactions_days_apart
-    # For days_apart=90, days_off=7, we need a transaction that's either:
-    # - 83-90 days apart (90-7 to 90)
-    # - 90-97 days apart (90 to 90+7)
-    # - or any multiple of 90 ±7 days
-    matching_tx = Transaction(
-        id=6,
-        user_id="user",
-        date="2023-03-28",  # 86 days after base (within 90±7)
-        amount=100.0,
-        name="Test",
-    )
-
-    result = get_early_quarterly(sample_transaction, [matching_tx])
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_early_quarterly(sample_transaction, []) == 0
-
-
-def test_get_early_semi_annual(sample_transaction):
-    # Note: This function uses get_n_transactions_days_apart in the implementation
-
-    # Create a transaction that would match with get_n_transactions_days_apart
-    # For days_apart=180, days_off=10, we need a transaction that's either:
-    # - 170-180 days apart (180-10 to 180)
-    # - 180-190 days apart (180 to 180+10)
-    # - or any multiple of 180 ±10 days
-    matching_tx = Transaction(
-        id=6,
-        user_id="user",
-        date="2023-06-25",  # 175 days after base (within 180±10)
-        amount=100.0,
-        name="Test",
-    )
-
-    result = get_early_semi_annual(sample_transaction, [matching_tx])
-    assert result == 1
-
-    # Test with empty transactions list
-    assert get_early_semi_annual(sample_transaction, []) == 0
-
-
-def test_get_early_annual(sample_transaction):
-    # Note: This function uses get_n_transactions_days_apart in the implementation
-
-    # Create a transaction that would match with get_n_transactions_days_apart
-    # For days_apart=365, days_off=15, we need a transaction that's either:
-    # - 350-365 days apart (365-15 to 365)
-    # - 365-380 days apart (365 to 365+15)
-    # - or any multiple of 365 ±15 days
-    matching_tx = Transaction(
-        id=6,
-        user_id="user",
-        date="2023-12-20",  # 353 days after base (within 365±15)
-        amount=100.0,
-        name="Test",
-    )
-
-    result = get_early_annual(sample_transaction, [matching_tx])
-    assert result == 1
+# These counters use get_n_transactions_days_apart, which matches any multiple of the
+# interval within the allowed days off, unlike get_n_transactions_early
+@pytest.mark.parametrize(
+    ("early_counter", "date"),
+    [
+        (get_early_fortnightly, "2023-01-13"),  # 12 days after base (within 14±3)
+        (get_early_monthly, "2023-01-28"),  # 27 days after base (within 30±5)
+        (get_early_quarterly, "2023-03-28"),  # 86 days after base (within 90±7)
+        (get_early_semi_annual, "2023-06-25"),  # 175 days after base (within 180±10)
+        (get_early_annual, "2023-12-20"),  # 353 days after base (within 365±15)
+    ],
+    ids=lambda param: getattr(param, "__name__", param),
+)
+def test_get_early_periods(sample_transaction, early_counter, date):
+    matching_tx = Transaction(id=6, user_id="user", date=date, amount=100.0, name="Test")
+    assert early_counter(sample_transaction, [matching_tx]) == 1
 
     # Test with empty transactions list
-    assert get_early_annual(sample_transaction, []) == 0
+    assert early_counter(sample_transaction, []) == 0
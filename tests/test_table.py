@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from recur_scan.features_laurels import (
+    _calculate_statistics,
+    identical_transaction_ratio_feature,
+    merchant_amount_std_feature,
+    rolling_amount_mean_feature,
+)
+from recur_scan.table import TransactionTable
+from recur_scan.transactions import Transaction
+
+
+@pytest.fixture
+def transactions() -> list[Transaction]:
+    return [
+        Transaction(id=1, user_id="1", name="Netflix", amount=15.99, date="2024-01-01"),
+        Transaction(id=2, user_id="1", name="Spotify", amount=9.99, date="2024-01-03"),
+        Transaction(id=3, user_id="1", name="Netflix", amount=15.99, date="2024-02-01"),
+        Transaction(id=4, user_id="2", name="Netflix", amount=15.99, date="2024-02-02"),
+        Transaction(id=5, user_id="1", name="Netflix", amount=17.99, date="2024-03-01"),
+        Transaction(id=6, user_id="1", name="Netflix", amount=17.99, date="2024-04-01"),
+    ]
+
+
+def test_from_transactions(transactions):
+    """Test that every column keeps the order and values of the transactions."""
+    table = TransactionTable.from_transactions(transactions)
+    assert len(table) == 6
+    assert table.ids.tolist() == [1, 2, 3, 4, 5, 6]
+    assert table.names[1] == "Spotify"
+    assert table.name_codes.dtype == np.int32
+    assert table.name_categories[table.name_codes[1]] == "Spotify"
+    assert table.user_ids[3] == "2"
+    assert table.amounts.dtype == np.float64
+    assert table.amounts[4] == 17.99
+    assert table.dates.dtype == np.dtype("datetime64[D]")
+    assert table.dates[0] == np.datetime64("2024-01-01")
+    assert len(TransactionTable.from_transactions([])) == 0
+
+
+def test_name_code(transactions):
+    """Test that names map to their categorical code and unknown names to -1."""
+    table = TransactionTable.from_transactions(transactions)
+    assert table.name_categories[table.name_code("Netflix")] == "Netflix"
+    assert (table.name_codes == table.name_code("Spotify")).tolist() == [False, True, False, False, False, False]
+    assert table.name_code("Hulu") == -1
+
+
+def test_merchant_mask(transactions):
+    """Test that the mask selects one user's transactions with one merchant."""
+    table = TransactionTable.from_transactions(transactions)
+    assert table.merchant_mask("1", "Netflix").tolist() == [True, False, True, False, True, True]
+    assert not table.merchant_mask("3", "Netflix").any()
+    assert not table.merchant_mask("1", "Hulu").any()
+
+
+def test_rolling_amount_mean(transactions):
+    """Test that the table matches rolling_amount_mean_feature on the merchant's transactions."""
+    table = TransactionTable.from_transactions(transactions)
+    merchant_trans = [t for t in transactions if t.user_id == "1" and t.name == "Netflix"]
+    assert table.rolling_amount_mean("1", "Netflix") == pytest.approx(rolling_amount_mean_feature(merchant_trans))
+    assert table.rolling_amount_mean("1", "Spotify") == pytest.approx(9.99)
+    assert table.rolling_amount_mean("3", "Netflix") == 0.0
+
+
+def test_identical_transaction_ratio(transactions):
+    """Test that the table matches identical_transaction_ratio_feature over all transactions."""
+    table = TransactionTable.from_transactions(transactions)
+    merchant_trans = [t for t in transactions if t.user_id == "1" and t.name == "Netflix"]
+    for transaction in transactions[:1] + transactions[4:]:
+        assert table.identical_transaction_ratio(transaction) == pytest.approx(
+            identical_transaction_ratio_feature(transaction, transactions, merchant_trans)
+        )
+    assert TransactionTable.from_transactions([]).identical_transaction_ratio(transactions[0]) == 0.0
+
+
+def test_merchant_amount_std(transactions):
+    """Test that the table matches merchant_amount_std_feature on the merchant's amount statistics."""
+    table = TransactionTable.from_transactions(transactions)
+    amount_stats = _calculate_statistics([t.amount for t in transactions if t.user_id == "1" and t.name == "Netflix"])
+    assert table.merchant_amount_std("1", "Netflix") == pytest.approx(merchant_amount_std_feature(amount_stats))
+    assert table.merchant_amount_std("1", "Spotify") == 0.0
+    assert table.merchant_amount_std("1", "Hulu") == 0.0
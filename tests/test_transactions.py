@@ -0,0 +1,27 @@
+import pickle
+from datetime import date
+
+from recur_scan.transactions import Transaction
+
+
+def test_parsed_date():
+    """Test that parsed_date returns the transaction date as a cached datetime.date."""
+    transaction = Transaction(id=1, user_id="user1", name="vendor1", date="2024-01-15", amount=10.0)
+    assert transaction.parsed_date == date(2024, 1, 15)
+    # Repeated access is served from the parse_date cache
+    assert transaction.parsed_date is transaction.parsed_date
+
+
+def test_transaction_slots():
+    """Test that Transaction uses __slots__ and stays picklable."""
+    transaction = Transaction(id=1, user_id="user1", name="vendor1", date="2024-01-15", amount=10.0)
+    assert not hasattr(transaction, "__dict__")
+    assert pickle.loads(pickle.dumps(transaction)) == transaction
+
+
+def test_date_ordinal():
+    """Test that date_ordinal matches the ordinal of the parsed date."""
+    earlier = Transaction(id=1, user_id="user1", name="vendor1", date="2024-01-15", amount=10.0)
+    later = Transaction(id=2, user_id="user1", name="vendor1", date="2024-03-01", amount=10.0)
+    assert earlier.date_ordinal == date(2024, 1, 15).toordinal()
+    assert later.date_ordinal - earlier.date_ordinal == 46
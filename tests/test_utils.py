@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 
 import pytest
 
@@ -10,9 +10,23 @@ def test_parse_date():
     # Test with valid date format
     assert parse_date("2024-01-01") == date(2024, 1, 1)
 
+    # Test with date and datetime objects, which skip the string round trip
+    assert parse_date(date(2024, 1, 1)) == date(2024, 1, 1)
+    assert parse_date(datetime(2024, 1, 1, 12, 30)) == date(2024, 1, 1)
+    assert type(parse_date(datetime(2024, 1, 1))) is date
+
+    # Test with non-padded dates, which skip the fixed-width fast path
+    assert parse_date("2024-1-5") == date(2024, 1, 5)
+
     # Test with invalid date format
     with pytest.raises(ValueError, match=r"does not match format"):
         parse_date("01/01/2024")
+    with pytest.raises(ValueError, match=r"does not match format"):
+        parse_date("2024-01-0x")
+
+    # Test with a well-formed string for a day that does not exist
+    with pytest.raises(ValueError, match=r"day is out of range"):
+        parse_date("2024-02-30")
 
 
 def test_get_day():
@@ -20,3 +34,9 @@ def test_get_day():
     assert get_day("2024-01-01") == 1
     assert get_day("2024-01-02") == 2
     assert get_day("2024-01-03") == 3
+    assert get_day("2024-1-5") == 5
+
+    # Repeated dates are answered from the cache
+    hits = get_day.cache_info().hits
+    assert get_day("2024-01-03") == 3
+    assert get_day.cache_info().hits == hits + 1